@@ -6,1479 +6,1965 @@ Handles typos, variations, and transforms entire sentences aggressively
 
 import re
 import random
-import spacy
-from typing import Dict, List, Tuple, Optional
+import logging
+import functools
+import itertools
+import sys
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Tuple, Optional, Sequence
 
-class AdvancedConeEffects:
-    def __init__(self):
-        """Initialize with spaCy model for advanced text processing"""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-            self.spacy_available = True
-        except OSError:
-            print("spaCy model not available, using basic transformations")
-            self.nlp = None
-            self.spacy_available = False
+import word_spans
+
+try:
+    import ahocorasick  # pyahocorasick: one linear scan for all literal replacement keys
+except ImportError:
+    ahocorasick = None
+
+# Shared generator so per-match and per-sentence randomness is drawn in batches
+_rng = np.random.default_rng()
+
+# Sentence bodies, already stripped of surrounding whitespace, with the punctuation
+# that ends them (slayspeak only splits on periods)
+_SENTENCE_WITH_TERM = re.compile(r'\s*([^.!?]*?)\s*([.!?]+|$)')
+_SLAYSPEAK_SENTENCE_WITH_TERM = re.compile(r'\s*([^.]*?)\s*(\.+|$)')
+_TERMINATORS = ('.', '!', '?')
+
+# A sentence's text without the surrounding whitespace or its punctuation
+_SENTENCE_BODY_RE = re.compile(r'[^.!?\s](?:[^.!?]*[^.!?\s])?')
+
+# Runs of three or more of the same character (lmaoooo, sooooo)
+_ELONGATION_RE = re.compile(r'(.)\1{2,}')
+
+# Gaps between words, where slayspeak fillers are inserted
+_WORD_GAP_RE = re.compile(r'\s+')
+
+
+# Replacement keys of the form \b(?:word|two words|can\'t|lmao+)\b can be matched as plain
+# literals; a trailing + repeats the word's last letter
+_LITERAL_KEY_RE = re.compile(r"\\b\(\?:((?:[a-z0-9 '-]|\\')+\+?(?:\|(?:[a-z0-9 '-]|\\')+\+?)*)\)\\b")
+
+
+def _compile_fused(alternatives: List[str]):
+    """Compile single-group alternatives into one pattern
+
+    Keys are all lowercase and always run against lowercased text, so no
+    case-insensitive flag (and no per-character case folding) is needed.
+    """
+    fused = '|'.join(alternatives)
+    # Stdlib re, not RE2: RE2's \b is ASCII-only and would match inside "éyes"
+    return re.compile(fused)
+
+
+class _ReplacementTable:
+    """A cone effect's replacement table, compiled once at import time
+
+    Keys are stored as parallel arrays addressed by integer key index: the fused
+    pattern's capture group N is key N - 1, options[i] holds that key's choices and
+    option_counts[i] their count. The fused pattern is only needed when the
+    automaton can't be used, so it is compiled on first use.
+    """
+
+    def __init__(self, replacements: Dict[str, Tuple[str, ...]]):
+        self.alternatives = alternatives = []
+        residual = []
+        self.residual_indexes = []
+        self.options = []
+        self.automaton = ahocorasick.Automaton() if ahocorasick is not None else None
+        for index, (pattern, options) in enumerate(replacements.items()):
+            alternatives.append(f'({pattern})')
+            self.options.append(tuple(options))
+            
+            literal_key = _LITERAL_KEY_RE.fullmatch(pattern)
+            words = literal_key.group(1).replace("\\'", "'").split('|') if literal_key else []
+            if self.automaton is not None and literal_key and not any(map(self._repeat_conflict, words)):
+                # Priority mirrors the alternation: earlier keys, then earlier words, win ties
+                for order, word in enumerate(words):
+                    stem = word.rstrip('+')
+                    if stem not in self.automaton:
+                        self.automaton.add_word(stem, ((index, order), index, len(stem), stem != word))
+            else:
+                residual.append(f'({pattern})')
+                self.residual_indexes.append(index)
+        self.option_counts = np.fromiter((len(options) for options in self.options), dtype=np.int64)
+        
+        if self.automaton is not None and len(self.automaton):
+            self.automaton.make_automaton()
+            self.residual = _compile_fused(residual) if residual else None
+            # Every match starts with one of these, so text without any of them can't match
+            self.first_letters = None if residual else frozenset(word[0] for word in self.automaton.keys())
+        else:
+            self.automaton = None
+
+    @functools.cached_property
+    def pattern(self):
+        """Full alternation over lowercased text, used when pyahocorasick isn't installed"""
+        return _compile_fused(self.alternatives)
+
+    def _repeat_conflict(self, word: str) -> bool:
+        """Whether word's stem is already in the automaton with the other repeat flag
+
+        Such a key can't share the stem's entry, so it stays with the regex.
+        """
+        stem = word.rstrip('+')
+        return stem in self.automaton and self.automaton.get(stem)[3] != (stem != word)
+
+    def _spans(self, text: str) -> List[Tuple[int, int, int]]:
+        """Non-overlapping (start, end, key index) spans, leftmost first"""
+        # Match against the lowercased text and splice into the original, so case
+        # is preserved outside the replaced words
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # U+0130 (İ) is the only character whose lowercase is two code points; fold it
+            # to a plain i, as re.IGNORECASE would, so offsets line up with the original
+            lowered = text.replace('\u0130', 'i').lower()
+        if self.automaton is None:
+            return [(match.start(), match.end(), match.lastindex - 1) for match in self.pattern.finditer(lowered)]
+        if self.first_letters is not None and self.first_letters.isdisjoint(lowered):
+            return []
+        
+        candidates = []
+        append = candidates.append
+        padded = word_spans.pad(text)
+        for end, (priority, index, length, repeats) in self.automaton.iter(lowered):
+            end += 1
+            if repeats:
+                # Keys like lmao+ are stored as their stem; take the whole run of the last letter
+                last_letter = lowered[end - 1]
+                while lowered[end:end + 1] == last_letter:
+                    end += 1
+                    length += 1
+            if word_spans.is_whole_word(padded, end - length, end):
+                append((end - length, priority, end, index))
+        if self.residual is not None:
+            residual_indexes = self.residual_indexes
+            for match in self.residual.finditer(lowered):
+                index = residual_indexes[match.lastindex - 1]
+                candidates.append((match.start(), (index, 0), match.end(), index))
+        return word_spans.leftmost_spans(candidates)
+
+    def apply(self, text: str) -> str:
+        """Replace every match in a single pass with a random pick from the matching key's options"""
+        spans = self._spans(text)
+        if not spans:
+            return text
+        # One vectorized draw picks an option for every match; scaling a uniform
+        # float by the option count keeps every option equally likely (no modulo bias)
+        indexes = [index for _, _, index in spans]
+        picks = (_rng.random(len(spans)) * self.option_counts[indexes]).astype(np.int64).tolist()
+        options = self.options
+        parts = []
+        last = 0
+        for (start, end, index), pick in zip(spans, picks):
+            parts.append(text[last:start])
+            parts.append(options[index][pick])
+            last = end
+        parts.append(text[last:])
+        return ''.join(parts)
+
+    def sub(self, text: str, replace: Callable[[str, int, float], str]) -> str:
+        """Replace every match in a single pass with replace(matched text, key index, roll)
+
+        Each match gets its own uniform roll in [0, 1), all drawn in one batch.
+        """
+        spans = self._spans(text)
+        if not spans:
+            return text
+        parts = []
+        last = 0
+        for (start, end, index), roll in zip(spans, _rng.random(len(spans)).tolist()):
+            parts.append(text[last:start])
+            parts.append(replace(text[start:end], index, roll))
+            last = end
+        parts.append(text[last:])
+        return ''.join(parts)
+
+
+# Massive vocabulary replacement (handles typos/variations)
+_SLAYSPEAK_REPLACEMENTS = {
+    # Basic responses (with variations)
+    r'\b(?:yes|yeah|yep|yup|ya|ye)\b': ('yasss', 'totally', 'absolutely', 'for sure'),
+    r'\b(?:no|nah|nope)\b': ('no way', 'absolutely not', 'not even', 'hard no'),
+    r'\b(?:ok|okay|alright|aight)\b': ('like, okay', 'sure thing', 'gotcha', 'bet'),
     
-    def normalize_word(self, word: str) -> str:
-        """Normalize word variations (lmaoooo -> lmao, sooooo -> so)"""
-        # Remove excessive repeated characters (keep max 2)
-        normalized = re.sub(r'(.)\1{2,}', r'\1\1', word.lower())
-        return normalized
+    # Intensifiers and adjectives  
+    r'\b(?:very|really|super|so)\b': ('literally', 'like SO', 'totally', 'absolutely'),
+    r'\b(?:good|great|nice|cool|awesome|amazing)\b': ('iconic', 'absolutely iconic', 'such a vibe', 'literally perfect', 'so aesthetic'),
+    r'\b(?:bad|terrible|awful|sucks|horrible)\b': ('tragic', 'literally tragic', 'not it', 'absolutely not the vibe', 'so chaotic'),
+    r'\b(?:weird|strange|odd|sus)\b': ('sus', 'giving weird vibes', 'not normal', 'kind of sus'),
+    r'\b(?:pretty|quite|kinda|sorta)\b': ('lowkey', 'like', 'literally'),
     
-    def apply_slayspeak(self, text: str) -> str:
-        """Valley girl/slayspeak transformation - AGGRESSIVE"""
-        
-        # Massive vocabulary replacement (handles typos/variations)
-        replacements = {
-            # Basic responses (with variations)
-            r'\b(yes|yeah|yep|yup|ya|ye)\b': ['yasss', 'totally', 'absolutely', 'for sure'],
-            r'\b(no|nah|nope)\b': ['no way', 'absolutely not', 'not even', 'hard no'],
-            r'\b(ok|okay|alright|aight)\b': ['like, okay', 'sure thing', 'gotcha', 'bet'],
-            
-            # Intensifiers and adjectives  
-            r'\b(very|really|super|so)\b': ['literally', 'like SO', 'totally', 'absolutely'],
-            r'\b(good|great|nice|cool|awesome|amazing)\b': ['iconic', 'absolutely iconic', 'such a vibe', 'literally perfect', 'so aesthetic'],
-            r'\b(bad|terrible|awful|sucks|horrible)\b': ['tragic', 'literally tragic', 'not it', 'absolutely not the vibe', 'so chaotic'],
-            r'\b(weird|strange|odd|sus)\b': ['sus', 'giving weird vibes', 'not normal', 'kind of sus'],
-            r'\b(pretty|quite|kinda|sorta)\b': ['lowkey', 'like', 'literally'],
-            
-            # Actions and verbs
-            r'\b(said|told|spoke)\b': ['was like', 'literally said', 'was all'],
-            r'\b(went|walked|left)\b': ['literally went', 'like went', 'totally left'],
-            r'\b(did|made|created)\b': ['literally did', 'totally made', 'like created'],
-            r'\b(saw|looked|watched)\b': ['literally saw', 'was watching', 'totally saw'],
-            r'\b(think|believe|feel)\b': ['like think', 'totally feel', 'literally believe'],
-            
-            # Emotions and reactions
-            r'\b(happy|excited|glad)\b': ['living for this', 'absolutely living', 'so happy'],
-            r'\b(sad|upset|mad|angry)\b': ['literally crying', 'so upset', 'absolutely devastated'],
-            r'\b(confused|lost|unsure)\b': ['so confused', 'literally lost', 'absolutely clueless'],
-            r'\b(tired|exhausted|sleepy)\b': ['literally dying', 'so tired', 'absolutely exhausted'],
-            
-            # People and relationships
-            r'\b(person|people|guy|girl|dude)\b': ['bestie', 'babe', 'hun', 'literally everyone'],
-            r'\b(friend|buddy|pal)\b': ['bestie', 'babe', 'literally my person'],
-            r'\b(boyfriend|girlfriend)\b': ['mans', 'my person', 'literally my everything'],
-            
-            # Time and frequency
-            r'\b(always|constantly|forever)\b': ['literally always', 'like constantly', 'absolutely always'],
-            r'\b(never|rarely|sometimes)\b': ['literally never', 'like never', 'sometimes but like rarely'],
-            r'\b(now|currently|today)\b': ['right now', 'literally right now', 'like today'],
-            
-            # Objects and things
-            r'\b(thing|stuff|item)\b': ['literally everything', 'like the whole thing', 'absolutely everything'],
-            r'\b(house|home|place)\b': ['literally home', 'like my place', 'the house'],
-            r'\b(car|vehicle)\b': ['literally my car', 'the car', 'my ride'],
-            
-            # Intensifying common words
-            r'\b(love|like|enjoy)\b': ['literally obsessed with', 'absolutely love', 'living for'],
-            r'\b(hate|dislike)\b': ['literally cannot', 'absolutely hate', 'not living for'],
-            r'\b(want|need|desire)\b': ['literally need', 'absolutely want', 'desperately need'],
-            
-            # Texting/internet slang normalization then slay-ification
-            r'\b(lmao+|lol+|haha+)\b': ['literally dying', 'absolutely deceased', 'cannot even'],
-            r'\b(omg+|oh my god+)\b': ['literally omg', 'absolutely cannot', 'I cannot even'],
-            r'\b(wtf+|what the fuck+)\b': ['literally what', 'absolutely not', 'I cannot'],
-        }
-        
-        result = text
-        
-        # Apply replacements
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add valley girl fillers strategically
-        fillers = ['like', 'literally', 'totally', 'absolutely']
-        sentences = result.split('.')
-        transformed_sentences = []
-        
-        for sentence in sentences:
-            if sentence.strip():
-                # Add uptalk (question marks to statements)
-                if not sentence.strip().endswith('?') and random.random() < 0.3:
-                    sentence += '?'
-                
-                # Insert fillers
-                words = sentence.split()
-                if len(words) > 2:
-                    # Add filler at random position
-                    if random.random() < 0.6:
-                        pos = random.randint(1, len(words) - 1)
-                        words.insert(pos, random.choice(fillers))
-                
-                transformed_sentences.append(' '.join(words))
-        
-        result = '. '.join(transformed_sentences)
-        
-        # Add ending phrases
-        endings = ['periodt', 'omygawwwd', 'no cap', 'literally', 'absolutely']
-        if random.random() < 0.4:
-            result += f' {random.choice(endings)}'
-        
-        return result
+    # Actions and verbs
+    r'\b(?:said|told|spoke)\b': ('was like', 'literally said', 'was all'),
+    r'\b(?:went|walked|left)\b': ('literally went', 'like went', 'totally left'),
+    r'\b(?:did|made|created)\b': ('literally did', 'totally made', 'like created'),
+    r'\b(?:saw|looked|watched)\b': ('literally saw', 'was watching', 'totally saw'),
+    r'\b(?:think|believe|feel)\b': ('like think', 'totally feel', 'literally believe'),
+    
+    # Emotions and reactions
+    r'\b(?:happy|excited|glad)\b': ('living for this', 'absolutely living', 'so happy'),
+    r'\b(?:sad|upset|mad|angry)\b': ('literally crying', 'so upset', 'absolutely devastated'),
+    r'\b(?:confused|lost|unsure)\b': ('so confused', 'literally lost', 'absolutely clueless'),
+    r'\b(?:tired|exhausted|sleepy)\b': ('literally dying', 'so tired', 'absolutely exhausted'),
+    
+    # People and relationships
+    r'\b(?:person|people|guy|girl|dude)\b': ('bestie', 'babe', 'hun', 'literally everyone'),
+    r'\b(?:friend|buddy|pal)\b': ('bestie', 'babe', 'literally my person'),
+    r'\b(?:boyfriend|girlfriend)\b': ('mans', 'my person', 'literally my everything'),
+    
+    # Time and frequency
+    r'\b(?:always|constantly|forever)\b': ('literally always', 'like constantly', 'absolutely always'),
+    r'\b(?:never|rarely|sometimes)\b': ('literally never', 'like never', 'sometimes but like rarely'),
+    r'\b(?:now|currently|today)\b': ('right now', 'literally right now', 'like today'),
+    
+    # Objects and things
+    r'\b(?:thing|stuff|item)\b': ('literally everything', 'like the whole thing', 'absolutely everything'),
+    r'\b(?:house|home|place)\b': ('literally home', 'like my place', 'the house'),
+    r'\b(?:car|vehicle)\b': ('literally my car', 'the car', 'my ride'),
+    
+    # Intensifying common words
+    r'\b(?:love|like|enjoy)\b': ('literally obsessed with', 'absolutely love', 'living for'),
+    r'\b(?:hate|dislike)\b': ('literally cannot', 'absolutely hate', 'not living for'),
+    r'\b(?:want|need|desire)\b': ('literally need', 'absolutely want', 'desperately need'),
+    
+    # Texting/internet slang normalization then slay-ification
+    r'\b(?:lmao+|lol+|haha+)\b': ('literally dying', 'absolutely deceased', 'cannot even'),
+    r'\b(?:omg+|oh my god+)\b': ('literally omg', 'absolutely cannot', 'I cannot even'),
+    r'\b(?:wtf+|what the fuck+)\b': ('literally what', 'absolutely not', 'I cannot'),
+}
+_SLAYSPEAK_TABLE = _ReplacementTable(_SLAYSPEAK_REPLACEMENTS)
+
+
+# Massive Gen-Z vocabulary (actual current slang)
+_BRAINROT_REPLACEMENTS = {
+    # Truth/agreement markers
+    r'\b(?:really|seriously|actually|truly)\b': ('no cap', 'fr fr', 'on god', 'deadass', 'facts'),
+    r'\b(?:yes|yeah|true|right|correct)\b': ('based', 'valid', 'facts', 'periodt', 'slay'),
+    r'\b(?:no|wrong|false|nah)\b': ('cap', 'L take', 'ratio', 'cringe', 'not it'),
+    
+    # Quality descriptors
+    r'\b(?:good|great|amazing|awesome|cool)\b': ('slaps', 'hits different', 'bussin', 'fire', 'goated', 'sends me'),
+    r'\b(?:bad|terrible|awful|horrible|sucks)\b': ('mid', 'trash', 'cringe', 'L', 'ratio worthy', 'not it'),
+    r'\b(?:weird|strange|odd|funny)\b': ('sus', 'sending me', 'unhinged', 'chaotic', 'built different'),
+    r'\b(?:boring|dull|lame)\b': ('dry', 'mid', 'NPC behavior', 'no rizz', 'ratio'),
+    
+    # Actions and behaviors
+    r'\b(?:lying|fibbing|deceiving)\b': ('capping', 'straight capping', 'no cap that\'s cap'),
+    r'\b(?:showing off|bragging|flexing)\b': ('flexing', 'showing out', 'doing the most'),
+    r'\b(?:embarrassing|cringe|awkward)\b': ('cringe', 'secondhand embarrassment', 'giving me the ick'),
+    r'\b(?:trying hard|attempting|working)\b': ('doing the most', 'giving main character energy'),
+    r'\b(?:ignoring|avoiding|dismissing)\b': ('leaving on read', 'ghosting', 'giving cold shoulder'),
+    
+    # Emotions and states
+    r'\b(?:excited|hyped|pumped)\b': ('hyped', 'absolutely sending me', 'living for this'),
+    r'\b(?:sad|depressed|down)\b': ('in my feels', 'down bad', 'not vibing'),
+    r'\b(?:angry|mad|furious)\b': ('pressed', 'big mad', 'seeing red'),
+    r'\b(?:confused|lost|puzzled)\b': ('??? moment', 'not computing', 'brain.exe stopped'),
+    r'\b(?:tired|exhausted|sleepy)\b': ('dead', 'absolutely deceased', 'running on fumes'),
+    
+    # People and relationships
+    r'\b(?:attractive|hot|cute|pretty)\b': ('absolutely goated', 'serving looks', 'main character energy'),
+    r'\b(?:boyfriend|girlfriend|partner)\b': ('mans', 'my person', 'literally my Roman Empire'),
+    r'\b(?:friend|buddy|bestie)\b': ('bestie', 'my person', 'literally family'),
+    r'\b(?:person|people|someone)\b': ('this person', 'bestie', 'main character'),
+    
+    # Internet/phone behavior
+    r'\b(?:texting|messaging|calling)\b': ('sliding into DMs', 'hitting up', 'dropping texts'),
+    r'\b(?:posting|sharing|uploading)\b': ('dropping content', 'serving looks', 'posting for the timeline'),
+    r'\b(?:scrolling|browsing|looking)\b': ('doom scrolling', 'living on the timeline', 'chronically online'),
+    
+    # Intensifiers
+    r'\b(?:very|really|super|extremely)\b': ('absolutely', 'lowkey', 'highkey', 'literally'),
+    r'\b(?:totally|completely|absolutely)\b': ('deadass', 'no cap', 'absolutely'),
+    
+    # Common expressions
+    r'\b(?:whatever|anyways|okay)\b': ('anyways chile', 'periodt', 'and what about it'),
+    r'\b(?:understand|get it|comprehend)\b': ('it\'s giving', 'I see the vision', 'absolutely vibing with'),
+    
+    # Texting variations (handle elongated versions)
+    r'\b(?:lmao+|lol+|haha+)\b': ('SENDING ME', 'absolutely deceased', 'can\'t even', 'I\'m gone'),
+    r'\b(?:omg+|oh my god+)\b': ('NOT THE', 'absolutely not', 'I cannot even', 'bestie what'),
+    r'\b(?:wtf+|what the f+)\b': ('bestie what', 'absolutely not', 'this ain\'t it'),
+}
+_BRAINROT_TABLE = _ReplacementTable(_BRAINROT_REPLACEMENTS)
+
+
+# Inspired by Anthony Sistilli's content - pure agile buzzword hell
+_SCRUM_REPLACEMENTS = {
+    # Basic actions -> corporate agile speak
+    r'\b(?:do|doing|make|making|work|working)\b': (
+        'deliver value', 'execute against', 'operationalize', 'action this',
+        'move the needle on', 'drive outcomes for', 'iterate on'
+    ),
+    r'\b(?:fix|fixing|solve|solving)\b': (
+        'remediate', 'optimize', 'address the pain points of', 'unblock',
+        'course-correct', 'pivot on', 'right-size'
+    ),
+    r'\b(?:plan|planning|organize)\b': (
+        'roadmap', 'strategize around', 'align on', 'socialize the approach for',
+        'get alignment on', 'create visibility into'
+    ),
+    r'\b(?:talk|talking|discuss|discussing)\b': (
+        'circle back on', 'sync on', 'align on', 'socialize',
+        'workshop together', 'ideate around', 'jam on'
+    ),
+    r'\b(?:meet|meeting)\b': (
+        'sync', 'standup', 'retrospective', 'planning session',
+        'alignment meeting', 'working session', 'ceremony'
+    ),
+    
+    # Time and urgency
+    r'\b(?:now|today|immediately|soon)\b': (
+        'this sprint', 'in the current iteration', 'this cycle',
+        'within the sprint boundary', 'in this timebox'
+    ),
+    r'\b(?:later|eventually|someday)\b': (
+        'future iteration', 'next sprint', 'in the backlog',
+        'post-MVP', 'in a future release', 'parking lot item'
+    ),
+    r'\b(?:quick|quickly|fast|urgent)\b': (
+        'time-boxed', 'sprint-scoped', 'MVP approach',
+        'lean and mean', 'agile delivery', 'iterative approach'
+    ),
+    r'\b(?:deadline|due date)\b': (
+        'sprint commitment', 'milestone', 'delivery target',
+        'sprint goal', 'iteration boundary'
+    ),
+    
+    # People and roles
+    r'\b(?:person|people|someone|team|group)\b': (
+        'stakeholder', 'team member', 'scrum team', 'squad',
+        'delivery team', 'cross-functional team'
+    ),
+    r'\b(?:boss|manager|leader)\b': (
+        'product owner', 'scrum master', 'delivery lead',
+        'squad lead', 'chapter lead'
+    ),
+    r'\b(?:user|customer|client)\b': (
+        'end user', 'stakeholder', 'persona', 'user segment',
+        'customer journey touchpoint'
+    ),
+    
+    # Work and tasks
+    r'\b(?:task|job|work|thing)\b': (
+        'user story', 'epic', 'deliverable', 'backlog item',
+        'sprint commitment', 'acceptance criteria'
+    ),
+    r'\b(?:goal|target|objective)\b': (
+        'sprint goal', 'OKR', 'success metric', 'KPI',
+        'outcome', 'business value'
+    ),
+    r'\b(?:problem|issue|bug)\b': (
+        'pain point', 'blocker', 'impediment', 'technical debt',
+        'risk', 'dependency'
+    ),
+    
+    # Quality and improvement
+    r'\b(?:good|great|perfect|excellent)\b': (
+        'value-driving', 'optimized', 'right-sized', 'scalable',
+        'maintainable', 'sustainable'
+    ),
+    r'\b(?:bad|wrong|terrible)\b': (
+        'sub-optimal', 'technical debt', 'anti-pattern',
+        'blockers', 'impediments to velocity'
+    ),
+    r'\b(?:better|improve|upgrade|enhance)\b': (
+        'optimize', 'right-size', 'scale up', 'mature',
+        'uplevel', 'enhance velocity'
+    ),
+    
+    # Communication and process
+    r'\b(?:tell|inform|update|report)\b': (
+        'socialize', 'provide visibility into', 'communicate out',
+        'cascade the message', 'align stakeholders on'
+    ),
+    r'\b(?:learn|understand|know)\b': (
+        'gain insights into', 'develop domain expertise in',
+        'build knowledge capital around'
+    ),
+    r'\b(?:decide|choose|pick)\b': (
+        'align on', 'prioritize', 'roadmap', 'sequence',
+        'make data-driven decisions about'
+    ),
+    
+    # Regular chat words -> corporate speak
+    r'\b(?:yes|yeah|ok|okay|sure)\b': (
+        'absolutely, let\'s action that', 'that aligns with our objectives',
+        'that\'s value-driving', 'let\'s move forward on that'
+    ),
+    r'\b(?:no|nope|can\'t)\b': (
+        'that\'s not in scope for this sprint', 'let\'s parking lot that',
+        'that\'s a dependency we need to unblock first'
+    ),
+    r'\b(?:maybe|possibly|perhaps)\b': (
+        'let\'s validate that assumption', 'we should spike on that',
+        'that needs to be socialized with stakeholders'
+    ),
+    
+    # Common casual expressions
+    r'\b(?:going|going to)\b': ('delivering on', 'executing against', 'operationalizing'),
+    r'\b(?:have|has|had)\b': ('own', 'maintain accountability for', 'drive'),
+    r'\b(?:get|getting)\b': ('secure', 'obtain buy-in for', 'action'),
+    r'\b(?:put|putting)\b': ('position', 'align', 'operationalize'),
+}
+_SCRUM_TABLE = _ReplacementTable(_SCRUM_REPLACEMENTS)
+
+
+# Exaggerated LinkedIn humble-bragging and AI-generated soulless content
+_LINKEDIN_REPLACEMENTS = {
+    # Achievement humble-bragging
+    r'\b(?:did|made|created|built|finished)\b': (
+        'I\'m humbled to share that I delivered 💼',
+        'Thrilled to announce that I spearheaded 🚀',
+        'Excited to share that I pioneered 💡',
+        'Proud to have architected ⚡',
+        'Grateful for the opportunity to execute 🎯'
+    ),
+    r'\b(?:learned|discovered|found out)\b': (
+        'gained invaluable insights into 💡',
+        'had the privilege of discovering 🔍',
+        'was fortunate enough to uncover 💎',
+        'had the honor of learning about 📚',
+        'was blessed to gain expertise in 🧠'
+    ),
+    r'\b(?:succeeded|won|achieved)\b': (
+        'exceeded expectations by delivering 📈',
+        'I\'m humbled to share we achieved 🏆',
+        'thrilled to announce we surpassed 🎉',
+        'grateful to have accomplished 💯',
+        'honored to have driven 🚀'
+    ),
+    
+    # Emotional amplification
+    r'\b(?:happy|glad|pleased)\b': (
+        'absolutely thrilled 😊', 'incredibly grateful 🙏',
+        'beyond excited 🎉', 'deeply honored 💫',
+        'tremendously blessed ✨'
+    ),
+    r'\b(?:proud|satisfied|content)\b': (
+        'immensely proud 💪', 'deeply humbled 🙏',
+        'incredibly fulfilled 💯', 'profoundly grateful 🌟',
+        'tremendously honored 👑'
+    ),
+    r'\b(?:excited|enthusiastic|eager)\b': (
+        'absolutely energized ⚡', 'incredibly passionate 🔥',
+        'deeply inspired 💫', 'tremendously motivated 🚀',
+        'profoundly excited 🎯'
+    ),
+    
+    # Work and collaboration
+    r'\b(?:worked|collaborated|partnered)\b': (
+        'had the privilege of collaborating 🤝',
+        'was honored to partner 💼',
+        'had the opportunity to work alongside 👥',
+        'was blessed to team up 🌟',
+        'got to co-create magic ✨'
+    ),
+    r'\b(?:team|group|colleagues)\b': (
+        'incredible dream team 👥', 'amazing squad 🌟',
+        'phenomenal collective 💫', 'outstanding crew ⚡',
+        'inspiring group of changemakers 🚀'
+    ),
+    r'\b(?:helped|assisted|supported)\b': (
+        'had the honor of empowering 💪',
+        'was privileged to enable 🔧',
+        'got to uplift and support 🙌',
+        'had the chance to champion 🏆',
+        'was able to guide and mentor 📈'
+    ),
+    
+    # Business and innovation
+    r'\b(?:innovative|creative|new|unique)\b': (
+        'groundbreaking 🚀', 'revolutionary 💡',
+        'game-changing ⚡', 'disruptive 💥',
+        'paradigm-shifting 🌟'
+    ),
+    r'\b(?:solution|answer|fix)\b': (
+        'breakthrough solution 💡', 'innovative approach 🚀',
+        'transformative strategy ⚡', 'revolutionary framework 🎯',
+        'cutting-edge methodology 💫'
+    ),
+    r'\b(?:growth|progress|improvement)\b': (
+        'exponential growth 📈', 'transformational progress 🚀',
+        'unprecedented improvement 💯', 'remarkable evolution ⚡',
+        'phenomenal advancement 🌟'
+    ),
+    
+    # Networking and connections
+    r'\b(?:people|person|everyone)\b': (
+        'amazing connections 🤝', 'inspiring individuals 🌟',
+        'phenomenal human beings 💫', 'incredible thought leaders 🧠',
+        'outstanding professionals 👔'
+    ),
+    r'\b(?:met|connected|networked)\b': (
+        'had the privilege of connecting 🤝',
+        'was honored to network 💼',
+        'got to build meaningful relationships 🌟',
+        'had amazing conversations 💬',
+        'forged incredible partnerships ✨'
+    ),
+    
+    # Time and opportunity
+    r'\b(?:opportunity|chance|experience)\b': (
+        'incredible opportunity 🌟', 'life-changing experience 💫',
+        'transformational journey 🚀', 'amazing privilege 🙏',
+        'phenomenal adventure ⚡'
+    ),
+    r'\b(?:journey|path|career)\b': (
+        'incredible journey 🌟', 'transformational path 🚀',
+        'amazing adventure 💫', 'phenomenal voyage ⚡',
+        'inspiring odyssey 🎯'
+    ),
+    
+    # Gratitude and humility (fake)
+    r'\b(?:thank|thanks|grateful)\b': (
+        'incredibly grateful 🙏', 'deeply thankful 💫',
+        'immensely appreciative 🌟', 'profoundly blessed ✨',
+        'tremendously honored 👑'
+    ),
+    
+    # Regular expressions -> LinkedIn speak
+    r'\b(?:good|great|nice|cool)\b': (
+        'absolutely phenomenal 🌟', 'incredibly inspiring 💫',
+        'tremendously impactful 🚀', 'deeply meaningful ⚡',
+        'profoundly transformative 💡'
+    ),
+    r'\b(?:yes|yeah|agreed|true)\b': (
+        'Absolutely agree! 💯', 'This resonates deeply! 🎯',
+        'So much truth here! ✨', 'Couldn\'t agree more! 🙌',
+        'This hits different! 🚀'
+    ),
+}
+_LINKEDIN_TABLE = _ReplacementTable(_LINKEDIN_REPLACEMENTS)
+
+
+# Advanced existential vocabulary
+_CRISIS_REPLACEMENTS = {
+    # Time becomes existentially loaded
+    r'\b(?:now|today|currently|present)\b': (
+        'in this fleeting moment of existence',
+        'during this brief respite from the void',
+        'in this temporary illusion of now',
+        'while consciousness persists',
+        'in this meaningless instant'
+    ),
+    r'\b(?:future|tomorrow|later|eventually)\b': (
+        'the inevitable march toward oblivion',
+        'the uncertain void that awaits',
+        'the meaningless tomorrow',
+        'our inevitable dissolution',
+        'the approaching heat death'
+    ),
+    r'\b(?:past|before|previously|earlier)\b': (
+        'those equally meaningless moments',
+        'the illusion of a meaningful past',
+        'our manufactured memories',
+        'the arbitrary sequence of events',
+        'those fleeting neurochemical patterns'
+    ),
+    
+    # Emotions become existentially questioning
+    r'\b(?:happy|joy|excited|glad|pleased)\b': (
+        'temporarily distracted from the void',
+        'experiencing fleeting neurochemical pleasure',
+        'momentarily forgetting our cosmic insignificance',
+        'chemically induced contentment',
+        'brief respite from existential dread'
+    ),
+    r'\b(?:sad|depressed|upset|unhappy)\b': (
+        'confronting the fundamental emptiness',
+        'experiencing appropriate cosmic despair',
+        'recognizing our meaningless existence',
+        'feeling the weight of inevitable entropy',
+        'acknowledging universal suffering'
+    ),
+    r'\b(?:love|care|affection)\b': (
+        'evolutionary manipulation disguised as meaning',
+        'biochemical processes we call connection',
+        'desperate attempts to feel less alone in the universe',
+        'temporary bonding before mutual annihilation',
+        'chemical reactions masquerading as purpose'
+    ),
+    
+    # Actions become meaningless
+    r'\b(?:do|doing|make|work|create)\b': (
+        'engage in ultimately meaningless tasks',
+        'perform arbitrary actions to avoid confronting the void',
+        'participate in the illusion of purpose',
+        'distract ourselves from our impending doom',
+        'pretend our actions have cosmic significance'
+    ),
+    r'\b(?:achieve|accomplish|succeed|win)\b': (
+        'temporarily convince ourselves we matter',
+        'participate in society\'s collective delusion',
+        'reach arbitrary milestones before death',
+        'achieve meaningless victories in a pointless game',
+        'accumulate hollow achievements before the void'
+    ),
+    r'\b(?:try|attempt|effort|strive)\b': (
+        'desperately cling to the illusion of control',
+        'struggle against inevitable entropy',
+        'persist despite cosmic meaninglessness',
+        'fight the unwinnable battle against time',
+        'attempt to matter in an indifferent universe'
+    ),
+    
+    # Life and existence
+    r'\b(?:life|living|alive|existence)\b': (
+        'this brief flicker of consciousness',
+        'our temporary arrangement of atoms',
+        'the cosmic joke of self-aware matter',
+        'this fleeting dance of particles',
+        'our meaningless biological processes'
+    ),
+    r'\b(?:purpose|meaning|reason|point)\b': (
+        'the desperate search for non-existent meaning',
+        'our manufactured sense of purpose',
+        'the comforting lie of significance',
+        'humanity\'s collective delusion',
+        'the void we try to fill with false meaning'
+    ),
+    r'\b(?:important|significant|matters|valuable)\b': (
+        'temporarily significant in our tiny perspective',
+        'meaningful only to our deluded consciousness',
+        'important in the context of our cosmic insignificance',
+        'arbitrarily valued by pattern-seeking minds',
+        'significant only until heat death'
+    ),
+    
+    # People and relationships
+    r'\b(?:people|person|human|everyone)\b': (
+        'fellow passengers on spaceship Earth',
+        'other temporary arrangements of consciousness',
+        'co-conspirators in the meaning-making delusion',
+        'fellow victims of cosmic indifference',
+        'other atoms temporarily pretending to be important'
+    ),
+    r'\b(?:friend|family|relationship)\b': (
+        'temporary alliances against the void',
+        'shared delusions of connection',
+        'mutual distractions from existential truth',
+        'biochemical bonding experiments',
+        'fellow travelers toward mutual oblivion'
+    ),
+    
+    # Regular words get existential treatment
+    r'\b(?:good|great|awesome|amazing)\b': (
+        'temporarily pleasant in this meaningless existence',
+        'chemically satisfying despite cosmic irrelevance',
+        'subjectively positive in our brief flicker',
+        'arbitrarily categorized as beneficial',
+        'momentarily distracting from the void'
+    ),
+    r'\b(?:bad|terrible|awful|horrible)\b': (
+        'appropriately reflecting reality\'s indifference',
+        'honestly representing cosmic meaninglessness',
+        'accurately depicting our doomed existence',
+        'truthfully showing life\'s fundamental suffering',
+        'correctly displaying universal entropy'
+    ),
+    
+    # Certainty becomes doubt
+    r'\b(?:know|certain|sure|definitely|obvious)\b': (
+        'think we know (but what do we really know?)',
+        'assume in our limited perception',
+        'believe based on incomplete information',
+        'pretend certainty exists in chaos',
+        'convince ourselves despite universal uncertainty'
+    )
+}
+_CRISIS_TABLE = _ReplacementTable(_CRISIS_REPLACEMENTS)
+
+
+# Extensive Canadian vocabulary and politeness patterns
+_CANADIAN_REPLACEMENTS = {
+    # Basic courtesy amplification
+    r'\b(?:please|plz)\b': (
+        'if you wouldn\'t mind terribly',
+        'if it\'s not too much trouble',
+        'when you get a chance, eh',
+        'if you could possibly',
+        'sorry to bother you, but could you'
+    ),
+    r'\b(?:thanks|thank you|thx)\b': (
+        'thank you so much, eh',
+        'thanks a bunch, bud',
+        'much appreciated, friend',
+        'thanks kindly',
+        'sorry, and thank you'
+    ),
+    r'\b(?:yes|yeah|yep|sure)\b': (
+        'absolutely, eh',
+        'you betcha',
+        'for sure, bud',
+        'definitely, friend',
+        'oh, absolutely'
+    ),
+    r'\b(?:no|nope|nah)\b': (
+        'sorry, I\'m afraid not',
+        'oh gosh, no sorry',
+        'sorry about that, but no',
+        'afraid I can\'t, eh',
+        'sorry, but that\'s not gonna work'
+    ),
+    
+    # Requests become extremely polite
+    r'\b(?:can you|could you|would you)\b': (
+        'would you mind terribly if',
+        'sorry to bother you, but could you possibly',
+        'if it\'s not too much trouble, could you',
+        'hate to be a bother, but would you mind',
+        'sorry for asking, but could you maybe'
+    ),
+    r'\b(?:give me|get me|bring me)\b': (
+        'sorry, could I possibly trouble you for',
+        'if you wouldn\'t mind, could I have',
+        'hate to bother you, but could I get',
+        'sorry to ask, but might I have',
+        'if it\'s not too much trouble, could you bring'
+    ),
+    r'\b(?:do this|do that|help)\b': (
+        'lend a hand with this, eh',
+        'help out with this if you don\'t mind',
+        'give me a hand with this, bud',
+        'help a fella out',
+        'sorry to ask, but could you help'
+    ),
+    
+    # Emotions with Canadian flavor
+    r'\b(?:angry|mad|pissed|annoyed)\b': (
+        'a bit frustrated, sorry',
+        'slightly perturbed, eh',
+        'not too happy about this, bud',
+        'a little steamed, sorry to say',
+        'somewhat bothered, I\'m afraid'
+    ),
+    r'\b(?:excited|happy|thrilled)\b': (
+        'pretty darn excited, eh',
+        'happier than a kid with a Timbit',
+        'pleased as punch, bud',
+        'tickled pink about this',
+        'over the moon, eh'
+    ),
+    r'\b(?:confused|lost|unsure)\b': (
+        'a bit turned around, eh',
+        'feeling a little lost, sorry',
+        'not quite sure what\'s what',
+        'scratching my head about this one',
+        'a bit puzzled, I\'m afraid'
+    ),
+    
+    # Actions with Canadian politeness
+    r'\b(?:said|told|mentioned)\b': (
+        'mentioned politely',
+        'brought up gently',
+        'suggested respectfully',
+        'shared with respect',
+        'mentioned, if I may'
+    ),
+    r'\b(?:disagreed|argued|fought)\b': (
+        'respectfully disagreed',
+        'politely suggested otherwise',
+        'had a different perspective, eh',
+        'respectfully begged to differ',
+        'sorry, but had to disagree'
+    ),
+    r'\b(?:left|went|departed)\b': (
+        'headed out, eh',
+        'took off, bud',
+        'made my way out',
+        'scooted along',
+        'moseyed on out'
+    ),
+    
+    # Food and drinks (Canadian references)
+    r'\b(?:coffee|drink|beverage)\b': (
+        'double-double',
+        'Tim\'s coffee',
+        'cup of joe, eh',
+        'coffee from Timmies',
+        'brew, bud'
+    ),
+    r'\b(?:food|meal|snack)\b': (
+        'grub, eh',
+        'some good eats',
+        'tucker, bud',
+        'chow',
+        'nosh'
+    ),
+    r'\b(?:beer|alcohol)\b': (
+        'cold one, eh',
+        'brewski, bud',
+        'beer, eh',
+        'cold brew',
+        'pint, friend'
+    ),
+    
+    # Weather (mandatory Canadian conversation)
+    r'\b(?:weather|temperature|climate)\b': (
+        'weather (beautiful day, eh?)',
+        'temperature (bit nippy today)',
+        'weather (sure is something out there)',
+        'climate (crazy weather we\'re having)',
+        'weather (hot enough for ya?)'
+    ),
+    
+    # Places and locations
+    r'\b(?:home|house|place)\b': (
+        'place, eh',
+        'home and native land',
+        'humble abode',
+        'little place',
+        'neck of the woods'
+    ),
+    r'\b(?:store|shop|mall)\b': (
+        'shop, eh',
+        'the store, bud',
+        'Canadian Tire',
+        'local shop',
+        'place to pick things up'
+    ),
+    
+    # Canadian slang integration
+    r'\b(?:bathroom|restroom|toilet)\b': (
+        'washroom, eh',
+        'loo, bud',
+        'little boys\'/girls\' room',
+        'facilities',
+        'washroom'
+    ),
+    r'\b(?:soda|pop|soft drink)\b': (
+        'pop, eh',
+        'soft drink, bud',
+        'fizzy drink',
+        'pop',
+        'soda pop'
+    ),
+    r'\b(?:money|cash|dollars)\b': (
+        'loonies and toonies',
+        'Canadian dollars, eh',
+        'cash, bud',
+        'money, friend',
+        'dough, eh'
+    ),
+    
+    # Intensifiers become Canadian
+    r'\b(?:very|really|super|extremely)\b': (
+        'pretty darn',
+        'real, real',
+        'mighty',
+        'pretty',
+        'awful (as in awfully good)'
+    ),
+    r'\b(?:totally|completely|absolutely)\b': (
+        'you betcha',
+        'absolutely, eh',
+        'for sure, bud',
+        'without a doubt',
+        'completely, friend'
+    )
+}
+_CANADIAN_TABLE = _ReplacementTable(_CANADIAN_REPLACEMENTS)
+
+
+# VSauce-style questioning and conspiracy thinking
+_VSAUCE_REPLACEMENTS = {
+    # Certainty becomes questioning
+    r'\b(?:is|are|was|were)\b': (
+        'appears to be', 'seems to be', 'is allegedly', 'is supposedly',
+        'is what they want you to believe', 'might be', 'could possibly be'
+    ),
+    r'\b(?:happened|occurred|took place)\b': (
+        'allegedly happened', 'supposedly occurred', 'is said to have happened',
+        'happened (or did it?)', 'occurred according to official sources',
+        'took place in what we call reality'
+    ),
+    r'\b(?:true|real|actual|factual)\b': (
+        'what they want you to believe is true',
+        'supposedly real', 'allegedly factual',
+        'true according to mainstream sources',
+        'real in our perceived reality'
+    ),
+    r'\b(?:know|knew|understand|realize)\b': (
+        'think we know', 'are told to believe',
+        'supposedly understand', 'are led to believe',
+        'think we realize', 'assume we know'
+    ),
+    
+    # Simple statements become questions
+    r'\b(?:because|since|due to)\b': (
+        'but WHY exactly?', 'but what if', 'but here\'s the thing',
+        'but wait, what if', 'but consider this', 'but think about it'
+    ),
+    r'\b(?:normal|usual|typical|standard)\b': (
+        'what society calls normal', 'supposedly normal',
+        'normal according to who?', 'normal (but what IS normal?)',
+        'typical in our constructed reality'
+    ),
+    r'\b(?:everyone|people|society)\b': (
+        'what we call society', 'the masses',
+        'people (or ARE they?)', 'everyone who\'s paying attention',
+        'society as we know it'
+    ),
+    
+    # Facts become suspicious
+    r'\b(?:fact|evidence|proof|data)\b': (
+        'supposed fact', 'what they call evidence',
+        'so-called proof', 'data (from questionable sources)',
+        'facts according to official sources'
+    ),
+    r'\b(?:study|research|science|expert)\b': (
+        'study (funded by whom?)', 'research (with questionable motives)',
+        'science (controlled by institutions)', 'expert (according to who?)'
+    ),
+    r'\b(?:government|official|authority)\b': (
+        'government (with hidden agendas)', 'official sources (wink wink)',
+        'authorities (who benefit from this)', 'establishment figures'
+    ),
+    
+    # Time becomes questionable
+    r'\b(?:always|never|forever)\b': (
+        'always (or so they say)', 'never according to official records',
+        'forever in this reality', 'always in what we call time'
+    ),
+    r'\b(?:history|past|before)\b': (
+        'official history', 'what they teach us about the past',
+        'recorded history (by the winners)', 'the past as we\'re told it happened'
+    ),
+    r'\b(?:future|will|going to)\b': (
+        'future (if there is one)', 'will supposedly',
+        'future according to their plans', 'going to (in theory)'
+    ),
+    
+    # Actions become suspicious
+    r'\b(?:told|said|claimed|stated)\b': (
+        'allegedly told', 'claimed (without proof)',
+        'stated according to official sources', 'said (but can we trust it?)'
+    ),
+    r'\b(?:found|discovered|revealed)\b': (
+        'supposedly found', 'discovered (or planted?)',
+        'revealed by questionable sources', 'found (how convenient)'
+    ),
+    r'\b(?:decided|chose|selected)\b': (
+        'decided for us', 'chose for their own benefit',
+        'selected by unknown forces', 'decided by powers that be'
+    ),
+    
+    # Common words get VSauce treatment
+    r'\b(?:good|bad|right|wrong)\b': (
+        'good (according to whose standards?)', 'bad (or exactly as planned?)',
+        'right (in whose opinion?)', 'wrong (or perfectly calculated?)'
+    ),
+    r'\b(?:random|coincidence|accident)\b': (
+        'random (nothing is random)', 'coincidence (there are no coincidences)',
+        'accident (or was it?)', 'supposedly random'
+    ),
+    
+    # Questions amplification
+    r'\b(?:what|how|why|when|where|who)\b': (
+        'but WHAT really', 'but HOW exactly', 'but WHY though',
+        'but WHEN exactly', 'but WHERE specifically', 'but WHO benefits'
+    )
+}
+_VSAUCE_TABLE = _ReplacementTable(_VSAUCE_REPLACEMENTS)
+
+
+# Massive British slang, insults, and dialect changes
+_BRITISH_REPLACEMENTS = {
+    # Basic greetings and responses
+    r'\b(?:hello|hi|hey)\b': (
+        'alright mate', 'morning', 'alright there', 'wotcher',
+        'watcha', 'oi oi', 'right then'
+    ),
+    r'\b(?:yes|yeah|yep)\b': (
+        'yeah mate', 'right', 'innit', 'too right',
+        'bloody right', 'course', 'aye'
+    ),
+    r'\b(?:no|nope|nah)\b': (
+        'nah mate', 'bollocks', 'not a chance', 'piss off',
+        'do one', 'naff off', 'sod off'
+    ),
+    r'\b(?:ok|okay|alright)\b': (
+        'right then', 'fair enough', 'sound', 'cushty',
+        'bob\'s your uncle', 'sorted'
+    ),
+    
+    # Intensifiers become British
+    r'\b(?:very|really|super|extremely)\b': (
+        'bloody', 'proper', 'dead', 'well', 'right',
+        'absolutely', 'blimey', 'crikey'
+    ),
+    r'\b(?:totally|completely|absolutely)\b': (
+        'proper', 'dead', 'absolutely', 'well',
+        'bloody hell', 'stone me'
+    ),
+    
+    # Quality descriptors
+    r'\b(?:good|great|awesome|amazing|cool)\b': (
+        'brilliant', 'ace', 'smashing', 'top notch', 'bang on',
+        'spot on', 'the dog\'s bollocks', 'proper good', 'mint',
+        'tidy', 'cushty', 'sound as a pound'
+    ),
+    r'\b(?:bad|terrible|awful|horrible|sucks)\b': (
+        'rubbish', 'pants', 'naff', 'grim', 'rank',
+        'manky', 'minging', 'proper shit', 'absolute bollocks',
+        'dire', 'utter toss', 'complete codswallop'
+    ),
+    r'\b(?:weird|strange|odd|crazy)\b': (
+        'mental', 'barmy', 'daft', 'bonkers', 'crackers',
+        'potty', 'round the bend', 'off their rocker',
+        'few sandwiches short of a picnic'
+    ),
+    r'\b(?:stupid|dumb|idiotic)\b': (
+        'thick', 'dim', 'dense', 'thick as two short planks',
+        'not the sharpest tool in the shed', 'few cards short of a deck',
+        'thick as mince', 'daft as a brush'
+    ),
+    
+    # Actions and verbs
+    r'\b(?:going|walking|leaving)\b': (
+        'popping round', 'legging it', 'scarping', 'sodding off',
+        'buggering off', 'making tracks', 'doing a runner'
+    ),
+    r'\b(?:looking|watching|seeing)\b': (
+        'having a butcher\'s', 'taking a gander', 'having a look-see',
+        'having a dekko', 'eyeballing', 'clocking'
+    ),
+    r'\b(?:talking|speaking|chatting)\b': (
+        'having a chinwag', 'nattering', 'rabbiting on',
+        'wittering', 'gassing', 'having a natter'
+    ),
+    r'\b(?:eating|having food)\b': (
+        'having a scoff', 'tucking in', 'getting some grub',
+        'having a bite', 'scoffing', 'munching'
+    ),
+    r'\b(?:drinking|having a drink)\b': (
+        'having a bevvy', 'sinking a pint', 'having a tipple',
+        'getting pissed', 'having a swift one'
+    ),
+    r'\b(?:sleeping|tired|exhausted)\b': (
+        'knackered', 'shattered', 'cream crackered', 'done in',
+        'jiggered', 'zonked', 'ready for kip'
+    ),
+    
+    # Emotions
+    r'\b(?:angry|mad|pissed off)\b': (
+        'fuming', 'livid', 'seeing red', 'cheesed off',
+        'brassed off', 'narked', 'proper wound up'
+    ),
+    r'\b(?:happy|excited|pleased)\b': (
+        'chuffed', 'made up', 'over the moon', 'pleased as punch',
+        'tickled pink', 'buzzing', 'dead chuffed'
+    ),
+    r'\b(?:confused|lost|puzzled)\b': (
+        'all at sea', 'haven\'t got a clue', 'in a right state',
+        'all over the shop', 'not with it'
+    ),
+    r'\b(?:drunk|wasted|hammered)\b': (
+        'pissed', 'bladdered', 'legless', 'steaming',
+        'trollied', 'plastered', 'off their tits'
+    ),
+    
+    # Food and drink
+    r'\b(?:food|meal|dinner)\b': (
+        'grub', 'scoff', 'tucker', 'nosh', 'tea'
+    ),
+    r'\b(?:breakfast|lunch|dinner)\b': (
+        'brekkie', 'elevenses', 'tea', 'supper'
+    ),
+    r'\b(?:sandwich|sub)\b': (
+        'sarnie', 'butty', 'roll'
+    ),
+    r'\b(?:soda|pop|soft drink)\b': (
+        'fizzy drink', 'pop', 'soft drink'
+    ),
+    r'\b(?:french fries|fries)\b': (
+        'chips', 'chippy chips'
+    ),
+    r'\b(?:candy|sweets)\b': (
+        'sweets', 'sweeties'
+    ),
+    
+    # People and insults
+    r'\b(?:person|guy|dude|man)\b': (
+        'bloke', 'geezer', 'fella', 'mate', 'lad'
+    ),
+    r'\b(?:woman|girl|lady)\b': (
+        'bird', 'lass', 'love', 'darling', 'sweetheart'
+    ),
+    r'\b(?:friend|buddy|pal)\b': (
+        'mate', 'bruv', 'geezer', 'mucka', 'old bean'
+    ),
+    r'\b(?:idiot|moron|fool)\b': (
+        'numpty', 'muppet', 'plonker', 'div', 'melt',
+        'bellend', 'knobhead', 'tosser', 'wanker', 'prat'
+    ),
+    
+    # Places
+    r'\b(?:bathroom|restroom|toilet)\b': (
+        'loo', 'bog', 'khazi', 'dunny', 'lavvy'
+    ),
+    r'\b(?:house|home)\b': (
+        'gaff', 'pad', 'place', 'drum'
+    ),
+    r'\b(?:store|shop)\b': (
+        'shop', 'chippy', 'offie', 'corner shop'
+    ),
+    r'\b(?:car|vehicle)\b': (
+        'motor', 'motor car', 'wheels', 'jam jar'
+    ),
+    
+    # Money and value
+    r'\b(?:money|cash|dollars)\b': (
+        'dosh', 'brass', 'dough', 'readies', 'shrapnel',
+        'wonga', 'lolly'
+    ),
+    r'\b(?:expensive|costly)\b': (
+        'dear', 'steep', 'bit pricey', 'costs a bomb'
+    ),
+    r'\b(?:cheap|inexpensive)\b': (
+        'cheap as chips', 'bargain', 'dead cheap'
+    ),
+    
+    # Time expressions
+    r'\b(?:soon|quickly|fast)\b': (
+        'in a jiffy', 'quick as you like', 'double quick',
+        'in two shakes', 'before you can say Jack Robinson'
+    ),
+    r'\b(?:never|not at all)\b': (
+        'not on your nelly', 'when pigs fly', 'not bloody likely'
+    )
+}
+_BRITISH_TABLE = _ReplacementTable(_BRITISH_REPLACEMENTS)
+
+
+def _each_sentence(text: str, mutator, splitter: re.Pattern = _SENTENCE_WITH_TERM, rolls: int = 1) -> str:
+    """Rewrite each sentence with mutator(body, terminator, *rolls), keeping the original punctuation"""
+    sentences = splitter.findall(text)
+    draws = _rng.random((len(sentences), rolls)).tolist()
+    out = []
+    for (body, term), draw in zip(sentences, draws):
+        if not body:
+            out.append(term)
+            continue
+        if out:
+            out.append(' ')
+        out.append(mutator(body, term, *draw))
+    return ''.join(out)
+
+
+def _max_sentences(text: str) -> int:
+    """Upper bound on the sentences in text, for sizing batched per-sentence draws"""
+    return text.count('.') + text.count('!') + text.count('?') + 1
+
+
+def _maybe_pick(phrases: Sequence[str], probability: float) -> Optional[str]:
+    """A random phrase with the given probability, else None, from a single draw
+
+    A roll below the probability is uniform on [0, probability), so it also picks the phrase.
+    """
+    roll = random.random()
+    if roll < probability:
+        return phrases[int(roll / probability * len(phrases))]
+    return None
+
+
+# Only messages up to this length are memoized; longer ones get a fresh variation every time
+_CACHE_MAX_TEXT_LENGTH = 60
+
+
+def _run_cached(effect, text: str) -> str:
+    """Run a memoized effect, bypassing its cache for long messages"""
+    if len(text) > _CACHE_MAX_TEXT_LENGTH:
+        return effect.__wrapped__(text)
+    return effect(text)
+
+
+def _interned(*phrases: str) -> Tuple[str, ...]:
+    """Immutable, interned phrase table shared by every call"""
+    return tuple(sys.intern(phrase) for phrase in phrases)
+
+
+_SLAYSPEAK_FILLERS = _interned('like', 'literally', 'totally', 'absolutely')
+_SLAYSPEAK_ENDINGS = _interned('periodt', 'omygawwwd', 'no cap', 'literally', 'absolutely')
+
+
+def _slayspeak_sentence(sentence: str, term: str, uptalk_roll: float, filler_roll: float) -> str:
+    # Add uptalk (question marks to statements)
+    if not sentence.endswith('?') and uptalk_roll < 0.3:
+        sentence += '?'
+
+    # Insert a filler into one of the gaps between words (needs three or more words)
+    if filler_roll < 0.6:
+        gaps = [match.start() for match in _WORD_GAP_RE.finditer(sentence)]
+        if len(gaps) > 1:
+            # filler_roll is uniform below 0.6, so it doubles as the gap pick
+            gap = gaps[int(filler_roll / 0.6 * len(gaps))]
+            sentence = f'{sentence[:gap]} {random.choice(_SLAYSPEAK_FILLERS)}{sentence[gap:]}'
+
+    return sentence + term
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_slayspeak(text: str) -> str:
+    """Valley girl/slayspeak transformation - AGGRESSIVE"""
+
+    # Apply replacements
+    result = _SLAYSPEAK_TABLE.apply(text)
+
+    # Add valley girl fillers strategically
+    parts = [_each_sentence(result, _slayspeak_sentence, _SLAYSPEAK_SENTENCE_WITH_TERM, rolls=2)]
+
+    # Add ending phrases
+    ending = _maybe_pick(_SLAYSPEAK_ENDINGS, 0.4)
+    if ending:
+        parts += (' ', ending)
+
+    return ''.join(parts)
+
+
+_BRAINROT_INTERJECTIONS = _interned(
+    'periodt', 'no cap', 'fr fr', 'deadass', 'on god', 'facts', 'slay',
+    'bestie', 'not me', 'the way', 'I cannot', 'sending me', 'absolutely not',
+    'this is it', 'main character moment', 'it\'s giving', 'serves'
+)
+_BRAINROT_ENDINGS = _interned('periodt', 'and that\'s on periodt', 'no cap', 'slay', 'absolutely sending me')
+
+
+def _brainrot_sentence(sentence: str, term: str, start_roll: float, end_roll: float) -> str:
+    # Random chance to add interjection at start
+    if start_roll < 0.3:
+        sentence = f"{random.choice(_BRAINROT_INTERJECTIONS)} {sentence}"
+
+    # Random chance to add at end
+    if end_roll < 0.4:
+        sentence = f"{sentence} {random.choice(_BRAINROT_INTERJECTIONS)}"
+
+    return sentence + term
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_brainrot(text: str) -> str:
+    """Gen-Z brainrot transformation - MAXIMUM BRAIN ROT"""
+
+    # Apply replacements with random selection
+    result = _BRAINROT_TABLE.apply(text)
+
+    # Split into sentences and add random brainrot interjections
+    parts = [_each_sentence(result, _brainrot_sentence, rolls=2)]
+
+    # Final brainrot touches
+    ending = _maybe_pick(_BRAINROT_ENDINGS, 0.5)
+    if ending:
+        parts += (' ', ending)
+
+    return ''.join(parts)
+
+
+_SCRUM_INTERJECTIONS = _interned(
+    'from a delivery perspective', 'thinking about this strategically',
+    'to align on this', 'from a velocity standpoint', 'looking at our OKRs',
+    'considering our sprint goals', 'from a stakeholder perspective',
+    'thinking about our MVP', 'from a roadmap perspective',
+    'considering our technical debt', 'looking at our capacity',
+    'from a cross-functional lens', 'thinking about scalability'
+)
+_SCRUM_ENDINGS = _interned(
+    'Let\'s circle back on this offline',
+    'I\'ll action this and provide visibility',
+    'Let\'s align stakeholders on this',
+    'This drives significant business value',
+    'Let\'s iterate on this in our next sprint',
+    'We should socialize this with the broader team'
+)
+
+
+def _scrum_sentence(sentence: str, term: str, roll: float) -> str:
+    # Add corporate interjection
+    if roll < 0.4:
+        sentence = f"{random.choice(_SCRUM_INTERJECTIONS)}, {sentence}"
+    return sentence + term
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_scrum(text: str) -> str:
+    """Agile scrum master jargon transformation - MAXIMUM CORPORATE AGILE BS"""
+
+    # Apply replacements
+    result = _SCRUM_TABLE.apply(text)
+
+    # Add random corporate agile interjections to sentences
+    result = _each_sentence(result, _scrum_sentence)
+    parts = [result]
+
+    # Add corporate endings
+    ending = _maybe_pick(_SCRUM_ENDINGS, 0.6)
+    if ending:
+        parts += (' ' if result.endswith(_TERMINATORS) else '. ', ending)
+
+    return ''.join(parts)
+
+
+_LINKEDIN_INTROS = _interned(
+    'I\'m thrilled to share that',
+    'Excited to announce that',
+    'Grateful to share that',
+    'Humbled to report that',
+    'Honored to share that',
+    'Blessed to announce that'
+)
+_LINKEDIN_CONNECTORS = _interned(
+    'Building on this momentum 🚀',
+    'Looking forward to what\'s next 💫',
+    'Excited for the journey ahead ⚡',
+    'Grateful for these opportunities 🙏',
+    'Inspired by what\'s possible 💡'
+)
+_LINKEDIN_ENGAGEMENT_HOOKS = _interned(
+    'Thoughts? 💭', 'What\'s your experience? 🤔',
+    'Would love to hear your perspective! 💬',
+    'How has this impacted your journey? 🚀',
+    'What are your thoughts on this? 💡',
+    'Anyone else experiencing this? 🙋‍♂️'
+)
+_LINKEDIN_HASHTAGS = _interned(
+    '#Leadership #Growth #Innovation',
+    '#Inspiration #Success #Mindset',
+    '#Networking #Professional #Career',
+    '#Grateful #Blessed #Opportunity',
+    '#Teamwork #Collaboration #Excellence'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_linkedin(text: str) -> str:
+    """LinkedIn influencer transformation - MAXIMUM CRINGE PROFESSIONAL"""
+
+    # Apply replacements
+    result = _LINKEDIN_TABLE.apply(text).strip()
+
+    # Add intro to first sentence
+    if result and random.random() < 0.5:
+        result = f"{random.choice(_LINKEDIN_INTROS)} {result}"
+
+    parts = [result]
+
+    # Add connector and engagement hook
+    connector = _maybe_pick(_LINKEDIN_CONNECTORS, 0.6)
+    if connector:
+        parts += (' ' if result.endswith(_TERMINATORS) else '. ', connector)
+
+    hook = _maybe_pick(_LINKEDIN_ENGAGEMENT_HOOKS, 0.7)
+    if hook:
+        parts += (' ', hook)
+
+    # Add hashtag explosion
+    hashtags = _maybe_pick(_LINKEDIN_HASHTAGS, 0.5)
+    if hashtags:
+        parts += ('\n\n', hashtags)
+
+    return ''.join(parts)
+
+
+_CRISIS_QUESTIONS = _interned(
+    'But what does any of this really mean?',
+    'Does any of this matter in the grand scheme?',
+    'Are we just avoiding the inevitable truth?',
+    'What\'s the point in a universe that doesn\'t care?',
+    'Why do we pretend our actions have meaning?',
+    'Is this just elaborate procrastination before death?',
+    'Are we simply animals creating stories to cope?'
+)
+_CRISIS_ENDINGS = _interned(
+    'In the end, we\'re all just stardust pretending to matter.',
+    'The universe doesn\'t care about our tiny human concerns.',
+    'We\'re all just waiting for the heat death anyway.',
+    'Nothing we do will matter in a billion years.',
+    'The void is patient, but it\'s always watching.',
+    'Consciousness is just the universe questioning itself.'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_crisis(text: str) -> str:
+    """Existential crisis transformation - MAXIMUM EXISTENTIAL DREAD"""
+
+    # Apply replacements
+    parts = [_CRISIS_TABLE.apply(text)]
+
+    # Insert existential doubt
+    question = _maybe_pick(_CRISIS_QUESTIONS, 0.6)
+    if question:
+        parts += (' ', question)
+
+    # Add philosophical endings
+    ending = _maybe_pick(_CRISIS_ENDINGS, 0.4)
+    if ending:
+        parts += (' ', ending)
+
+    return ''.join(parts)
+
+
+# Random apologies (very Canadian) and "eh"/"bud" sentence tags
+_CANADIAN_APOLOGIES = _interned('sorry about that', 'my apologies, eh', 'sorry, bud', 'pardon me', 'sorry there, friend')
+_CANADIAN_ADDITIONS = _interned('eh', 'bud', 'friend', 'there', 'eh bud')
+
+
+def _canadian_sentence(rolls, match: re.Match) -> str:
+    apology_roll, addition_roll, apology_pick, addition_pick = next(rolls)
+    sentence = match.group()
+    # Random apology at start
+    if apology_roll < 0.3:
+        sentence = f"{_CANADIAN_APOLOGIES[int(apology_pick * len(_CANADIAN_APOLOGIES))]}, {sentence}"
+
+    # Add "eh" or "bud" at end
+    if addition_roll < 0.6:
+        sentence = f"{sentence}, {_CANADIAN_ADDITIONS[int(addition_pick * len(_CANADIAN_ADDITIONS))]}"
+    return sentence
+
+
+_CANADIAN_ENDINGS = _interned(
+    'Thanks for listening, eh',
+    'Hope that helps, bud',
+    'Take care now, friend',
+    'Have a good one, eh',
+    'Sorry for rambling there',
+    'Beauty day, isn\'t it?'
+)
+
+
+# British interjections, sentence starters and enders, plus the mandatory weather chat
+_BRITISH_INTERJECTIONS = _interned(
+    'blimey', 'crikey', 'bloody hell', 'stone me',
+    'gordon bennett', 'flip me', 'strewth'
+)
+_BRITISH_STARTERS = _interned(
+    'Right then', 'I say', 'Look here', 'Hang on',
+    'Bloody hell', 'Stone the crows'
+)
+_BRITISH_ENDERS = _interned('innit', 'eh', 'mate', 'bruv', 'yeah')
+_BRITISH_WEATHER_COMMENTS = _interned(
+    'lovely weather we\'re having, innit',
+    'bit nippy today', 'proper grim out there',
+    'could murder a cup of tea in this weather'
+)
+_BRITISH_ENDINGS = _interned(
+    'Cheerio then', 'Bob\'s your uncle', 'Right, I\'m off',
+    'Toodle pip', 'Keep your pecker up', 'Mind how you go'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_canadian(text: str) -> str:
+    """Canadian politeness transformation - MAXIMUM POLITENESS, EH"""
+
+    # Apply replacements
+    result = _CANADIAN_TABLE.apply(text)
+
+    # Process sentences in one regex pass; punctuation and spacing stay as written.
+    # Every sentence's rolls come from one batched draw, sized by an upper bound on
+    # the sentence count (one more than the number of terminators)
+    rolls = iter(_rng.random((_max_sentences(result), 4)).tolist())
+    result = _SENTENCE_BODY_RE.sub(functools.partial(_canadian_sentence, rolls), result)
+
+    # Add Canadian endings
+    parts = [result]
+    ending = _maybe_pick(_CANADIAN_ENDINGS, 0.5)
+    if ending:
+        parts += (' ' if result.endswith(_TERMINATORS) else '. ', ending)
+
+    return ''.join(parts)
+
+
+# VSauce-style interjections, conspiracy questions and classic endings
+_VSAUCE_INTERJECTIONS = _interned(
+    'But here\'s the thing',
+    'But wait, there\'s more',
+    'But what if I told you',
+    'But here\'s what they don\'t want you to know',
+    'But think about it',
+    'But consider this',
+    'But here\'s the real question',
+    'But that\'s exactly what they want you to think'
+)
+_VSAUCE_QUESTIONS = _interned(
+    'But what if that\'s exactly what they want?',
+    'Or IS it?',
+    'But who\'s really pulling the strings?',
+    'But what if it\'s all connected?',
+    'But what are they hiding?',
+    'But what if nothing is as it seems?',
+    'But who benefits from this narrative?',
+    'But what if we\'re asking the wrong questions?'
+)
+_VSAUCE_ENDINGS = _interned(
+    'And as always, thanks for watching',
+    'But that\'s just what they want you to think',
+    'The rabbit hole goes deeper than you imagine',
+    'Question everything, believe nothing',
+    'Wake up, sheeple',
+    'Connect the dots',
+    'Open your eyes to the truth'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_vsauce(text: str) -> str:
+    """VSauce conspiracy transformation - MICHAEL HERE WITH QUESTIONS"""
+
+    # Apply replacements with random selection
+    result = _VSAUCE_TABLE.apply(text)
+
+    # Process sentences with random VSauce treatment
+    sentences = _SENTENCE_WITH_TERM.findall(result)
+    rolls = _rng.random((len(sentences), 4)).tolist()
+    parts = []
+    for i, ((sentence, term), draw) in enumerate(zip(sentences, rolls)):
+        interjection_roll, question_roll, interjection_pick, question_pick = draw
+        if sentence:
+            # Add interjection at start sometimes
+            if interjection_roll < 0.4 and i > 0:
+                sentence = f"{_VSAUCE_INTERJECTIONS[int(interjection_pick * len(_VSAUCE_INTERJECTIONS))]}: {sentence}"
+
+            # Add questioning at end sometimes
+            if question_roll < 0.5:
+                sentence = f"{sentence}... {_VSAUCE_QUESTIONS[int(question_pick * len(_VSAUCE_QUESTIONS))]}"
+
+            if parts:
+                parts.append(' ')
+            parts.append(sentence)
+        # Keep the sentence's own punctuation
+        parts.append(term)
+
+    result = ''.join(parts)
+
+    # Add classic VSauce endings
+    ending = _maybe_pick(_VSAUCE_ENDINGS, 0.6)
+    if ending:
+        result = f'{result.rstrip(".")}... {ending}.'
+
+    return result
+
+
+def _british_sentence(rolls, match: re.Match) -> str:
+    i, (starter_roll, interjection_roll, ender_roll, starter_pick, interjection_pick, ender_pick) = next(rolls)
+    sentence = match.group()
+    # Add British starter sometimes
+    if starter_roll < 0.3 and i == 0:
+        sentence = f"{_BRITISH_STARTERS[int(starter_pick * len(_BRITISH_STARTERS))]}, {sentence.lower()}"
+
+    # Add interjection sometimes
+    if interjection_roll < 0.4:
+        sentence = f"{_BRITISH_INTERJECTIONS[int(interjection_pick * len(_BRITISH_INTERJECTIONS))]}, {sentence}"
+
+    # Add "innit" or "eh" at end
+    if ender_roll < 0.5:
+        sentence = f"{sentence}, {_BRITISH_ENDERS[int(ender_pick * len(_BRITISH_ENDERS))]}"
+    return sentence
+
+
+@functools.lru_cache(maxsize=4096)
+def _apply_british(text: str) -> str:
+    """British transformation - MAXIMUM BRITISH AGGRESSION"""
+
+    # Apply replacements
+    result = _BRITISH_TABLE.apply(text)
+
+    # Process sentences in one regex pass, with every sentence's rolls drawn up front
+    rolls = iter(enumerate(_rng.random((_max_sentences(result), 6)).tolist()))
+    result = _SENTENCE_BODY_RE.sub(functools.partial(_british_sentence, rolls), result)
+    parts = [result]
+
+    # Add weather comment sometimes
+    weather = _maybe_pick(_BRITISH_WEATHER_COMMENTS, 0.3)
+    if weather:
+        parts += (' ' if result.endswith(_TERMINATORS) else '. ', weather)
+
+    # Add British endings
+    ending = _maybe_pick(_BRITISH_ENDINGS, 0.4)
+    if ending:
+        parts += (' ' if not weather and result.endswith(_TERMINATORS) else '. ', ending, '.')
+
+    return ''.join(parts)
+
+
+_ONI_REDACTIONS = _interned('[REDACTED]', '[CENSORED]', '[CLASSIFIED]', '[EXPUNGED]',
+                            '[DATA EXPUNGED]', '[REMOVED]', '[■■■■■]', '[BLOCKED]')
+
+# Censoring styles for random shorter words, and the stand-ins for the 'redacted' style
+_ONI_CENSOR_STYLES = ('full_block', 'partial_block', 'spoiler', 'redacted')
+_ONI_WORD_REDACTIONS = _interned('[REDACTED]', '[CENSORED]', '[BLOCKED]', '[■■■]', '[***]')
+
+# Censorship notices inserted mid-sentence
+_ONI_INSERTED_CENSORS = _interned(
+    '[REDACTED]', '[CENSORED BY MODERATOR]', '[REMOVED FOR SAFETY]',
+    '[CONTENT VIOLATION]', '[INAPPROPRIATE]', '[BLOCKED]',
+    '[DATA EXPUNGED]', '[CLASSIFIED]', '[■■■■■]', '[ACCESS DENIED]',
+    '[REMOVED BY ONI]', '[SECURITY BREACH]'
+)
+
+_ONI_WARNINGS = _interned(
+    '[This message has been processed by content moderation]',
+    '[Some content removed for community safety]',
+    '[Message filtered for inappropriate content]',
+    '[Content reviewed and modified]',
+    '[Automated content screening applied]',
+    '[Censored as per Office of Naval Intelligence guidelines]'
+)
+
+
+# Words to potentially redact (mix of innocent and slightly questionable)
+_ONI_REDACTION_TARGETS = (
+    # Innocent words that sound suspicious
+    r'\b(?:analysis|analyze)\b', r'\b(?:basement|cellar)\b', r'\b(?:contact|contacts)\b',
+    r'\b(?:private|personal)\b', r'\b(?:secret|secrets)\b', r'\b(?:hidden|hiding)\b',
+    r'\b(?:meeting|meetings)\b', r'\b(?:plan|plans|planning)\b', r'\b(?:strategy|tactics)\b',
+    r'\b(?:group|groups)\b', r'\b(?:organization|org)\b', r'\b(?:network|networking)\b',
+    r'\b(?:data|information)\b', r'\b(?:research|studying)\b', r'\b(?:investigation)\b',
+    r'\b(?:location|address)\b', r'\b(?:identity|identities)\b', r'\b(?:profile|profiles)\b',
+
+    # Normal words that become suspicious when censored
+    r'\b(?:government|authority)\b', r'\b(?:official|officials)\b', r'\b(?:system|systems)\b',
+    r'\b(?:control|controlling)\b', r'\b(?:power|powers)\b', r'\b(?:influence|influences)\b',
+    r'\b(?:money|cash|funds)\b', r'\b(?:business|company)\b', r'\b(?:project|projects)\b',
+    r'\b(?:operation|operations)\b', r'\b(?:mission|missions)\b', r'\b(?:target|targets)\b',
+
+    # Everyday words that seem weird when censored
+    r'\b(?:party|parties)\b', r'\b(?:friend|friends)\b', r'\b(?:family|families)\b',
+    r'\b(?:house|home)\b', r'\b(?:school|college)\b', r'\b(?:work|job)\b',
+    r'\b(?:phone|computer)\b', r'\b(?:internet|online)\b', r'\b(?:social|media)\b',
+    r'\b(?:message|messages)\b', r'\b(?:email|emails)\b', r'\b(?:call|calls)\b',
+
+    # Random common words
+    r'\b(?:kitchen|bedroom)\b', r'\b(?:garden|yard)\b', r'\b(?:car|vehicle)\b',
+    r'\b(?:book|books)\b', r'\b(?:music|songs)\b', r'\b(?:movie|movies)\b',
+    r'\b(?:game|games)\b', r'\b(?:sport|sports)\b', r'\b(?:food|eating)\b',
+    r'\b(?:water|drink)\b', r'\b(?:clothes|clothing)\b', r'\b(?:money|payment)\b'
+)
+
+# Discord spoiler words (words that get ||censored||)
+_ONI_SPOILER_TARGETS = (
+    r'\b(?:important|significant)\b', r'\b(?:special|unique)\b', r'\b(?:interesting|fascinating)\b',
+    r'\b(?:dangerous|risky)\b', r'\b(?:suspicious|questionable)\b', r'\b(?:confidential|classified)\b',
+    r'\b(?:sensitive|delicate)\b', r'\b(?:controversial|disputed)\b', r'\b(?:illegal|unlawful)\b',
+    r'\b(?:evidence|proof)\b', r'\b(?:documents|files)\b', r'\b(?:photos|pictures)\b',
+    r'\b(?:video|footage)\b', r'\b(?:recording|audio)\b', r'\b(?:witness|witnesses)\b',
+    r'\b(?:source|sources)\b', r'\b(?:insider|informant)\b', r'\b(?:leak|leaked)\b'
+)
+
+# Targets are literal word lists, so redactions and spoilers share one Aho-Corasick scan.
+# Key indexes below _ONI_SPOILER_START are redaction targets, the rest spoiler targets;
+# _ONI_GATES holds each target's chance of being active for a message.
+_ONI_TABLE = _ReplacementTable({**dict.fromkeys(_ONI_REDACTION_TARGETS, _ONI_REDACTIONS),
+                                **dict.fromkeys(_ONI_SPOILER_TARGETS, ())})
+_ONI_SPOILER_START = len(_ONI_REDACTION_TARGETS)
+_ONI_GATES = np.array([0.9] * len(_ONI_REDACTION_TARGETS) + [0.6] * len(_ONI_SPOILER_TARGETS))
+
+
+def _shared_target_words(targets: Sequence[str]) -> Dict[str, Tuple[int, ...]]:
+    """Words listed under more than one target, mapped to those targets' key indexes in order"""
+    indexes = {}
+    for index, pattern in enumerate(targets):
+        for word in _LITERAL_KEY_RE.fullmatch(pattern).group(1).split('|'):
+            indexes.setdefault(word, []).append(index)
+    return {word: tuple(found) for word, found in indexes.items() if len(found) > 1}
+
+
+# A match is only ever reported under its first target ('money' is listed twice), so
+# these words try each of their targets' gates in turn, as when targets ran one by one
+_ONI_SHARED_WORDS = _shared_target_words(_ONI_REDACTION_TARGETS + _ONI_SPOILER_TARGETS)
+
+# Punctuation and other non-word characters, stripped from words before censoring
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+# ASCII words, the common case, are split with str.translate rather than the regex engine
+_ASCII_WORD_CHARS = ''.join(c for c in map(chr, range(128)) if c.isalnum() or c == '_')
+_ASCII_NON_WORD_CHARS = ''.join(c for c in map(chr, range(128)) if c not in _ASCII_WORD_CHARS)
+_DELETE_ASCII_NON_WORD = str.maketrans('', '', _ASCII_NON_WORD_CHARS)
+_DELETE_ASCII_WORD = str.maketrans('', '', _ASCII_WORD_CHARS)
+
+# Short and common words oni never censors
+_ONI_SKIP_WORDS = frozenset(('the', 'and', 'or', 'is', 'a', 'an', 'to', 'of', 'in', 'for', 'on', 'at', 'by'))
+
+
+def _split_punctuation(word: str) -> Tuple[str, str]:
+    """Split a word into its word characters and its punctuation, each kept in order"""
+    if word.isalnum():
+        return word, ''
+    if word.isascii():
+        return word.translate(_DELETE_ASCII_NON_WORD), word.translate(_DELETE_ASCII_WORD)
+    return _NON_WORD_RE.sub('', word), ''.join(_NON_WORD_RE.findall(word))
+
+
+def _censor_match(active: Sequence[bool], word: str, index: int, roll: float) -> str:
+    """Oni redaction/spoiler callback for hits whose target passed this call's gate"""
+    if not active[index]:
+        index = next((other for other in _ONI_SHARED_WORDS.get(word.lower(), ()) if active[other]), None)
+        if index is None:
+            return word
+    if index >= _ONI_SPOILER_START:
+        return f'||{word}||'
+    return _ONI_REDACTIONS[int(roll * len(_ONI_REDACTIONS))]
+
+
+# Character-level visual confusion mappings (based on actual letter shape similarities)
+_VISUAL_CONFUSION = {
+    'b': ('d', 'p', 'q'), 'd': ('b', 'p', 'q'), 'p': ('b', 'd', 'q'), 'q': ('b', 'd', 'p'),
+    'm': ('w', 'n'), 'w': ('m', 'v'), 'n': ('m', 'u', 'h'), 'u': ('n', 'v'),
+    'f': ('t', 'l'), 't': ('f', 'l'), 'l': ('i', 'j', '1'), 'i': ('l', 'j', '1'),
+    'a': ('e', 'o'), 'e': ('a', 'o'), 'o': ('a', 'e'), 's': ('z', '5'), 'z': ('s', '2'),
+    'g': ('6', '9'), '6': ('9', 'g'), '9': ('6', 'g'), '0': ('o', 'O'),
+}
+
+
+def _cased_confusions() -> Dict[str, Tuple[str, ...]]:
+    """Confusion options for every ASCII character that has any, with case already applied"""
+    cased = {}
+    for char in map(chr, range(128)):
+        options = _VISUAL_CONFUSION.get(char.lower())
+        if options is not None:
+            # Preserve original case
+            cased[char] = tuple(option.upper() for option in options) if char.isupper() else options
+    return cased
+
+
+_CASED_CONFUSION = _cased_confusions()
+
+# Maps confusable ASCII characters to \x01 and every other ASCII character to \x00, so
+# str.find can hop between candidates without visiting the characters in between
+_CONFUSABLE_MARKS = str.maketrans({chr(code): '\x01' if chr(code) in _CASED_CONFUSION else '\x00'
+                                   for code in range(128)})
+
+
+def _build_confusion_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """Per-ASCII-code candidate counts and candidate code points"""
+    width = max(len(options) for options in _VISUAL_CONFUSION.values())
+    counts = np.zeros(128, dtype=np.int64)
+    table = np.zeros((128, width), dtype=np.uint32)
+    for char, options in _CASED_CONFUSION.items():
+        counts[ord(char)] = len(options)
+        table[ord(char), :len(options)] = [ord(option) for option in options]
+    return counts, table
+
+
+_CONFUSION_COUNTS, _CONFUSION_TABLE = _build_confusion_tables()
+
+
+# Below this many characters numpy's fixed per-call cost outweighs its per-character savings,
+# so the character-level dyslexia stages run as plain loops instead
+_NUMPY_MIN_TEXT_LENGTH = 64
+
+
+def _confuse_letters(text: str) -> str:
+    """Swap look-alike characters, 12% chance each, as one vectorized pass over the code points"""
+    if len(text) < _NUMPY_MIN_TEXT_LENGTH:
+        return _confuse_letters_short(text)
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    # Only ASCII characters have confusions; clamp the rest onto DEL, which has none
+    ascii_codes = np.minimum(codes, 127)
+    counts = _CONFUSION_COUNTS[ascii_codes]
+    rolls = _rng.random(codes.size)
+    hits = np.flatnonzero((counts > 0) & (rolls < 0.12))
+    if not hits.size:
+        return text
+    # The gate roll doubles as the pick, rescaled onto the candidate count
+    picks = (rolls[hits] / 0.12 * counts[hits]).astype(np.int64)
+    codes = codes.copy()
+    codes[hits] = _CONFUSION_TABLE[ascii_codes[hits], picks]
+    return codes.tobytes().decode('utf-32-le')
+
+
+def _confuse_letters_short(text: str) -> str:
+    """_confuse_letters for short text, one draw per confusable character
+
+    str.translate marks the candidates in C; the loop then only visits those.
+    """
+    marks = text.translate(_CONFUSABLE_MARKS)
+    chars = None
+    position = marks.find('\x01')
+    while position != -1:
+        roll = random.random()
+        if roll < 0.12:
+            if chars is None:
+                chars = list(text)
+            options = _CASED_CONFUSION[text[position]]
+            chars[position] = options[int(roll / 0.12 * len(options))]
+        position = marks.find('\x01', position + 1)
+    return text if chars is None else ''.join(chars)
+
+
+# ASCII letter lookup, so memory errors skip per-character isalpha() calls on ASCII text
+_ASCII_ALPHA = np.array([chr(code).isalpha() for code in range(128)])
+
+# Visually similar letter added by memory errors
+_MEMORY_SIMILAR = {'a': 'e', 'e': 'a', 'i': 'l', 'o': 'a', 'u': 'n'}
+
+# The same, per ASCII code (letters map to themselves otherwise)
+_SIMILAR_LETTERS = np.arange(128, dtype=np.uint32)
+for _char, _similar in _MEMORY_SIMILAR.items():
+    _SIMILAR_LETTERS[ord(_char)] = _SIMILAR_LETTERS[ord(_char.upper())] = ord(_similar)
+del _char, _similar
+
+
+def _phonetic_match(replacements: Tuple[str, ...], match: re.Match) -> str:
+    """Phonetic substitution callback: 40% chance to swap in a sound-alike, keeping the match's case"""
+    original = match.group()
+    replacement = _maybe_pick(replacements, 0.4)
+    if replacement is None:
+        return original
+    # Preserve case of original
+    if original.isupper():
+        return replacement.upper()
+    if original[0].isupper():
+        return replacement.capitalize()
+    return replacement
+
+
+# Phonetic confusion patterns (common sound-alike errors), each with its substitution callback bound once
+_PHONETIC_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), functools.partial(_phonetic_match, replacements))
+                           for pattern, replacements in (
+    (r'tion\b', ('shun', 'sion', 'shon')),
+    (r'ough\b', ('uf', 'off', 'ow')),
+    (r'augh\b', ('af', 'aw', 'alf')),
+    (r'eigh\b', ('ay', 'ey', 'a')),
+    (r'ph', ('f', 'pf')),
+    (r'ch', ('k', 'sh', 'tch')),
+    (r'th', ('f', 'd', 't')),
+    (r'ck\b', ('k', 'c')),
+    (r'qu', ('kw', 'q')),
+    (r'x', ('ks', 'z')),
+))
+
+
+# Shorter text is scrambled without spaCy
+_SPACY_MIN_TEXT_LENGTH = 40
+
+# A run of four or more letters; _scramble_doc only touches alphabetic tokens longer than 3
+_SCRAMBLE_CANDIDATE_RE = re.compile(r'[^\W\d_]{4}')
+
+# Scramble chance per part of speech (0.2 for anything else)
+_SCRAMBLE_PROBABILITY = {
+    'NOUN': 0.3, 'VERB': 0.35, 'ADJ': 0.25, 'ADV': 0.4,  # Content words more likely
+    'DET': 0.1, 'PREP': 0.15, 'CONJ': 0.1  # Function words less likely
+}
+
+# Every ordering of short word middles, so scrambling one is a table lookup rather than a shuffle
+_MIDDLE_PERMUTATIONS = {length: tuple(itertools.permutations(range(length))) for length in range(2, 7)}
+
+
+def _scramble_middle(word: str, roll: float) -> str:
+    """Shuffle all but the first and last letters; roll in [0, 1) picks the ordering of short middles"""
+    middle = word[1:-1]
+    permutations = _MIDDLE_PERMUTATIONS.get(len(middle))
+    if permutations is None:
+        # Longer middles have too many orderings to tabulate
+        letters = list(middle)
+        random.shuffle(letters)
+    else:
+        letters = [middle[i] for i in permutations[int(roll * len(permutations))]]
+    return f"{word[0]}{''.join(letters)}{word[-1]}"
+
+
+# Various scrambling patterns for when spaCy isn't available, built once rather than per word
+_SIMPLE_SCRAMBLES = (
+    lambda w: _scramble_middle(w, random.random()),  # Scramble middle
+    lambda w: w[1] + w[0] + w[2:] if len(w) > 2 else w,  # Swap first two
+    lambda w: w[:-2] + w[-1] + w[-2] if len(w) > 3 else w,  # Swap last two
+)
+
+
+class AdvancedConeEffects:
+    # spaCy model shared by every instance, loaded on first use
+    _nlp = None
+    _nlp_loaded = False
+
+    @classmethod
+    def _get_nlp(cls):
+        """Load the spaCy model once per process (only the dyslexia effect needs it)"""
+        if not cls._nlp_loaded:
+            cls._nlp_loaded = True
+            try:
+                # Imported here so the other effects never pay for importing spaCy
+                import spacy
+                # Dyslexia scrambling only reads POS tags (tagger + attribute_ruler), so the
+                # parser, NER and lemmatizer are excluded rather than just disabled: their
+                # weights are never loaded and they can't be re-enabled by accident
+                cls._nlp = spacy.load("en_core_web_sm", exclude=["parser", "ner", "lemmatizer"])
+            except (ImportError, OSError):
+                print("spaCy model not available, using basic transformations")
+        return cls._nlp
+
+    @property
+    def nlp(self):
+        return self._get_nlp()
+
+    @property
+    def spacy_available(self) -> bool:
+        return self._get_nlp() is not None
+    
+    def normalize_word(self, word: str) -> str:
+        """Normalize word variations (lmaoooo -> lmao, sooooo -> so)"""
+        # Remove excessive repeated characters (keep max 2)
+        return _ELONGATION_RE.sub(r'\1\1', word.lower())
+    
+    def apply_slayspeak(self, text: str) -> str:
+        """Valley girl/slayspeak transformation - AGGRESSIVE"""
+        return _run_cached(_apply_slayspeak, text)
 
     def apply_brainrot(self, text: str) -> str:
         """Gen-Z brainrot transformation - MAXIMUM BRAIN ROT"""
-        
-        # Massive Gen-Z vocabulary (actual current slang)
-        replacements = {
-            # Truth/agreement markers
-            r'\b(really|seriously|actually|truly)\b': ['no cap', 'fr fr', 'on god', 'deadass', 'facts'],
-            r'\b(yes|yeah|true|right|correct)\b': ['based', 'valid', 'facts', 'periodt', 'slay'],
-            r'\b(no|wrong|false|nah)\b': ['cap', 'L take', 'ratio', 'cringe', 'not it'],
-            
-            # Quality descriptors
-            r'\b(good|great|amazing|awesome|cool)\b': ['slaps', 'hits different', 'bussin', 'fire', 'goated', 'sends me'],
-            r'\b(bad|terrible|awful|horrible|sucks)\b': ['mid', 'trash', 'cringe', 'L', 'ratio worthy', 'not it'],
-            r'\b(weird|strange|odd|funny)\b': ['sus', 'sending me', 'unhinged', 'chaotic', 'built different'],
-            r'\b(boring|dull|lame)\b': ['dry', 'mid', 'NPC behavior', 'no rizz', 'ratio'],
-            
-            # Actions and behaviors
-            r'\b(lying|fibbing|deceiving)\b': ['capping', 'straight capping', 'no cap that\'s cap'],
-            r'\b(showing off|bragging|flexing)\b': ['flexing', 'showing out', 'doing the most'],
-            r'\b(embarrassing|cringe|awkward)\b': ['cringe', 'secondhand embarrassment', 'giving me the ick'],
-            r'\b(trying hard|attempting|working)\b': ['doing the most', 'giving main character energy'],
-            r'\b(ignoring|avoiding|dismissing)\b': ['leaving on read', 'ghosting', 'giving cold shoulder'],
-            
-            # Emotions and states
-            r'\b(excited|hyped|pumped)\b': ['hyped', 'absolutely sending me', 'living for this'],
-            r'\b(sad|depressed|down)\b': ['in my feels', 'down bad', 'not vibing'],
-            r'\b(angry|mad|furious)\b': ['pressed', 'big mad', 'seeing red'],
-            r'\b(confused|lost|puzzled)\b': ['??? moment', 'not computing', 'brain.exe stopped'],
-            r'\b(tired|exhausted|sleepy)\b': ['dead', 'absolutely deceased', 'running on fumes'],
-            
-            # People and relationships
-            r'\b(attractive|hot|cute|pretty)\b': ['absolutely goated', 'serving looks', 'main character energy'],
-            r'\b(boyfriend|girlfriend|partner)\b': ['mans', 'my person', 'literally my Roman Empire'],
-            r'\b(friend|buddy|bestie)\b': ['bestie', 'my person', 'literally family'],
-            r'\b(person|people|someone)\b': ['this person', 'bestie', 'main character'],
-            
-            # Internet/phone behavior
-            r'\b(texting|messaging|calling)\b': ['sliding into DMs', 'hitting up', 'dropping texts'],
-            r'\b(posting|sharing|uploading)\b': ['dropping content', 'serving looks', 'posting for the timeline'],
-            r'\b(scrolling|browsing|looking)\b': ['doom scrolling', 'living on the timeline', 'chronically online'],
-            
-            # Intensifiers
-            r'\b(very|really|super|extremely)\b': ['absolutely', 'lowkey', 'highkey', 'literally'],
-            r'\b(totally|completely|absolutely)\b': ['deadass', 'no cap', 'absolutely'],
-            
-            # Common expressions
-            r'\b(whatever|anyways|okay)\b': ['anyways chile', 'periodt', 'and what about it'],
-            r'\b(understand|get it|comprehend)\b': ['it\'s giving', 'I see the vision', 'absolutely vibing with'],
-            
-            # Texting variations (handle elongated versions)
-            r'\b(lmao+|lol+|haha+)\b': ['SENDING ME', 'absolutely deceased', 'can\'t even', 'I\'m gone'],
-            r'\b(omg+|oh my god+)\b': ['NOT THE', 'absolutely not', 'I cannot even', 'bestie what'],
-            r'\b(wtf+|what the f+)\b': ['bestie what', 'absolutely not', 'this ain\'t it'],
-        }
-        
-        result = text
-        
-        # Apply replacements with random selection
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add random brainrot interjections
-        interjections = [
-            'periodt', 'no cap', 'fr fr', 'deadass', 'on god', 'facts', 'slay', 
-            'bestie', 'not me', 'the way', 'I cannot', 'sending me', 'absolutely not',
-            'this is it', 'main character moment', 'it\'s giving', 'serves'
-        ]
-        
-        # Split into sentences and add interjections
-        sentences = re.split(r'[.!?]+', result)
-        transformed_sentences = []
-        
-        for sentence in sentences:
-            if sentence.strip():
-                # Random chance to add interjection at start
-                if random.random() < 0.3:
-                    sentence = f"{random.choice(interjections)} {sentence.strip()}"
-                
-                # Random chance to add at end
-                if random.random() < 0.4:
-                    sentence = f"{sentence.strip()} {random.choice(interjections)}"
-                
-                transformed_sentences.append(sentence)
-        
-        result = '. '.join(transformed_sentences)
-        
-        # Final brainrot touches
-        endings = ['periodt', 'and that\'s on periodt', 'no cap', 'slay', 'absolutely sending me']
-        if random.random() < 0.5:
-            result += f' {random.choice(endings)}'
-        
-        return result
+        return _run_cached(_apply_brainrot, text)
 
     def apply_scrum(self, text: str) -> str:
         """Agile scrum master jargon transformation - MAXIMUM CORPORATE AGILE BS"""
-        
-        # Inspired by Anthony Sistilli's content - pure agile buzzword hell
-        replacements = {
-            # Basic actions -> corporate agile speak
-            r'\b(do|doing|make|making|work|working)\b': [
-                'deliver value', 'execute against', 'operationalize', 'action this',
-                'move the needle on', 'drive outcomes for', 'iterate on'
-            ],
-            r'\b(fix|fixing|solve|solving)\b': [
-                'remediate', 'optimize', 'address the pain points of', 'unblock',
-                'course-correct', 'pivot on', 'right-size'
-            ],
-            r'\b(plan|planning|organize)\b': [
-                'roadmap', 'strategize around', 'align on', 'socialize the approach for',
-                'get alignment on', 'create visibility into'
-            ],
-            r'\b(talk|talking|discuss|discussing)\b': [
-                'circle back on', 'sync on', 'align on', 'socialize',
-                'workshop together', 'ideate around', 'jam on'
-            ],
-            r'\b(meet|meeting)\b': [
-                'sync', 'standup', 'retrospective', 'planning session',
-                'alignment meeting', 'working session', 'ceremony'
-            ],
-            
-            # Time and urgency
-            r'\b(now|today|immediately|soon)\b': [
-                'this sprint', 'in the current iteration', 'this cycle',
-                'within the sprint boundary', 'in this timebox'
-            ],
-            r'\b(later|eventually|someday)\b': [
-                'future iteration', 'next sprint', 'in the backlog',
-                'post-MVP', 'in a future release', 'parking lot item'
-            ],
-            r'\b(quick|quickly|fast|urgent)\b': [
-                'time-boxed', 'sprint-scoped', 'MVP approach',
-                'lean and mean', 'agile delivery', 'iterative approach'
-            ],
-            r'\b(deadline|due date)\b': [
-                'sprint commitment', 'milestone', 'delivery target',
-                'sprint goal', 'iteration boundary'
-            ],
-            
-            # People and roles
-            r'\b(person|people|someone|team|group)\b': [
-                'stakeholder', 'team member', 'scrum team', 'squad',
-                'delivery team', 'cross-functional team'
-            ],
-            r'\b(boss|manager|leader)\b': [
-                'product owner', 'scrum master', 'delivery lead',
-                'squad lead', 'chapter lead'
-            ],
-            r'\b(user|customer|client)\b': [
-                'end user', 'stakeholder', 'persona', 'user segment',
-                'customer journey touchpoint'
-            ],
-            
-            # Work and tasks
-            r'\b(task|job|work|thing)\b': [
-                'user story', 'epic', 'deliverable', 'backlog item',
-                'sprint commitment', 'acceptance criteria'
-            ],
-            r'\b(goal|target|objective)\b': [
-                'sprint goal', 'OKR', 'success metric', 'KPI',
-                'outcome', 'business value'
-            ],
-            r'\b(problem|issue|bug)\b': [
-                'pain point', 'blocker', 'impediment', 'technical debt',
-                'risk', 'dependency'
-            ],
-            
-            # Quality and improvement
-            r'\b(good|great|perfect|excellent)\b': [
-                'value-driving', 'optimized', 'right-sized', 'scalable',
-                'maintainable', 'sustainable'
-            ],
-            r'\b(bad|wrong|terrible)\b': [
-                'sub-optimal', 'technical debt', 'anti-pattern',
-                'blockers', 'impediments to velocity'
-            ],
-            r'\b(better|improve|upgrade|enhance)\b': [
-                'optimize', 'right-size', 'scale up', 'mature',
-                'uplevel', 'enhance velocity'
-            ],
-            
-            # Communication and process
-            r'\b(tell|inform|update|report)\b': [
-                'socialize', 'provide visibility into', 'communicate out',
-                'cascade the message', 'align stakeholders on'
-            ],
-            r'\b(learn|understand|know)\b': [
-                'gain insights into', 'develop domain expertise in',
-                'build knowledge capital around'
-            ],
-            r'\b(decide|choose|pick)\b': [
-                'align on', 'prioritize', 'roadmap', 'sequence',
-                'make data-driven decisions about'
-            ],
-            
-            # Regular chat words -> corporate speak
-            r'\b(yes|yeah|ok|okay|sure)\b': [
-                'absolutely, let\'s action that', 'that aligns with our objectives',
-                'that\'s value-driving', 'let\'s move forward on that'
-            ],
-            r'\b(no|nope|can\'t)\b': [
-                'that\'s not in scope for this sprint', 'let\'s parking lot that',
-                'that\'s a dependency we need to unblock first'
-            ],
-            r'\b(maybe|possibly|perhaps)\b': [
-                'let\'s validate that assumption', 'we should spike on that',
-                'that needs to be socialized with stakeholders'
-            ],
-            
-            # Common casual expressions
-            r'\b(going|going to)\b': ['delivering on', 'executing against', 'operationalizing'],
-            r'\b(have|has|had)\b': ['own', 'maintain accountability for', 'drive'],
-            r'\b(get|getting)\b': ['secure', 'obtain buy-in for', 'action'],
-            r'\b(put|putting)\b': ['position', 'align', 'operationalize'],
-        }
-        
-        result = text
-        
-        # Apply replacements
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add random corporate agile interjections
-        interjections = [
-            'from a delivery perspective', 'thinking about this strategically',
-            'to align on this', 'from a velocity standpoint', 'looking at our OKRs',
-            'considering our sprint goals', 'from a stakeholder perspective',
-            'thinking about our MVP', 'from a roadmap perspective',
-            'considering our technical debt', 'looking at our capacity',
-            'from a cross-functional lens', 'thinking about scalability'
-        ]
-        
-        # Add jargon to sentences
-        sentences = re.split(r'[.!?]+', result)
-        transformed_sentences = []
-        
-        for sentence in sentences:
-            if sentence.strip():
-                # Add corporate interjection
-                if random.random() < 0.4:
-                    sentence = f"{random.choice(interjections)}, {sentence.strip()}"
-                
-                transformed_sentences.append(sentence)
-        
-        result = '. '.join(transformed_sentences)
-        
-        # Add corporate endings
-        endings = [
-            'Let\'s circle back on this offline',
-            'I\'ll action this and provide visibility',
-            'Let\'s align stakeholders on this',
-            'This drives significant business value',
-            'Let\'s iterate on this in our next sprint',
-            'We should socialize this with the broader team'
-        ]
-        
-        if random.random() < 0.6:
-            result += f'. {random.choice(endings)}'
-        
-        return result
+        return _run_cached(_apply_scrum, text)
 
     def apply_linkedin(self, text: str) -> str:
         """LinkedIn influencer transformation - MAXIMUM CRINGE PROFESSIONAL"""
-        
-        # Exaggerated LinkedIn humble-bragging and AI-generated soulless content
-        replacements = {
-            # Achievement humble-bragging
-            r'\b(did|made|created|built|finished)\b': [
-                'I\'m humbled to share that I delivered 💼',
-                'Thrilled to announce that I spearheaded 🚀',
-                'Excited to share that I pioneered 💡',
-                'Proud to have architected ⚡',
-                'Grateful for the opportunity to execute 🎯'
-            ],
-            r'\b(learned|discovered|found out)\b': [
-                'gained invaluable insights into 💡',
-                'had the privilege of discovering 🔍',
-                'was fortunate enough to uncover 💎',
-                'had the honor of learning about 📚',
-                'was blessed to gain expertise in 🧠'
-            ],
-            r'\b(succeeded|won|achieved)\b': [
-                'exceeded expectations by delivering 📈',
-                'I\'m humbled to share we achieved 🏆',
-                'thrilled to announce we surpassed 🎉',
-                'grateful to have accomplished 💯',
-                'honored to have driven 🚀'
-            ],
-            
-            # Emotional amplification
-            r'\b(happy|glad|pleased)\b': [
-                'absolutely thrilled 😊', 'incredibly grateful 🙏',
-                'beyond excited 🎉', 'deeply honored 💫',
-                'tremendously blessed ✨'
-            ],
-            r'\b(proud|satisfied|content)\b': [
-                'immensely proud 💪', 'deeply humbled 🙏',
-                'incredibly fulfilled 💯', 'profoundly grateful 🌟',
-                'tremendously honored 👑'
-            ],
-            r'\b(excited|enthusiastic|eager)\b': [
-                'absolutely energized ⚡', 'incredibly passionate 🔥',
-                'deeply inspired 💫', 'tremendously motivated 🚀',
-                'profoundly excited 🎯'
-            ],
-            
-            # Work and collaboration
-            r'\b(worked|collaborated|partnered)\b': [
-                'had the privilege of collaborating 🤝',
-                'was honored to partner 💼',
-                'had the opportunity to work alongside 👥',
-                'was blessed to team up 🌟',
-                'got to co-create magic ✨'
-            ],
-            r'\b(team|group|colleagues)\b': [
-                'incredible dream team 👥', 'amazing squad 🌟',
-                'phenomenal collective 💫', 'outstanding crew ⚡',
-                'inspiring group of changemakers 🚀'
-            ],
-            r'\b(helped|assisted|supported)\b': [
-                'had the honor of empowering 💪',
-                'was privileged to enable 🔧',
-                'got to uplift and support 🙌',
-                'had the chance to champion 🏆',
-                'was able to guide and mentor 📈'
-            ],
-            
-            # Business and innovation
-            r'\b(innovative|creative|new|unique)\b': [
-                'groundbreaking 🚀', 'revolutionary 💡',
-                'game-changing ⚡', 'disruptive 💥',
-                'paradigm-shifting 🌟'
-            ],
-            r'\b(solution|answer|fix)\b': [
-                'breakthrough solution 💡', 'innovative approach 🚀',
-                'transformative strategy ⚡', 'revolutionary framework 🎯',
-                'cutting-edge methodology 💫'
-            ],
-            r'\b(growth|progress|improvement)\b': [
-                'exponential growth 📈', 'transformational progress 🚀',
-                'unprecedented improvement 💯', 'remarkable evolution ⚡',
-                'phenomenal advancement 🌟'
-            ],
-            
-            # Networking and connections
-            r'\b(people|person|everyone)\b': [
-                'amazing connections 🤝', 'inspiring individuals 🌟',
-                'phenomenal human beings 💫', 'incredible thought leaders 🧠',
-                'outstanding professionals 👔'
-            ],
-            r'\b(met|connected|networked)\b': [
-                'had the privilege of connecting 🤝',
-                'was honored to network 💼',
-                'got to build meaningful relationships 🌟',
-                'had amazing conversations 💬',
-                'forged incredible partnerships ✨'
-            ],
-            
-            # Time and opportunity
-            r'\b(opportunity|chance|experience)\b': [
-                'incredible opportunity 🌟', 'life-changing experience 💫',
-                'transformational journey 🚀', 'amazing privilege 🙏',
-                'phenomenal adventure ⚡'
-            ],
-            r'\b(journey|path|career)\b': [
-                'incredible journey 🌟', 'transformational path 🚀',
-                'amazing adventure 💫', 'phenomenal voyage ⚡',
-                'inspiring odyssey 🎯'
-            ],
-            
-            # Gratitude and humility (fake)
-            r'\b(thank|thanks|grateful)\b': [
-                'incredibly grateful 🙏', 'deeply thankful 💫',
-                'immensely appreciative 🌟', 'profoundly blessed ✨',
-                'tremendously honored 👑'
-            ],
-            
-            # Regular expressions -> LinkedIn speak
-            r'\b(good|great|nice|cool)\b': [
-                'absolutely phenomenal 🌟', 'incredibly inspiring 💫',
-                'tremendously impactful 🚀', 'deeply meaningful ⚡',
-                'profoundly transformative 💡'
-            ],
-            r'\b(yes|yeah|agreed|true)\b': [
-                'Absolutely agree! 💯', 'This resonates deeply! 🎯',
-                'So much truth here! ✨', 'Couldn\'t agree more! 🙌',
-                'This hits different! 🚀'
-            ],
-        }
-        
-        result = text
-        
-        # Apply replacements
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add LinkedIn-style intros and connectors
-        intros = [
-            'I\'m thrilled to share that',
-            'Excited to announce that',
-            'Grateful to share that',
-            'Humbled to report that',
-            'Honored to share that',
-            'Blessed to announce that'
-        ]
-        
-        connectors = [
-            'Building on this momentum 🚀',
-            'Looking forward to what\'s next 💫',
-            'Excited for the journey ahead ⚡',
-            'Grateful for these opportunities 🙏',
-            'Inspired by what\'s possible 💡'
-        ]
-        
-        # Transform sentences with LinkedIn structure
-        sentences = re.split(r'[.!?]+', result)
-        if sentences and sentences[0].strip():
-            # Add intro to first sentence
-            if random.random() < 0.5:
-                sentences[0] = f"{random.choice(intros)} {sentences[0].strip()}"
-        
-        # Add engagement hooks
-        engagement_hooks = [
-            'Thoughts? 💭', 'What\'s your experience? 🤔',
-            'Would love to hear your perspective! 💬',
-            'How has this impacted your journey? 🚀',
-            'What are your thoughts on this? 💡',
-            'Anyone else experiencing this? 🙋‍♂️'
-        ]
-        
-        result = '. '.join([s for s in sentences if s.strip()])
-        
-        # Add connector and engagement hook
-        if random.random() < 0.6:
-            result += f'. {random.choice(connectors)}'
-        
-        if random.random() < 0.7:
-            result += f' {random.choice(engagement_hooks)}'
-        
-        # Add hashtag explosion
-        hashtags = [
-            '#Leadership #Growth #Innovation',
-            '#Inspiration #Success #Mindset',
-            '#Networking #Professional #Career',
-            '#Grateful #Blessed #Opportunity',
-            '#Teamwork #Collaboration #Excellence'
-        ]
-        
-        if random.random() < 0.5:
-            result += f'\n\n{random.choice(hashtags)}'
-        
-        return result 
+        return _run_cached(_apply_linkedin, text)
 
     def apply_crisis(self, text: str) -> str:
         """Existential crisis transformation - MAXIMUM EXISTENTIAL DREAD"""
-        
-        # Advanced existential vocabulary
-        replacements = {
-            # Time becomes existentially loaded
-            r'\b(now|today|currently|present)\b': [
-                'in this fleeting moment of existence',
-                'during this brief respite from the void',
-                'in this temporary illusion of now',
-                'while consciousness persists',
-                'in this meaningless instant'
-            ],
-            r'\b(future|tomorrow|later|eventually)\b': [
-                'the inevitable march toward oblivion',
-                'the uncertain void that awaits',
-                'the meaningless tomorrow',
-                'our inevitable dissolution',
-                'the approaching heat death'
-            ],
-            r'\b(past|before|previously|earlier)\b': [
-                'those equally meaningless moments',
-                'the illusion of a meaningful past',
-                'our manufactured memories',
-                'the arbitrary sequence of events',
-                'those fleeting neurochemical patterns'
-            ],
-            
-            # Emotions become existentially questioning
-            r'\b(happy|joy|excited|glad|pleased)\b': [
-                'temporarily distracted from the void',
-                'experiencing fleeting neurochemical pleasure',
-                'momentarily forgetting our cosmic insignificance',
-                'chemically induced contentment',
-                'brief respite from existential dread'
-            ],
-            r'\b(sad|depressed|upset|unhappy)\b': [
-                'confronting the fundamental emptiness',
-                'experiencing appropriate cosmic despair',
-                'recognizing our meaningless existence',
-                'feeling the weight of inevitable entropy',
-                'acknowledging universal suffering'
-            ],
-            r'\b(love|care|affection)\b': [
-                'evolutionary manipulation disguised as meaning',
-                'biochemical processes we call connection',
-                'desperate attempts to feel less alone in the universe',
-                'temporary bonding before mutual annihilation',
-                'chemical reactions masquerading as purpose'
-            ],
-            
-            # Actions become meaningless
-            r'\b(do|doing|make|work|create)\b': [
-                'engage in ultimately meaningless tasks',
-                'perform arbitrary actions to avoid confronting the void',
-                'participate in the illusion of purpose',
-                'distract ourselves from our impending doom',
-                'pretend our actions have cosmic significance'
-            ],
-            r'\b(achieve|accomplish|succeed|win)\b': [
-                'temporarily convince ourselves we matter',
-                'participate in society\'s collective delusion',
-                'reach arbitrary milestones before death',
-                'achieve meaningless victories in a pointless game',
-                'accumulate hollow achievements before the void'
-            ],
-            r'\b(try|attempt|effort|strive)\b': [
-                'desperately cling to the illusion of control',
-                'struggle against inevitable entropy',
-                'persist despite cosmic meaninglessness',
-                'fight the unwinnable battle against time',
-                'attempt to matter in an indifferent universe'
-            ],
-            
-            # Life and existence
-            r'\b(life|living|alive|existence)\b': [
-                'this brief flicker of consciousness',
-                'our temporary arrangement of atoms',
-                'the cosmic joke of self-aware matter',
-                'this fleeting dance of particles',
-                'our meaningless biological processes'
-            ],
-            r'\b(purpose|meaning|reason|point)\b': [
-                'the desperate search for non-existent meaning',
-                'our manufactured sense of purpose',
-                'the comforting lie of significance',
-                'humanity\'s collective delusion',
-                'the void we try to fill with false meaning'
-            ],
-            r'\b(important|significant|matters|valuable)\b': [
-                'temporarily significant in our tiny perspective',
-                'meaningful only to our deluded consciousness',
-                'important in the context of our cosmic insignificance',
-                'arbitrarily valued by pattern-seeking minds',
-                'significant only until heat death'
-            ],
-            
-            # People and relationships
-            r'\b(people|person|human|everyone)\b': [
-                'fellow passengers on spaceship Earth',
-                'other temporary arrangements of consciousness',
-                'co-conspirators in the meaning-making delusion',
-                'fellow victims of cosmic indifference',
-                'other atoms temporarily pretending to be important'
-            ],
-            r'\b(friend|family|relationship)\b': [
-                'temporary alliances against the void',
-                'shared delusions of connection',
-                'mutual distractions from existential truth',
-                'biochemical bonding experiments',
-                'fellow travelers toward mutual oblivion'
-            ],
-            
-            # Regular words get existential treatment
-            r'\b(good|great|awesome|amazing)\b': [
-                'temporarily pleasant in this meaningless existence',
-                'chemically satisfying despite cosmic irrelevance',
-                'subjectively positive in our brief flicker',
-                'arbitrarily categorized as beneficial',
-                'momentarily distracting from the void'
-            ],
-            r'\b(bad|terrible|awful|horrible)\b': [
-                'appropriately reflecting reality\'s indifference',
-                'honestly representing cosmic meaninglessness',
-                'accurately depicting our doomed existence',
-                'truthfully showing life\'s fundamental suffering',
-                'correctly displaying universal entropy'
-            ],
-            
-            # Certainty becomes doubt
-            r'\b(know|certain|sure|definitely|obvious)\b': [
-                'think we know (but what do we really know?)',
-                'assume in our limited perception',
-                'believe based on incomplete information',
-                'pretend certainty exists in chaos',
-                'convince ourselves despite universal uncertainty'
-            ]
-        }
-        
-        result = text
-        
-        # Apply replacements
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add existential questions randomly
-        questions = [
-            'But what does any of this really mean?',
-            'Does any of this matter in the grand scheme?',
-            'Are we just avoiding the inevitable truth?',
-            'What\'s the point in a universe that doesn\'t care?',
-            'Why do we pretend our actions have meaning?',
-            'Is this just elaborate procrastination before death?',
-            'Are we simply animals creating stories to cope?'
-        ]
-        
-        # Insert existential doubt
-        if random.random() < 0.6:
-            result += f' {random.choice(questions)}'
-        
-        # Add philosophical endings
-        endings = [
-            'In the end, we\'re all just stardust pretending to matter.',
-            'The universe doesn\'t care about our tiny human concerns.',
-            'We\'re all just waiting for the heat death anyway.',
-            'Nothing we do will matter in a billion years.',
-            'The void is patient, but it\'s always watching.',
-            'Consciousness is just the universe questioning itself.'
-        ]
-        
-        if random.random() < 0.4:
-            result += f' {random.choice(endings)}'
-        
-        return result
+        return _run_cached(_apply_crisis, text)
 
     def apply_canadian(self, text: str) -> str:
         """Canadian politeness transformation - MAXIMUM POLITENESS, EH"""
-        
-        # Extensive Canadian vocabulary and politeness patterns
-        replacements = {
-            # Basic courtesy amplification
-            r'\b(please|plz)\b': [
-                'if you wouldn\'t mind terribly',
-                'if it\'s not too much trouble',
-                'when you get a chance, eh',
-                'if you could possibly',
-                'sorry to bother you, but could you'
-            ],
-            r'\b(thanks|thank you|thx)\b': [
-                'thank you so much, eh',
-                'thanks a bunch, bud',
-                'much appreciated, friend',
-                'thanks kindly',
-                'sorry, and thank you'
-            ],
-            r'\b(yes|yeah|yep|sure)\b': [
-                'absolutely, eh',
-                'you betcha',
-                'for sure, bud',
-                'definitely, friend',
-                'oh, absolutely'
-            ],
-            r'\b(no|nope|nah)\b': [
-                'sorry, I\'m afraid not',
-                'oh gosh, no sorry',
-                'sorry about that, but no',
-                'afraid I can\'t, eh',
-                'sorry, but that\'s not gonna work'
-            ],
-            
-            # Requests become extremely polite
-            r'\b(can you|could you|would you)\b': [
-                'would you mind terribly if',
-                'sorry to bother you, but could you possibly',
-                'if it\'s not too much trouble, could you',
-                'hate to be a bother, but would you mind',
-                'sorry for asking, but could you maybe'
-            ],
-            r'\b(give me|get me|bring me)\b': [
-                'sorry, could I possibly trouble you for',
-                'if you wouldn\'t mind, could I have',
-                'hate to bother you, but could I get',
-                'sorry to ask, but might I have',
-                'if it\'s not too much trouble, could you bring'
-            ],
-            r'\b(do this|do that|help)\b': [
-                'lend a hand with this, eh',
-                'help out with this if you don\'t mind',
-                'give me a hand with this, bud',
-                'help a fella out',
-                'sorry to ask, but could you help'
-            ],
-            
-            # Emotions with Canadian flavor
-            r'\b(angry|mad|pissed|annoyed)\b': [
-                'a bit frustrated, sorry',
-                'slightly perturbed, eh',
-                'not too happy about this, bud',
-                'a little steamed, sorry to say',
-                'somewhat bothered, I\'m afraid'
-            ],
-            r'\b(excited|happy|thrilled)\b': [
-                'pretty darn excited, eh',
-                'happier than a kid with a Timbit',
-                'pleased as punch, bud',
-                'tickled pink about this',
-                'over the moon, eh'
-            ],
-            r'\b(confused|lost|unsure)\b': [
-                'a bit turned around, eh',
-                'feeling a little lost, sorry',
-                'not quite sure what\'s what',
-                'scratching my head about this one',
-                'a bit puzzled, I\'m afraid'
-            ],
-            
-            # Actions with Canadian politeness
-            r'\b(said|told|mentioned)\b': [
-                'mentioned politely',
-                'brought up gently',
-                'suggested respectfully',
-                'shared with respect',
-                'mentioned, if I may'
-            ],
-            r'\b(disagreed|argued|fought)\b': [
-                'respectfully disagreed',
-                'politely suggested otherwise',
-                'had a different perspective, eh',
-                'respectfully begged to differ',
-                'sorry, but had to disagree'
-            ],
-            r'\b(left|went|departed)\b': [
-                'headed out, eh',
-                'took off, bud',
-                'made my way out',
-                'scooted along',
-                'moseyed on out'
-            ],
-            
-            # Food and drinks (Canadian references)
-            r'\b(coffee|drink|beverage)\b': [
-                'double-double',
-                'Tim\'s coffee',
-                'cup of joe, eh',
-                'coffee from Timmies',
-                'brew, bud'
-            ],
-            r'\b(food|meal|snack)\b': [
-                'grub, eh',
-                'some good eats',
-                'tucker, bud',
-                'chow',
-                'nosh'
-            ],
-            r'\b(beer|alcohol)\b': [
-                'cold one, eh',
-                'brewski, bud',
-                'beer, eh',
-                'cold brew',
-                'pint, friend'
-            ],
-            
-            # Weather (mandatory Canadian conversation)
-            r'\b(weather|temperature|climate)\b': [
-                'weather (beautiful day, eh?)',
-                'temperature (bit nippy today)',
-                'weather (sure is something out there)',
-                'climate (crazy weather we\'re having)',
-                'weather (hot enough for ya?)'
-            ],
-            
-            # Places and locations
-            r'\b(home|house|place)\b': [
-                'place, eh',
-                'home and native land',
-                'humble abode',
-                'little place',
-                'neck of the woods'
-            ],
-            r'\b(store|shop|mall)\b': [
-                'shop, eh',
-                'the store, bud',
-                'Canadian Tire',
-                'local shop',
-                'place to pick things up'
-            ],
-            
-            # Canadian slang integration
-            r'\b(bathroom|restroom|toilet)\b': [
-                'washroom, eh',
-                'loo, bud',
-                'little boys\'/girls\' room',
-                'facilities',
-                'washroom'
-            ],
-            r'\b(soda|pop|soft drink)\b': [
-                'pop, eh',
-                'soft drink, bud',
-                'fizzy drink',
-                'pop',
-                'soda pop'
-            ],
-            r'\b(money|cash|dollars)\b': [
-                'loonies and toonies',
-                'Canadian dollars, eh',
-                'cash, bud',
-                'money, friend',
-                'dough, eh'
-            ],
-            
-            # Intensifiers become Canadian
-            r'\b(very|really|super|extremely)\b': [
-                'pretty darn',
-                'real, real',
-                'mighty',
-                'pretty',
-                'awful (as in awfully good)'
-            ],
-            r'\b(totally|completely|absolutely)\b': [
-                'you betcha',
-                'absolutely, eh',
-                'for sure, bud',
-                'without a doubt',
-                'completely, friend'
-            ]
-        }
-        
-        result = text
-        
-        # Apply replacements
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add random apologies (very Canadian)
-        apologies = [
-            'sorry about that',
-            'my apologies, eh',
-            'sorry, bud',
-            'pardon me',
-            'sorry there, friend'
-        ]
-        
-        # Add "eh" and "bud" strategically
-        canadian_additions = ['eh', 'bud', 'friend', 'there', 'eh bud']
-        
-        # Process sentences
-        sentences = re.split(r'[.!?]+', result)
-        transformed_sentences = []
-        
-        for sentence in sentences:
-            if sentence.strip():
-                # Random apology at start
-                if random.random() < 0.3:
-                    sentence = f"{random.choice(apologies)}, {sentence.strip()}"
-                
-                # Add "eh" or "bud" at end
-                if random.random() < 0.6:
-                    sentence = f"{sentence.strip()}, {random.choice(canadian_additions)}"
-                
-                transformed_sentences.append(sentence)
-        
-        result = '. '.join(transformed_sentences)
-        
-        # Add Canadian endings
-        endings = [
-            'Thanks for listening, eh',
-            'Hope that helps, bud',
-            'Take care now, friend',
-            'Have a good one, eh',
-            'Sorry for rambling there',
-            'Beauty day, isn\'t it?'
-        ]
-        
-        if random.random() < 0.5:
-            result += f'. {random.choice(endings)}'
-        
-        return result
+        return _run_cached(_apply_canadian, text)
 
     def apply_vsauce(self, text: str) -> str:
         """VSauce conspiracy transformation - MICHAEL HERE WITH QUESTIONS"""
-        
-        # VSauce-style questioning and conspiracy thinking
-        replacements = {
-            # Certainty becomes questioning
-            r'\b(is|are|was|were)\b': [
-                'appears to be', 'seems to be', 'is allegedly', 'is supposedly',
-                'is what they want you to believe', 'might be', 'could possibly be'
-            ],
-            r'\b(happened|occurred|took place)\b': [
-                'allegedly happened', 'supposedly occurred', 'is said to have happened',
-                'happened (or did it?)', 'occurred according to official sources',
-                'took place in what we call reality'
-            ],
-            r'\b(true|real|actual|factual)\b': [
-                'what they want you to believe is true',
-                'supposedly real', 'allegedly factual',
-                'true according to mainstream sources',
-                'real in our perceived reality'
-            ],
-            r'\b(know|knew|understand|realize)\b': [
-                'think we know', 'are told to believe',
-                'supposedly understand', 'are led to believe',
-                'think we realize', 'assume we know'
-            ],
-            
-            # Simple statements become questions
-            r'\b(because|since|due to)\b': [
-                'but WHY exactly?', 'but what if', 'but here\'s the thing',
-                'but wait, what if', 'but consider this', 'but think about it'
-            ],
-            r'\b(normal|usual|typical|standard)\b': [
-                'what society calls normal', 'supposedly normal',
-                'normal according to who?', 'normal (but what IS normal?)',
-                'typical in our constructed reality'
-            ],
-            r'\b(everyone|people|society)\b': [
-                'what we call society', 'the masses',
-                'people (or ARE they?)', 'everyone who\'s paying attention',
-                'society as we know it'
-            ],
-            
-            # Facts become suspicious
-            r'\b(fact|evidence|proof|data)\b': [
-                'supposed fact', 'what they call evidence',
-                'so-called proof', 'data (from questionable sources)',
-                'facts according to official sources'
-            ],
-            r'\b(study|research|science|expert)\b': [
-                'study (funded by whom?)', 'research (with questionable motives)',
-                'science (controlled by institutions)', 'expert (according to who?)'
-            ],
-            r'\b(government|official|authority)\b': [
-                'government (with hidden agendas)', 'official sources (wink wink)',
-                'authorities (who benefit from this)', 'establishment figures'
-            ],
-            
-            # Time becomes questionable
-            r'\b(always|never|forever)\b': [
-                'always (or so they say)', 'never according to official records',
-                'forever in this reality', 'always in what we call time'
-            ],
-            r'\b(history|past|before)\b': [
-                'official history', 'what they teach us about the past',
-                'recorded history (by the winners)', 'the past as we\'re told it happened'
-            ],
-            r'\b(future|will|going to)\b': [
-                'future (if there is one)', 'will supposedly',
-                'future according to their plans', 'going to (in theory)'
-            ],
-            
-            # Actions become suspicious
-            r'\b(told|said|claimed|stated)\b': [
-                'allegedly told', 'claimed (without proof)',
-                'stated according to official sources', 'said (but can we trust it?)'
-            ],
-            r'\b(found|discovered|revealed)\b': [
-                'supposedly found', 'discovered (or planted?)',
-                'revealed by questionable sources', 'found (how convenient)'
-            ],
-            r'\b(decided|chose|selected)\b': [
-                'decided for us', 'chose for their own benefit',
-                'selected by unknown forces', 'decided by powers that be'
-            ],
-            
-            # Common words get VSauce treatment
-            r'\b(good|bad|right|wrong)\b': [
-                'good (according to whose standards?)', 'bad (or exactly as planned?)',
-                'right (in whose opinion?)', 'wrong (or perfectly calculated?)'
-            ],
-            r'\b(random|coincidence|accident)\b': [
-                'random (nothing is random)', 'coincidence (there are no coincidences)',
-                'accident (or was it?)', 'supposedly random'
-            ],
-            
-            # Questions amplification
-            r'\b(what|how|why|when|where|who)\b': [
-                'but WHAT really', 'but HOW exactly', 'but WHY though',
-                'but WHEN exactly', 'but WHERE specifically', 'but WHO benefits'
-            ]
-        }
-        
-        result = text
-        
-        # Apply replacements with random selection
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add VSauce-style interjections
-        interjections = [
-            'But here\'s the thing',
-            'But wait, there\'s more',
-            'But what if I told you',
-            'But here\'s what they don\'t want you to know',
-            'But think about it',
-            'But consider this',
-            'But here\'s the real question',
-            'But that\'s exactly what they want you to think'
-        ]
-        
-        # Add conspiracy questions
-        questions = [
-            'But what if that\'s exactly what they want?',
-            'Or IS it?',
-            'But who\'s really pulling the strings?',
-            'But what if it\'s all connected?',
-            'But what are they hiding?',
-            'But what if nothing is as it seems?',
-            'But who benefits from this narrative?',
-            'But what if we\'re asking the wrong questions?'
-        ]
-        
-        # Process sentences with random VSauce treatment
-        sentences = re.split(r'[.!?]+', result)
-        transformed_sentences = []
-        
-        for i, sentence in enumerate(sentences):
-            if sentence.strip():
-                # Add interjection at start sometimes
-                if random.random() < 0.4 and i > 0:
-                    sentence = f"{random.choice(interjections)}: {sentence.strip()}"
-                
-                # Add questioning at end sometimes
-                if random.random() < 0.5:
-                    sentence = f"{sentence.strip()}... {random.choice(questions)}"
-                
-                transformed_sentences.append(sentence)
-        
-        result = '. '.join(transformed_sentences)
-        
-        # Add classic VSauce endings
-        endings = [
-            'And as always, thanks for watching',
-            'But that\'s just what they want you to think',
-            'The rabbit hole goes deeper than you imagine',
-            'Question everything, believe nothing',
-            'Wake up, sheeple',
-            'Connect the dots',
-            'Open your eyes to the truth'
-        ]
-        
-        if random.random() < 0.6:
-            result += f'... {random.choice(endings)}.'
-        
-        return result
+        return _run_cached(_apply_vsauce, text)
 
     def apply_british(self, text: str) -> str:
         """British transformation - MAXIMUM BRITISH AGGRESSION"""
-        
-        # Massive British slang, insults, and dialect changes
-        replacements = {
-            # Basic greetings and responses
-            r'\b(hello|hi|hey)\b': [
-                'alright mate', 'morning', 'alright there', 'wotcher',
-                'watcha', 'oi oi', 'right then'
-            ],
-            r'\b(yes|yeah|yep)\b': [
-                'yeah mate', 'right', 'innit', 'too right',
-                'bloody right', 'course', 'aye'
-            ],
-            r'\b(no|nope|nah)\b': [
-                'nah mate', 'bollocks', 'not a chance', 'piss off',
-                'do one', 'naff off', 'sod off'
-            ],
-            r'\b(ok|okay|alright)\b': [
-                'right then', 'fair enough', 'sound', 'cushty',
-                'bob\'s your uncle', 'sorted'
-            ],
-            
-            # Intensifiers become British
-            r'\b(very|really|super|extremely)\b': [
-                'bloody', 'proper', 'dead', 'well', 'right',
-                'absolutely', 'blimey', 'crikey'
-            ],
-            r'\b(totally|completely|absolutely)\b': [
-                'proper', 'dead', 'absolutely', 'well',
-                'bloody hell', 'stone me'
-            ],
-            
-            # Quality descriptors
-            r'\b(good|great|awesome|amazing|cool)\b': [
-                'brilliant', 'ace', 'smashing', 'top notch', 'bang on',
-                'spot on', 'the dog\'s bollocks', 'proper good', 'mint',
-                'tidy', 'cushty', 'sound as a pound'
-            ],
-            r'\b(bad|terrible|awful|horrible|sucks)\b': [
-                'rubbish', 'pants', 'naff', 'grim', 'rank',
-                'manky', 'minging', 'proper shit', 'absolute bollocks',
-                'dire', 'utter toss', 'complete codswallop'
-            ],
-            r'\b(weird|strange|odd|crazy)\b': [
-                'mental', 'barmy', 'daft', 'bonkers', 'crackers',
-                'potty', 'round the bend', 'off their rocker',
-                'few sandwiches short of a picnic'
-            ],
-            r'\b(stupid|dumb|idiotic)\b': [
-                'thick', 'dim', 'dense', 'thick as two short planks',
-                'not the sharpest tool in the shed', 'few cards short of a deck',
-                'thick as mince', 'daft as a brush'
-            ],
-            
-            # Actions and verbs
-            r'\b(going|walking|leaving)\b': [
-                'popping round', 'legging it', 'scarping', 'sodding off',
-                'buggering off', 'making tracks', 'doing a runner'
-            ],
-            r'\b(looking|watching|seeing)\b': [
-                'having a butcher\'s', 'taking a gander', 'having a look-see',
-                'having a dekko', 'eyeballing', 'clocking'
-            ],
-            r'\b(talking|speaking|chatting)\b': [
-                'having a chinwag', 'nattering', 'rabbiting on',
-                'wittering', 'gassing', 'having a natter'
-            ],
-            r'\b(eating|having food)\b': [
-                'having a scoff', 'tucking in', 'getting some grub',
-                'having a bite', 'scoffing', 'munching'
-            ],
-            r'\b(drinking|having a drink)\b': [
-                'having a bevvy', 'sinking a pint', 'having a tipple',
-                'getting pissed', 'having a swift one'
-            ],
-            r'\b(sleeping|tired|exhausted)\b': [
-                'knackered', 'shattered', 'cream crackered', 'done in',
-                'jiggered', 'zonked', 'ready for kip'
-            ],
-            
-            # Emotions
-            r'\b(angry|mad|pissed off)\b': [
-                'fuming', 'livid', 'seeing red', 'cheesed off',
-                'brassed off', 'narked', 'proper wound up'
-            ],
-            r'\b(happy|excited|pleased)\b': [
-                'chuffed', 'made up', 'over the moon', 'pleased as punch',
-                'tickled pink', 'buzzing', 'dead chuffed'
-            ],
-            r'\b(confused|lost|puzzled)\b': [
-                'all at sea', 'haven\'t got a clue', 'in a right state',
-                'all over the shop', 'not with it'
-            ],
-            r'\b(drunk|wasted|hammered)\b': [
-                'pissed', 'bladdered', 'legless', 'steaming',
-                'trollied', 'plastered', 'off their tits'
-            ],
-            
-            # Food and drink
-            r'\b(food|meal|dinner)\b': [
-                'grub', 'scoff', 'tucker', 'nosh', 'tea'
-            ],
-            r'\b(breakfast|lunch|dinner)\b': [
-                'brekkie', 'elevenses', 'tea', 'supper'
-            ],
-            r'\b(sandwich|sub)\b': [
-                'sarnie', 'butty', 'roll'
-            ],
-            r'\b(soda|pop|soft drink)\b': [
-                'fizzy drink', 'pop', 'soft drink'
-            ],
-            r'\b(french fries|fries)\b': [
-                'chips', 'chippy chips'
-            ],
-            r'\b(candy|sweets)\b': [
-                'sweets', 'sweeties'
-            ],
-            
-            # People and insults
-            r'\b(person|guy|dude|man)\b': [
-                'bloke', 'geezer', 'fella', 'mate', 'lad'
-            ],
-            r'\b(woman|girl|lady)\b': [
-                'bird', 'lass', 'love', 'darling', 'sweetheart'
-            ],
-            r'\b(friend|buddy|pal)\b': [
-                'mate', 'bruv', 'geezer', 'mucka', 'old bean'
-            ],
-            r'\b(idiot|moron|fool)\b': [
-                'numpty', 'muppet', 'plonker', 'div', 'melt',
-                'bellend', 'knobhead', 'tosser', 'wanker', 'prat'
-            ],
-            
-            # Places
-            r'\b(bathroom|restroom|toilet)\b': [
-                'loo', 'bog', 'khazi', 'dunny', 'lavvy'
-            ],
-            r'\b(house|home)\b': [
-                'gaff', 'pad', 'place', 'drum'
-            ],
-            r'\b(store|shop)\b': [
-                'shop', 'chippy', 'offie', 'corner shop'
-            ],
-            r'\b(car|vehicle)\b': [
-                'motor', 'motor car', 'wheels', 'jam jar'
-            ],
-            
-            # Money and value
-            r'\b(money|cash|dollars)\b': [
-                'dosh', 'brass', 'dough', 'readies', 'shrapnel',
-                'wonga', 'lolly'
-            ],
-            r'\b(expensive|costly)\b': [
-                'dear', 'steep', 'bit pricey', 'costs a bomb'
-            ],
-            r'\b(cheap|inexpensive)\b': [
-                'cheap as chips', 'bargain', 'dead cheap'
-            ],
-            
-            # Time expressions
-            r'\b(soon|quickly|fast)\b': [
-                'in a jiffy', 'quick as you like', 'double quick',
-                'in two shakes', 'before you can say Jack Robinson'
-            ],
-            r'\b(never|not at all)\b': [
-                'not on your nelly', 'when pigs fly', 'not bloody likely'
-            ]
-        }
-        
-        result = text
-        
-        # Apply replacements
-        for pattern, options in replacements.items():
-            def replace_func(match):
-                return random.choice(options)
-            result = re.sub(pattern, replace_func, result, flags=re.IGNORECASE)
-        
-        # Add British expressions and interjections
-        interjections = [
-            'blimey', 'crikey', 'bloody hell', 'stone me',
-            'gordon bennett', 'flip me', 'strewth'
-        ]
-        
-        # Add British sentence starters
-        starters = [
-            'Right then', 'I say', 'Look here', 'Hang on',
-            'Bloody hell', 'Stone the crows'
-        ]
-        
-        # Weather comments (mandatory British conversation)
-        weather_comments = [
-            'lovely weather we\'re having, innit',
-            'bit nippy today', 'proper grim out there',
-            'could murder a cup of tea in this weather'
-        ]
-        
-        # Process sentences
-        sentences = re.split(r'[.!?]+', result)
-        transformed_sentences = []
-        
-        for i, sentence in enumerate(sentences):
-            if sentence.strip():
-                # Add British starter sometimes
-                if random.random() < 0.3 and i == 0:
-                    sentence = f"{random.choice(starters)}, {sentence.strip().lower()}"
-                
-                # Add interjection sometimes
-                if random.random() < 0.4:
-                    sentence = f"{random.choice(interjections)}, {sentence.strip()}"
-                
-                # Add "innit" or "eh" at end
-                if random.random() < 0.5:
-                    enders = ['innit', 'eh', 'mate', 'bruv', 'yeah']
-                    sentence = f"{sentence.strip()}, {random.choice(enders)}"
-                
-                transformed_sentences.append(sentence)
-        
-        result = '. '.join(transformed_sentences)
-        
-        # Add weather comment sometimes
-        if random.random() < 0.3:
-            result += f'. {random.choice(weather_comments)}'
-        
-        # Add British endings
-        endings = [
-            'Cheerio then', 'Bob\'s your uncle', 'Right, I\'m off',
-            'Toodle pip', 'Keep your pecker up', 'Mind how you go'
-        ]
-        
-        if random.random() < 0.4:
-            result += f'. {random.choice(endings)}.'
-        
-        return result
+        return _run_cached(_apply_british, text)
 
     def apply_oni(self, text: str) -> str:
         """Oni censor transformation - RANDOM AGGRESSIVE CENSORING"""
         
-        # Words to potentially redact (mix of innocent and slightly questionable)
-        redaction_targets = [
-            # Innocent words that sound suspicious
-            r'\b(analysis|analyze)\b', r'\b(basement|cellar)\b', r'\b(contact|contacts)\b',
-            r'\b(private|personal)\b', r'\b(secret|secrets)\b', r'\b(hidden|hiding)\b',
-            r'\b(meeting|meetings)\b', r'\b(plan|plans|planning)\b', r'\b(strategy|tactics)\b',
-            r'\b(group|groups)\b', r'\b(organization|org)\b', r'\b(network|networking)\b',
-            r'\b(data|information)\b', r'\b(research|studying)\b', r'\b(investigation)\b',
-            r'\b(location|address)\b', r'\b(identity|identities)\b', r'\b(profile|profiles)\b',
-            
-            # Normal words that become suspicious when censored
-            r'\b(government|authority)\b', r'\b(official|officials)\b', r'\b(system|systems)\b',
-            r'\b(control|controlling)\b', r'\b(power|powers)\b', r'\b(influence|influences)\b',
-            r'\b(money|cash|funds)\b', r'\b(business|company)\b', r'\b(project|projects)\b',
-            r'\b(operation|operations)\b', r'\b(mission|missions)\b', r'\b(target|targets)\b',
-            
-            # Everyday words that seem weird when censored
-            r'\b(party|parties)\b', r'\b(friend|friends)\b', r'\b(family|families)\b',
-            r'\b(house|home)\b', r'\b(school|college)\b', r'\b(work|job)\b',
-            r'\b(phone|computer)\b', r'\b(internet|online)\b', r'\b(social|media)\b',
-            r'\b(message|messages)\b', r'\b(email|emails)\b', r'\b(call|calls)\b',
-            
-            # Random common words
-            r'\b(kitchen|bedroom)\b', r'\b(garden|yard)\b', r'\b(car|vehicle)\b',
-            r'\b(book|books)\b', r'\b(music|songs)\b', r'\b(movie|movies)\b',
-            r'\b(game|games)\b', r'\b(sport|sports)\b', r'\b(food|eating)\b',
-            r'\b(water|drink)\b', r'\b(clothes|clothing)\b', r'\b(money|payment)\b'
-        ]
-        
-        # Discord spoiler words (words that get ||censored||)
-        spoiler_targets = [
-            r'\b(important|significant)\b', r'\b(special|unique)\b', r'\b(interesting|fascinating)\b',
-            r'\b(dangerous|risky)\b', r'\b(suspicious|questionable)\b', r'\b(confidential|classified)\b',
-            r'\b(sensitive|delicate)\b', r'\b(controversial|disputed)\b', r'\b(illegal|unlawful)\b',
-            r'\b(evidence|proof)\b', r'\b(documents|files)\b', r'\b(photos|pictures)\b',
-            r'\b(video|footage)\b', r'\b(recording|audio)\b', r'\b(witness|witnesses)\b',
-            r'\b(source|sources)\b', r'\b(insider|informant)\b', r'\b(leak|leaked)\b'
-        ]
-        
         result = text
         
-        # Randomly redact words completely
-        for pattern in redaction_targets:
-            if random.random() < 0.9:  # 40% chance to redact each pattern
-                def redact_func(match):
-                    redactions = ['[REDACTED]', '[CENSORED]', '[CLASSIFIED]', '[EXPUNGED]', 
-                                 '[DATA EXPUNGED]', '[REMOVED]', '[■■■■■]', '[BLOCKED]']
-                    return random.choice(redactions)
-                result = re.sub(pattern, redact_func, result, flags=re.IGNORECASE)
-        
-        # Add Discord spoiler formatting to some words
-        for pattern in spoiler_targets:
-            if random.random() < 0.6:  # 50% chance to spoiler each pattern
-                def spoiler_func(match):
-                    return f"||{match.group()}||"
-                result = re.sub(pattern, spoiler_func, result, flags=re.IGNORECASE)
+        # Randomly redact words completely (90% chance per target) and add Discord spoiler
+        # formatting to others (60% chance per target), gated up front for a single scan
+        active = (_rng.random(len(_ONI_GATES)) < _ONI_GATES).tolist()
+        result = _ONI_TABLE.sub(result, functools.partial(_censor_match, active))
         
         # Randomly censor words (both long words and random words)
         words = result.split()
         censored_words = []
         
-        for word in words:
+        # One batch of rolls per word: long-word gate, short-word gate (which also picks the style) and redaction pick
+        for word, (long_roll, short_roll, pick_roll) in zip(words, _rng.random((len(words), 3)).tolist()):
             # Clean word for length check (remove punctuation)
-            clean_word = re.sub(r'[^\w]', '', word)
+            clean_word, punctuation = _split_punctuation(word)
             
             # Skip very short words and common words
-            if len(clean_word) <= 2 or clean_word.lower() in ['the', 'and', 'or', 'is', 'a', 'an', 'to', 'of', 'in', 'for', 'on', 'at', 'by']:
+            if len(clean_word) <= 2 or clean_word.lower() in _ONI_SKIP_WORDS:
                 censored_words.append(word)
                 continue
             
             # Censor longer words (higher chance)
-            if len(clean_word) > 6 and random.random() < 0.4:
+            if len(clean_word) > 6 and long_roll < 0.4:
                 # Censor middle part of word
                 start = clean_word[:2]
                 end = clean_word[-2:]
@@ -1486,15 +1972,13 @@ class AdvancedConeEffects:
                 censored = f"{start}{'█' * middle_length}{end}"
                 
                 # Preserve punctuation
-                punctuation = re.findall(r'[^\w]', word)
-                if punctuation:
-                    censored += ''.join(punctuation)
+                censored += punctuation
                 
                 censored_words.append(censored)
             # Censor random shorter words too
-            elif len(clean_word) >= 3 and random.random() < 0.25:
+            elif len(clean_word) >= 3 and short_roll < 0.25:
                 # Different censoring styles for random words
-                censor_style = random.choice(['full_block', 'partial_block', 'spoiler', 'redacted'])
+                censor_style = _ONI_CENSOR_STYLES[int(short_roll / 0.25 * len(_ONI_CENSOR_STYLES))]
                 
                 if censor_style == 'full_block':
                     censored = '█' * len(clean_word)
@@ -1509,14 +1993,11 @@ class AdvancedConeEffects:
                 elif censor_style == 'spoiler':
                     censored = f"||{clean_word}||"
                 else:  # redacted
-                    redaction_types = ['[REDACTED]', '[CENSORED]', '[BLOCKED]', '[■■■]', '[***]']
-                    censored = random.choice(redaction_types)
+                    censored = _ONI_WORD_REDACTIONS[int(pick_roll * len(_ONI_WORD_REDACTIONS))]
                 
                 # Preserve punctuation for non-redacted styles
                 if censor_style != 'redacted':
-                    punctuation = re.findall(r'[^\w]', word)
-                    if punctuation:
-                        censored += ''.join(punctuation)
+                    censored += punctuation
                 
                 censored_words.append(censored)
             else:
@@ -1528,22 +2009,17 @@ class AdvancedConeEffects:
         sentences = result.split('.')
         processed_sentences = []
         
-        for sentence in sentences:
-            if sentence.strip() and random.random() < 0.5:  # Increased from 30% to 50%
+        # One batch of rolls per sentence: gate (which also picks the count), two positions and two picks
+        for sentence, rolls in zip(sentences, _rng.random((len(sentences), 5)).tolist()):
+            if sentence.strip() and rolls[0] < 0.5:  # Increased from 30% to 50%
                 words = sentence.split()
                 if len(words) > 3:
                     # Insert random censorship (sometimes multiple)
-                    num_censors = random.choice([1, 1, 1, 2])  # Mostly 1, sometimes 2
-                    for _ in range(num_censors):
+                    num_censors = 2 if rolls[0] >= 0.375 else 1  # Mostly 1, sometimes 2
+                    for pos_roll, pick_roll in zip(rolls[1:1 + num_censors], rolls[3:3 + num_censors]):
                         if len(words) > 3:
-                            pos = random.randint(1, len(words) - 1)
-                            censors = [
-                                '[REDACTED]', '[CENSORED BY MODERATOR]', '[REMOVED FOR SAFETY]', 
-                                '[CONTENT VIOLATION]', '[INAPPROPRIATE]', '[BLOCKED]',
-                                '[DATA EXPUNGED]', '[CLASSIFIED]', '[■■■■■]', '[ACCESS DENIED]',
-                                '[REMOVED BY ONI]', '[SECURITY BREACH]'
-                            ]
-                            words.insert(pos, random.choice(censors))
+                            pos = 1 + int(pos_roll * (len(words) - 1))
+                            words.insert(pos, _ONI_INSERTED_CENSORS[int(pick_roll * len(_ONI_INSERTED_CENSORS))])
                     sentence = ' '.join(words)
             
             processed_sentences.append(sentence)
@@ -1551,157 +2027,157 @@ class AdvancedConeEffects:
         result = '.'.join(processed_sentences)
         
         # Add warning at end sometimes
-        warnings = [
-            '[This message has been processed by content moderation]',
-            '[Some content removed for community safety]',
-            '[Message filtered for inappropriate content]',
-            '[Content reviewed and modified]',
-            '[Automated content screening applied]',
-            '[Censored as per Office of Naval Intelligence guidelines]'
-        ]
-        
-        if random.random() < 0.4:
-            result += f' {random.choice(warnings)}'
+        warning = _maybe_pick(_ONI_WARNINGS, 0.4)
+        if warning:
+            result += f' {warning}'
         
         return result
 
     def apply_dyslexia(self, text: str) -> str:
         """Advanced dyslexia transformation using NLP libraries for dynamic, realistic effects"""
+        result = self._apply_letter_confusion(text)
         
-        # Character-level visual confusion mappings (based on actual letter shape similarities)
-        visual_confusion = {
-            'b': ['d', 'p', 'q'], 'd': ['b', 'p', 'q'], 'p': ['b', 'd', 'q'], 'q': ['b', 'd', 'p'],
-            'm': ['w', 'n'], 'w': ['m', 'v'], 'n': ['m', 'u', 'h'], 'u': ['n', 'v'],
-            'f': ['t', 'l'], 't': ['f', 'l'], 'l': ['i', 'j', '1'], 'i': ['l', 'j', '1'],
-            'a': ['e', 'o'], 'e': ['a', 'o'], 'o': ['a', 'e'], 's': ['z', '5'], 'z': ['s', '2'],
-            'g': ['6', '9'], '6': ['9', 'g'], '9': ['6', 'g'], '0': ['o', 'O'], 'O': ['0', 'o'],
-            'S': ['5', 'Z'], 'Z': ['S', '2'], 'I': ['l', '1', 'L'], 'L': ['I', '1', 'l']
-        }
-        
-        # Phonetic confusion patterns (common sound-alike errors)
-        phonetic_patterns = [
-            (r'tion\b', ['shun', 'sion', 'shon']),
-            (r'ough\b', ['uf', 'off', 'ow']),
-            (r'augh\b', ['af', 'aw', 'alf']),
-            (r'eigh\b', ['ay', 'ey', 'a']),
-            (r'ph', ['f', 'pf']),
-            (r'ch', ['k', 'sh', 'tch']),
-            (r'th', ['f', 'd', 't']),
-            (r'ck\b', ['k', 'c']),
-            (r'qu', ['kw', 'q']),
-            (r'x', ['ks', 'z']),
-        ]
-        
-        result = text
+        # 3. SYLLABLE AND WORD-LEVEL SCRAMBLING (using spaCy if available)
+        # Short text skips spaCy (and loading it): tagging a handful of tokens costs more
+        # than the POS-aware scramble is worth
+        if len(result) >= _SPACY_MIN_TEXT_LENGTH and self.spacy_available:
+            if not _SCRAMBLE_CANDIDATE_RE.search(result):
+                # No token could be scrambled, so skip tagging; _scramble_doc would only strip
+                return self._apply_reading_errors(result.strip())
+            return self._apply_reading_errors(self._scramble_doc(self.nlp(result)))
+        return self._apply_basic_scramble(result)
+    
+    def _apply_letter_confusion(self, text: str) -> str:
+        """Dyslexia steps 1-2: visual letter confusion and phonetic substitutions"""
         
         # Apply transformations with different probability layers
         
         # 1. CHARACTER-LEVEL VISUAL CONFUSION (works on any text)
-        char_result = []
-        for char in result:
-            if char.lower() in visual_confusion and random.random() < 0.12:  # 12% chance per character
-                confusion_options = visual_confusion[char.lower()]
-                new_char = random.choice(confusion_options)
-                # Preserve original case
-                if char.isupper():
-                    new_char = new_char.upper()
-                char_result.append(new_char)
-            else:
-                char_result.append(char)
-        result = ''.join(char_result)
+        result = _confuse_letters(text)
         
         # 2. PHONETIC PATTERN SUBSTITUTIONS (probability-based)
-        for pattern, replacements in phonetic_patterns:
-            if random.random() < 0.25:  # 25% chance to apply each pattern
-                matches = re.finditer(pattern, result, re.IGNORECASE)
-                for match in reversed(list(matches)):  # Reverse to maintain positions
-                    if random.random() < 0.4:  # 40% chance to replace each match
-                        replacement = random.choice(replacements)
-                        # Preserve case of original
-                        if match.group().isupper():
-                            replacement = replacement.upper()
-                        elif match.group()[0].isupper():
-                            replacement = replacement.capitalize()
-                        result = result[:match.start()] + replacement + result[match.end():]
+        gates = _rng.random(len(_PHONETIC_PATTERNS)).tolist()
+        for (pattern, substitute), gate in zip(_PHONETIC_PATTERNS, gates):
+            if gate < 0.25:  # 25% chance to apply each pattern
+                # One sub() rebuilds the string once instead of splicing per match
+                result = pattern.sub(substitute, result)
         
-        # 3. SYLLABLE AND WORD-LEVEL SCRAMBLING (using spaCy if available)
-        if self.spacy_available:
-            doc = self.nlp(result)
-            words = []
-            for token in doc:
-                if token.is_alpha and len(token.text) > 3:
-                    scrambled = self._advanced_word_scramble(token.text, token.pos_)
-                    words.append(scrambled)
-                else:
-                    words.append(token.text_with_ws)
-            result = ''.join(words).strip()
-        else:
-            # Fallback: simple word scrambling
-            words = result.split()
-            for i, word in enumerate(words):
-                if len(word) > 4 and word.isalpha() and random.random() < 0.2:
-                    words[i] = self._simple_scramble(word)
-            result = ' '.join(words)
+        return result
+    
+    def _scramble_doc(self, doc) -> str:
+        """Dyslexia step 3: POS-aware word scrambling over a spaCy doc"""
+        words = []
+        for token in doc:
+            if token.is_alpha and len(token.text) > 3:
+                scrambled = self._advanced_word_scramble(token.text, token.pos_)
+                words.append(scrambled)
+            else:
+                words.append(token.text_with_ws)
+        return ''.join(words).strip()
+    
+    def _apply_basic_scramble(self, text: str) -> str:
+        """Dyslexia steps 3-6 without spaCy"""
+        # The fallback scrambler already has the words, so hand them on rather than splitting again
+        words = self._scramble_words(text)
+        return self._apply_reading_errors(' '.join(words), words)
+    
+    def _scramble_words(self, text: str) -> List[str]:
+        """Dyslexia step 3 fallback: simple word scrambling without spaCy, returning the words"""
+        words = text.split()
+        rolls = _rng.random(len(words)).tolist()
+        for i, (word, roll) in enumerate(zip(words, rolls)):
+            if len(word) > 4 and word.isalpha() and roll < 0.2:
+                # The gate roll, rescaled onto [0, 1), also picks the scrambling pattern
+                words[i] = self._simple_scramble(word, roll / 0.2)
+        return words
+    
+    def _apply_reading_errors(self, text: str, words: Optional[List[str]] = None) -> str:
+        """Dyslexia steps 4-6: reading disruption, memory errors and sequence reversals
+        
+        words, when given, is text already split; the word-level steps then reuse it.
+        """
+        result = text
         
         # 4. READING PATTERN SIMULATION (attention/focus issues)
         if random.random() < 0.3:  # 30% chance to apply reading disruption
-            result = self._simulate_reading_disruption(result)
+            if words is None:
+                words = result.split()
+            if self._simulate_reading_disruption(words):
+                result = ' '.join(words)
         
         # 5. WORKING MEMORY ERRORS (letter additions/omissions)
         result = self._apply_memory_errors(result)
         
         # 6. SEQUENCE REVERSAL (small chunks occasionally get flipped)
         if random.random() < 0.25:  # 25% chance
-            result = self._apply_sequence_reversals(result)
+            words = result.split()
+            self._apply_sequence_reversals(words)
+            result = ' '.join(words)
         
         return result
     
+    def apply_many(self, texts: List[str], effect: str, batch_size: int = 64, n_process: int = 1) -> List[str]:
+        """Apply one effect to many texts, batching spaCy work through nlp.pipe"""
+        method_name = _EFFECT_METHODS.get(effect.lower())
+        if method_name is None:
+            return list(texts)
+        
+        if method_name == 'apply_dyslexia' and self.spacy_available:
+            confused = [self._apply_letter_confusion(text) for text in texts]
+            # Only texts long enough for apply_dyslexia's spaCy path go through the pipe
+            docs = iter(self.nlp.pipe([text for text in confused if len(text) >= _SPACY_MIN_TEXT_LENGTH],
+                                      batch_size=batch_size, n_process=n_process))
+            return [self._apply_reading_errors(self._scramble_doc(next(docs)))
+                    if len(text) >= _SPACY_MIN_TEXT_LENGTH else self._apply_basic_scramble(text)
+                    for text in confused]
+        
+        # Regex-only effects: fan out to worker processes only for large inputs
+        if n_process > 1 and len(texts) >= _PARALLEL_MIN_TEXTS:
+            chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+            with ProcessPoolExecutor(max_workers=n_process, initializer=_reseed_worker) as executor:
+                results = executor.map(_apply_chunk, [method_name] * len(chunks), chunks)
+                return [transformed for chunk in results for transformed in chunk]
+        
+        method = getattr(self, method_name)
+        return [method(text) for text in texts]
+    
     def _advanced_word_scramble(self, word: str, pos: str) -> str:
         """Advanced word scrambling based on POS tag and word characteristics"""
         if len(word) <= 3:
             return word
         
         # Different scrambling strategies based on part of speech
-        scramble_probability = {
-            'NOUN': 0.3, 'VERB': 0.35, 'ADJ': 0.25, 'ADV': 0.4,  # Content words more likely
-            'DET': 0.1, 'PREP': 0.15, 'CONJ': 0.1  # Function words less likely
-        }
-        
-        prob = scramble_probability.get(pos, 0.2)
-        if random.random() > prob:
+        prob = _SCRAMBLE_PROBABILITY.get(pos, 0.2)
+        roll = random.random()
+        if roll >= prob:
             return word
+        # A roll under prob is uniform on [0, prob), so rescaled it drives the scramble too
+        roll /= prob
         
         # Keep first and last, scramble middle (classic dyslexic pattern)
         if len(word) > 4:
-            first, middle, last = word[0], list(word[1:-1]), word[-1]
-            random.shuffle(middle)
-            return first + ''.join(middle) + last
+            return _scramble_middle(word, roll)
         else:
             # For shorter words, just swap adjacent letters sometimes
-            if random.random() < 0.5 and len(word) == 4:
+            if roll < 0.5 and len(word) == 4:
                 return word[0] + word[2] + word[1] + word[3]
         
         return word
     
-    def _simple_scramble(self, word: str) -> str:
-        """Simple scrambling for when spaCy isn't available"""
+    def _simple_scramble(self, word: str, roll: float) -> str:
+        """Simple scrambling for when spaCy isn't available; roll in [0, 1) picks the pattern"""
         if len(word) <= 3:
             return word
         
-        # Various scrambling patterns
-        patterns = [
-            lambda w: w[0] + ''.join(random.sample(w[1:-1], len(w[1:-1]))) + w[-1],  # Scramble middle
-            lambda w: w[1] + w[0] + w[2:] if len(w) > 2 else w,  # Swap first two
-            lambda w: w[:-2] + w[-1] + w[-2] if len(w) > 3 else w,  # Swap last two
-        ]
-        
-        return random.choice(patterns)(word)
+        return _SIMPLE_SCRAMBLES[int(roll * len(_SIMPLE_SCRAMBLES))](word)
     
-    def _simulate_reading_disruption(self, text: str) -> str:
-        """Simulate attention/focus issues that cause reading disruption"""
-        words = text.split()
+    def _simulate_reading_disruption(self, words: list) -> bool:
+        """Simulate attention/focus issues that cause reading disruption, editing words in place
+        
+        Returns whether a disruption was applied.
+        """
         if len(words) < 3:
-            return text
+            return False
         
         # Simulate jumping around while reading (word order confusion)
         disruption_types = [
@@ -1711,21 +2187,21 @@ class AdvancedConeEffects:
         ]
         
         disruption = random.choice(disruption_types)
-        return disruption(words)
+        disruption(words)
+        return True
     
-    def _swap_adjacent_words(self, words: list) -> str:
+    def _swap_adjacent_words(self, words: list) -> None:
         """Swap two adjacent words"""
         if len(words) < 2:
-            return ' '.join(words)
+            return
         
         idx = random.randint(0, len(words) - 2)
         words[idx], words[idx + 1] = words[idx + 1], words[idx]
-        return ' '.join(words)
     
-    def _repeat_word(self, words: list) -> str:
+    def _repeat_word(self, words: list) -> None:
         """Repeat a word (working memory loop)"""
         if not words:
-            return ' '.join(words)
+            return
         
         idx = random.randint(0, len(words) - 1)
         repeat_patterns = [
@@ -1733,90 +2209,152 @@ class AdvancedConeEffects:
             f"{words[idx][:2]}-{words[idx]}",  # Stutter pattern
         ]
         words[idx] = random.choice(repeat_patterns)
-        return ' '.join(words)
     
-    def _skip_word(self, words: list) -> str:
+    def _skip_word(self, words: list) -> None:
         """Skip a word (attention lapse)"""
         if len(words) <= 2:
-            return ' '.join(words)
+            return
         
         # Skip a non-critical word (not first or last)
         idx = random.randint(1, len(words) - 2)
         words.pop(idx)
-        return ' '.join(words)
     
     def _apply_memory_errors(self, text: str) -> str:
         """Apply working memory errors (letter drops/additions)"""
-        result = []
+        if len(text) < _NUMPY_MIN_TEXT_LENGTH:
+            return self._apply_memory_errors_short(text)
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        if text.isascii():
+            alpha = _ASCII_ALPHA[codes]
+        else:
+            alpha = np.fromiter(map(str.isalpha, text), dtype=bool, count=codes.size)
+        rolls = _rng.random((3, codes.size))
+        
+        # Letter omission (more common in longer words), 5% chance
+        keep = ~(alpha & (rolls[0] < 0.05))
+        # Letter addition/doubling (less common), 3% chance on letters that were kept
+        add = alpha & keep & (rolls[1] < 0.03)
+        if keep.all() and not add.any():
+            return text
+        
+        # Double the letter 70% of the time, otherwise add a visually similar letter
+        similar = np.where(codes < 128, _SIMILAR_LETTERS[np.minimum(codes, 127)], codes)
+        extra = np.where(rolls[2] < 0.7, codes, similar)
+        # Each kept character is followed by its addition, if any, once flattened row by row
+        pairs = np.stack((codes, extra), axis=1)[np.stack((keep, add), axis=1)]
+        return pairs.tobytes().decode('utf-32-le')
+    
+    def _apply_memory_errors_short(self, text: str) -> str:
+        """_apply_memory_errors for short text, one draw per letter
         
+        The single roll splits into the 5% omission, then the 3% addition of the
+        remaining 95%, then 70/30 doubling versus a similar letter.
+        """
+        result = []
         for char in text:
-            # Letter omission (more common in longer words)
-            if char.isalpha() and random.random() < 0.05:  # 5% omission chance
+            if not char.isalpha():
+                result.append(char)
+                continue
+            roll = random.random()
+            if roll < 0.05:
                 continue  # Skip this letter
-            
             result.append(char)
-            
-            # Letter addition/doubling (less common)
-            if char.isalpha() and random.random() < 0.03:  # 3% addition chance
-                if random.random() < 0.7:
+            roll = (roll - 0.05) / 0.95
+            if roll < 0.03:
+                if roll < 0.03 * 0.7:
                     result.append(char)  # Double the letter
                 else:
-                    # Add a visually similar letter
-                    similar = {'a': 'e', 'e': 'a', 'i': 'l', 'o': 'a', 'u': 'n'}
-                    result.append(similar.get(char.lower(), char))
-        
+                    result.append(_MEMORY_SIMILAR.get(char.lower(), char))
         return ''.join(result)
     
-    def _apply_sequence_reversals(self, text: str) -> str:
-        """Apply small sequence reversals (2-3 character flips)"""
-        result = text
-        words = result.split()
-        
-        for i, word in enumerate(words):
-            if len(word) > 4 and random.random() < 0.15:  # 15% chance per word
+    def _apply_sequence_reversals(self, words: list) -> None:
+        """Apply small sequence reversals (2-3 character flips), editing words in place"""
+        # One batch of rolls per word: the gate (which also picks the length) and the start position.
+        # The 15% gate is applied in numpy, so only the words that pass it are visited in Python
+        rolls = _rng.random((len(words), 2))
+        gated = np.flatnonzero(rolls[:, 0] < 0.15)  # 15% chance per word
+        for i, (gate, start_roll) in zip(gated.tolist(), rolls[gated].tolist()):
+            word = words[i]
+            if len(word) > 4:
                 # Pick a random position to start reversal
-                start = random.randint(1, len(word) - 3)
-                length = random.choice([2, 3])  # Reverse 2-3 characters
+                start = 1 + int(start_roll * (len(word) - 3))
+                length = 2 if gate < 0.075 else 3  # Reverse 2-3 characters
                 end = min(start + length, len(word) - 1)
                 
-                # Reverse the subsequence
-                before = word[:start]
-                reversed_part = word[start:end][::-1]
-                after = word[end:]
-                words[i] = before + reversed_part + after
-        
-        return ' '.join(words)
+                # Reverse the subsequence with one negative-step slice (start >= 1, so
+                # start - 1 is a valid stop) and build the word in a single allocation
+                words[i] = f'{word[:start]}{word[end - 1:start - 1:-1]}{word[end:]}'
+
+
+# Effect names (and aliases) mapped to their AdvancedConeEffects method
+_EFFECT_METHODS = {
+    'slayspeak': 'apply_slayspeak',
+    'valley': 'apply_slayspeak',  # alias
+    'brainrot': 'apply_brainrot',
+    'genz': 'apply_brainrot',  # alias
+    'scrum': 'apply_scrum',
+    'corporate': 'apply_scrum',  # alias (keeping old corporate)
+    'linkedin': 'apply_linkedin',
+    'emoji': 'apply_linkedin',  # alias
+    'crisis': 'apply_crisis',
+    'existential': 'apply_crisis',  # alias
+    'canadian': 'apply_canadian',
+    'polite': 'apply_canadian',  # alias
+    'vsauce': 'apply_vsauce',
+    'conspiracy': 'apply_vsauce',  # alias
+    'bri': 'apply_british',
+    'british': 'apply_british',  # alias
+    'oni': 'apply_oni',
+    'censor': 'apply_oni',  # alias
+    'dyslexia': 'apply_dyslexia',
+    'dickslexia': 'apply_dyslexia',  # alias
+    'ro': 'apply_dyslexia'  # alias
+}
+
+# Shared processor for the module-level helpers. Instances hold no per-call state and the
+# spaCy model is class-level and only read after loading, so one instance serves every caller.
+_PROCESSOR = AdvancedConeEffects()
+
+# apply_many only starts worker processes for at least this many texts
+_PARALLEL_MIN_TEXTS = 256
+
+# Results of these effects are memoized per short message; log their hit rates every N calls
+_CACHED_EFFECTS = (_apply_slayspeak, _apply_brainrot, _apply_scrum, _apply_linkedin, _apply_crisis,
+                   _apply_canadian, _apply_vsauce, _apply_british)
+_CACHE_LOG_INTERVAL = 1000
+_calls_since_cache_log = 0
+
+
+def _log_cache_stats():
+    """Periodically log effect cache usage so maxsize can be tuned against real traffic"""
+    global _calls_since_cache_log
+    _calls_since_cache_log += 1
+    if _calls_since_cache_log < _CACHE_LOG_INTERVAL:
+        return
+    _calls_since_cache_log = 0
+    for effect in _CACHED_EFFECTS:
+        logging.info(f"Cone effect cache {effect.__name__}: {effect.cache_info()}")
+
+
+def _reseed_worker():
+    """Give each forked worker its own random streams"""
+    global _rng
+    _rng = np.random.default_rng()
+    random.seed()
+
+
+def _apply_chunk(method_name: str, texts: List[str]) -> List[str]:
+    """Worker entry point for AdvancedConeEffects.apply_many"""
+    method = getattr(_PROCESSOR, method_name)
+    return [method(text) for text in texts]
+
 
 # Helper function to apply effects
 def apply_cone_effect(text: str, effect: str) -> str:
     """Apply the specified cone effect to text"""
-    processor = AdvancedConeEffects()
-    
-    effect_map = {
-        'slayspeak': processor.apply_slayspeak,
-        'valley': processor.apply_slayspeak,  # alias
-        'brainrot': processor.apply_brainrot,
-        'genz': processor.apply_brainrot,  # alias
-        'scrum': processor.apply_scrum,
-        'corporate': processor.apply_scrum,  # alias (keeping old corporate)
-        'linkedin': processor.apply_linkedin,
-        'emoji': processor.apply_linkedin,  # alias
-        'crisis': processor.apply_crisis,
-        'existential': processor.apply_crisis,  # alias
-        'canadian': processor.apply_canadian,
-        'polite': processor.apply_canadian,  # alias
-        'vsauce': processor.apply_vsauce,
-        'conspiracy': processor.apply_vsauce,  # alias
-        'bri': processor.apply_british,
-        'british': processor.apply_british,  # alias
-        'oni': processor.apply_oni,
-        'censor': processor.apply_oni,  # alias
-        'dyslexia': processor.apply_dyslexia,
-        'dickslexia': processor.apply_dyslexia,  # alias
-        'ro': processor.apply_dyslexia  # alias
-    }
-    
-    if effect.lower() in effect_map:
-        return effect_map[effect.lower()](text)
-    else:
-        return text  # Return unchanged if effect not found 
\ No newline at end of file
+    method_name = _EFFECT_METHODS.get(effect.lower())
+    if method_name is None:
+        return text  # Return unchanged if effect not found
+    
+    _log_cache_stats()
+    return getattr(_PROCESSOR, method_name)(text)
@@ -4,16 +4,55 @@ Uses spaCy, NLTK, and other NLP libraries for sophisticated linguistic transform
 Optimized for Render free tier resource constraints.
 """
 
+import os
 import re
+import gzip
+import pickle
 import random
 import functools
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
+from types import MappingProxyType
+import numpy as np
+
+import word_spans
+
+try:
+    from rapidfuzz import fuzz  # rapidfuzz: C++ edit-distance ratio for quality checks
+except ImportError:
+    fuzz = None
+    import difflib
+
+try:
+    import ahocorasick  # pyahocorasick: one linear scan for all basic replacement keys
+except ImportError:
+    ahocorasick = None
 
 # Lazy imports to avoid startup delays if models aren't available
 nlp = None
 wordnet = None
 TextBlob = None
+synonym_table = None
+
+# Precomputed word -> synonyms table, written by install_models.py at deploy time
+SYNONYM_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'synonyms.pkl.gz')
+# Modification time of the table file as of the last failed load (None if it was missing)
+_synonym_table_failed_mtime = -1
+
+def _load_spacy_model(name: str):
+    """Load a spaCy pipeline trimmed to what the transformers read.
+    
+    The dependency parser is only needed here for sentence boundaries, so it is
+    excluded (never loaded) and the much lighter senter supplies doc.sents instead.
+    The lemmatizer stays: every transformer looks words up by lemma.
+    """
+    import spacy
+    model = spacy.load(name, exclude=["parser"])
+    if "senter" in model.disabled:
+        model.enable_pipe("senter")
+    return model
 
 def get_nlp():
     """Lazy load spaCy model with error handling for deployment."""
@@ -23,11 +62,11 @@ def get_nlp():
             import spacy
             # Try small model first (most likely to work on free tier)
             try:
-                nlp = spacy.load("en_core_web_sm")
+                nlp = _load_spacy_model("en_core_web_sm")
             except OSError:
                 # Fallback to basic English model if small isn't available
                 try:
-                    nlp = spacy.load("en")
+                    nlp = _load_spacy_model("en")
                 except OSError:
                     logging.warning("spaCy model not available, falling back to basic transformations")
                     nlp = False  # Mark as unavailable
@@ -36,6 +75,13 @@ def get_nlp():
             nlp = False
     return nlp if nlp is not False else None
 
+@functools.lru_cache(maxsize=None)
+def _spacy_symbols() -> Tuple[int, int, int, int]:
+    """spaCy's POS and LEMMA attribute IDs and NOUN and VERB tags, imported on first use."""
+    from spacy.attrs import LEMMA, POS
+    from spacy.parts_of_speech import NOUN, VERB
+    return POS, LEMMA, NOUN, VERB
+
 def get_wordnet():
     """Lazy load WordNet with NLTK."""
     global wordnet
@@ -45,7 +91,7 @@ def get_wordnet():
             from nltk.corpus import wordnet as wn
             # Try to access wordnet, download if needed
             try:
-                list(wn.all_synsets())[:1]  # Test access
+                wn.synsets('dog')  # Test access (touches one lemma, not every synset)
                 wordnet = wn
             except LookupError:
                 logging.info("Downloading WordNet data...")
@@ -69,41 +115,155 @@ def get_textblob():
             TextBlob = False
     return TextBlob if TextBlob is not False else None
 
+def get_synonym_table() -> Optional[Dict[str, Tuple[str, ...]]]:
+    """Lazy load the precomputed synonym table, if install_models.py has built it.
+    
+    Only a successful load is kept. A failed load is retried once the file is
+    created or rewritten, so a table built while the bot runs is picked up.
+    """
+    global synonym_table, _synonym_table_failed_mtime
+    if synonym_table is None:
+        try:
+            mtime = os.stat(SYNONYM_TABLE_PATH).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != _synonym_table_failed_mtime:
+            try:
+                with gzip.open(SYNONYM_TABLE_PATH, 'rb') as f:
+                    synonym_table = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError) as e:
+                logging.info(f"Synonym table not available, using WordNet directly: {e}")
+                _synonym_table_failed_mtime = mtime
+    return synonym_table
+
+def build_synonym_table(wn) -> Dict[str, Tuple[str, ...]]:
+    """Map every WordNet lemma name to up to five single-word synonyms, as get_synonyms picks them."""
+    synonyms = {}
+    for synset in wn.all_synsets():
+        names = [lemma.name().replace('_', ' ') for lemma in synset.lemmas()]
+        for name in names:
+            word = name.lower()
+            found = synonyms.setdefault(word, {})
+            for synonym in names:
+                if synonym.lower() != word and synonym.isalpha():
+                    found[synonym] = None
+    return {word: tuple(found)[:5] for word, found in synonyms.items() if found}
+
+@functools.lru_cache(maxsize=8192)
+def _lower(s: str) -> str:
+    """Lowercase a token, reusing the same string for repeated tokens and lemmas."""
+    return s.lower()
+
+@functools.lru_cache(maxsize=1024)
+def _word_profile(text: str) -> Tuple[int, frozenset]:
+    """Word count and lowercased word set of text from one split, cached for quality checks."""
+    words = text.split()
+    return len(words), frozenset(map(_lower, words))
+
 @functools.lru_cache(maxsize=256)
 def get_synonyms(word: str, pos: str = None) -> List[str]:
     """Get synonyms for a word, cached for performance."""
+    if pos is None:
+        # The precomputed table answers lemma names without loading NLTK; misses
+        # (inflected forms like "dogs" or "ran") still go through wn.synsets' morphy
+        table = get_synonym_table()
+        if table is not None:
+            synonyms = table.get(_lower(word))
+            if synonyms is not None:
+                return list(synonyms)
+    
     wn = get_wordnet()
     if not wn:
         return []
     
+    word_lower = _lower(word)
     synonyms = set()
     for synset in wn.synsets(word, pos=pos):
         for lemma in synset.lemmas():
             synonym = lemma.name().replace('_', ' ')
-            if synonym.lower() != word.lower() and synonym.isalpha():
+            if _lower(synonym) != word_lower and synonym.isalpha():
                 synonyms.add(synonym)
     
     return list(synonyms)[:5]  # Limit to prevent overwhelming choice
 
-def analyze_text_structure(text: str) -> Dict:
-    """Analyze text structure using spaCy if available."""
+@dataclass
+class TextStructure:
+    """Text structure from analyze_text_structure.
+    
+    Token attributes, sentences and entities are only materialized when read; the
+    transformers walk doc directly and never pay for them. Token attributes are
+    parallel columns (texts, pos_tags, lemmas, deps), one entry per token.
+    """
+    text: str
+    doc: Any = None
+    
+    @property
+    def has_spacy(self) -> bool:
+        return self.doc is not None
+    
+    @functools.cached_property
+    def _token_columns(self) -> Tuple[Tuple[str, ...], ...]:
+        if self.doc is None:
+            return tuple(self.text.split()), (), (), ()
+        columns = tuple(zip(*((token.text, token.pos_, token.lemma_, token.dep_) for token in self.doc)))
+        return columns or ((), (), (), ())
+    
+    @property
+    def texts(self) -> Tuple[str, ...]:
+        return self._token_columns[0]
+    
+    @property
+    def pos_tags(self) -> Tuple[str, ...]:
+        return self._token_columns[1]
+    
+    @property
+    def lemmas(self) -> Tuple[str, ...]:
+        return self._token_columns[2]
+    
+    @property
+    def deps(self) -> Tuple[str, ...]:
+        return self._token_columns[3]
+    
+    @functools.cached_property
+    def sentences(self) -> List[str]:
+        if self.doc is None:
+            return self.text.split('.')
+        return [sent.text for sent in self.doc.sents]
+    
+    @functools.cached_property
+    def entities(self) -> List[Tuple[str, str]]:
+        if self.doc is None:
+            return []
+        return [(ent.text, ent.label_) for ent in self.doc.ents]
+
+def _skipped_pipes(entities: bool, sentences: bool) -> List[str]:
+    """Pipeline components a caller can skip: NER without entities, senter without sentences."""
+    return ([] if entities else ["ner"]) + ([] if sentences else ["senter"])
+
+def parse_text(text: str, *, entities: bool = True, sentences: bool = True):
+    """Parse text with spaCy, or return None when it isn't available.
+    
+    Pass entities=False when the caller never reads entity types, to skip NER, and
+    sentences=False when it never reads doc.sents, to skip the senter.
+    Parses are memoized, since chat repeats short messages constantly; the returned
+    Doc is shared, so callers must only read from it.
+    """
+    return _parse_text(text, entities, sentences)
+
+@functools.lru_cache(maxsize=512)
+def _parse_text(text: str, entities: bool, sentences: bool):
+    """Memoized parse_text, always called positionally so equal requests share one entry."""
     nlp_model = get_nlp()
     if not nlp_model:
-        # Fallback basic analysis
-        return {
-            'tokens': text.split(),
-            'sentences': text.split('.'),
-            'has_spacy': False
-        }
-    
-    doc = nlp_model(text)
-    return {
-        'doc': doc,
-        'tokens': [(token.text, token.pos_, token.lemma_, token.dep_) for token in doc],
-        'sentences': [sent.text for sent in doc.sents],
-        'entities': [(ent.text, ent.label_) for ent in doc.ents],
-        'has_spacy': True
-    }
+        return None
+    
+    # One shared model serves every transformer; components are skipped per call
+    # rather than loading trimmed copies of the pipeline
+    return nlp_model(text, disable=_skipped_pipes(entities, sentences))
+
+def analyze_text_structure(text: str, entities: bool = True) -> TextStructure:
+    """Analyze text structure using spaCy if available (fallback basic analysis otherwise)."""
+    return TextStructure(text, parse_text(text, entities=entities))
 
 def calculate_text_quality(original: str, transformed: str) -> Dict[str, float]:
     """Calculate quality metrics for transformed text."""
@@ -115,22 +275,23 @@ def calculate_text_quality(original: str, transformed: str) -> Dict[str, float]:
     }
     
     try:
+        orig_len, orig_words = _word_profile(original)
+        trans_len, trans_words = _word_profile(transformed)
+        
         # Length similarity (penalize extreme changes)
-        orig_len = len(original.split())
-        trans_len = len(transformed.split())
         if orig_len > 0:
             metrics['length_similarity'] = 1.0 - abs(orig_len - trans_len) / orig_len
         
         # Word overlap (some words should remain the same)
-        orig_words = set(original.lower().split())
-        trans_words = set(transformed.lower().split())
         if orig_words:
             metrics['word_overlap'] = len(orig_words & trans_words) / len(orig_words)
         
         # Character change ratio
-        import difflib
-        matcher = difflib.SequenceMatcher(None, original, transformed)
-        metrics['character_change_ratio'] = matcher.ratio()
+        if fuzz is not None:
+            metrics['character_change_ratio'] = fuzz.ratio(original, transformed) / 100.0
+        else:
+            matcher = difflib.SequenceMatcher(None, original, transformed)
+            metrics['character_change_ratio'] = matcher.ratio()
         
         # Basic validation
         if len(transformed.strip()) == 0:
@@ -143,17 +304,150 @@ def calculate_text_quality(original: str, transformed: str) -> Dict[str, float]:
     
     return metrics
 
+def _case_code(word: str) -> int:
+    """Case pattern of word from its first two characters: 0 lower, 1 title, 2 upper."""
+    if not word or not word[0].isupper():
+        return 0
+    return 2 if len(word) == 1 or word[1].isupper() else 1
+
+def _case_forms(replacement: str) -> Tuple[str, str, str]:
+    """Replacement in each case pattern, indexed by _case_code."""
+    return (replacement, replacement.title(), replacement.upper())
+
+@functools.lru_cache(maxsize=2048)
+def _recase(replacement: str, code: int) -> str:
+    """Replacement in title (1) or upper (2) case, memoized for repeated replacements."""
+    return replacement.upper() if code == 2 else replacement.title()
+
+def _apply_case(replacement: str, original: str) -> str:
+    """Apply the case pattern of original word to replacement."""
+    # Most chat tokens are lowercase; those return without touching the cache
+    if not original or not original[0].isupper():
+        return replacement
+    return _recase(replacement, _case_code(original))
+
+# Discord mentions, custom emoji and links, none of which are words to transform
+_NON_PROSE_RE = re.compile(r'<(?:@[!&]?|#)\d+>|<a?:\w+:\d+>|https?://\S+')
+_HAS_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Shared generator so per-token randomness is drawn in batches
+_rng = np.random.default_rng()
+
+# Text already ending in one of these gets no added ending
+_SENTENCE_END = ('.', '!', '?')
+
+# Picks drawn per phrase tuple at a time; phrases are module constants, so keyed by id
+_PICK_BATCH = 128
+_pick_buffers: Dict[int, deque] = {}
+
+def _pick(phrases: Tuple[str, ...]) -> str:
+    """random.choice(phrases), served from a batch of pre-drawn picks."""
+    buffer = _pick_buffers.get(id(phrases))
+    if not buffer:
+        buffer = _pick_buffers[id(phrases)] = deque(random.choices(phrases, k=_PICK_BATCH))
+    return buffer.popleft()
+
+# Keys the automaton can match: \b behaves the same at both ends of these
+_WORD_EDGES_RE = re.compile(r'\w(?:.*\w)?', re.DOTALL)
+
+def _compile_word_replacer(table: Dict[str, str]) -> Callable[[str], str]:
+    """Compile a word replacement table into a single-pass, case-preserving replacer.
+    
+    Keys are matched case-insensitively as whole words in one scan; where two keys
+    match at the same place the earlier one in the table wins, as it did when keys
+    were replaced one by one (Shakespeare 'you' before "you're" gives "thou're").
+    That loop also let a later key rewrite an earlier key's replacement (pirate
+    'gold' -> 'treasure' -> 'booty'), so those chains are resolved here once to
+    keep the same output.
+    """
+    alternation = '|'.join(re.escape(key) for key in table)
+    pattern = re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+    order = {key: i for i, key in enumerate(table)}
+    
+    resolved = {}
+    for i, key in reversed(list(enumerate(table))):
+        # Only keys after this one ever saw its replacement; they are already resolved
+        resolved[key] = pattern.sub(
+            lambda match: resolved[match.group(0)] if order.get(match.group(0), -1) > i else match.group(0),
+            table[key])
+    
+    forms = {key: _case_forms(replacement) for key, replacement in resolved.items()}
+    
+    def replace(match: re.Match) -> str:
+        word = match.group(0)
+        return forms[_lower(word)][_case_code(word)]
+    
+    replace_all = functools.partial(pattern.sub, replace)
+    # The automaton's boundary check below assumes every key starts and ends with a word character
+    if ahocorasick is None or not all(_WORD_EDGES_RE.fullmatch(key) for key in table):
+        return replace_all
+    
+    automaton = ahocorasick.Automaton()
+    for key in table:
+        automaton.add_word(key.lower(), key.lower())
+    automaton.make_automaton()
+    
+    def replace_words(text: str) -> str:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed offsets (U+0130); let the regex handle this message
+            return replace_all(text)
+        
+        candidates = []
+        padded = word_spans.pad(text)
+        for end, key in automaton.iter(lowered):
+            end += 1
+            start = end - len(key)
+            if word_spans.is_whole_word(padded, start, end):
+                # Earlier keys win at the same start, as in the alternation
+                candidates.append((start, order[key], end, key))
+        if not candidates:
+            return text
+        
+        parts = []
+        last = 0
+        for start, end, key in word_spans.leftmost_spans(candidates):
+            parts.append(text[last:start])
+            parts.append(forms[key][_case_code(text[start:end])])
+            last = end
+        parts.append(text[last:])
+        return ''.join(parts)
+    
+    return replace_words
+
 class AdvancedTransformer:
     """Base class for sophisticated text transformations."""
     
+    _apply_case = staticmethod(_apply_case)
+    
+    # Whether _advanced_transform reads entity types; NER is skipped when False
+    uses_entities = True
+    
     def __init__(self):
-        self.cache = {}  # Simple caching for repeated transformations
         self.quality_threshold = 0.3  # Minimum quality score
     
     def transform(self, text: str) -> str:
         """Main transformation method - override in subclasses."""
         return text
     
+    def transform_batch(self, texts: List[str], batch_size: int = 64, n_process: int = 1) -> List[str]:
+        """Transform a burst of messages, running spaCy over them in one nlp.pipe call.
+        
+        n_process > 1 parses in worker processes, each holding its own copy of the
+        model, so it only pays off for large offline batches.
+        """
+        nlp_model = get_nlp()
+        if not nlp_model:
+            return [self.transform(text) for text in texts]
+        
+        docs = nlp_model.pipe(texts, batch_size=batch_size, n_process=n_process,
+                              disable=_skipped_pipes(self.uses_entities, sentences=False))
+        return [self._advanced_transform(doc) for doc in docs]
+    
+    def _advanced_transform(self, doc) -> str:
+        """Transform an already-parsed spaCy Doc - override in subclasses."""
+        return doc.text
+    
     def validate_transformation(self, original: str, transformed: str) -> bool:
         """Validate that transformation meets quality standards."""
         if not transformed or transformed.strip() == "":
@@ -177,10 +471,14 @@ class AdvancedTransformer:
         return True
     
     def cached_transform(self, text: str) -> str:
-        """Cached version of transform for performance."""
-        if text in self.cache:
-            return self.cache[text]
-        
+        """Cached version of transform for performance (shared by all instances of a class)."""
+        # Whitespace, pings, links and emoji alone have nothing to transform
+        if not _HAS_LETTER_RE.search(_NON_PROSE_RE.sub('', text)):
+            return text
+        return _cached_transform(type(self), text)
+    
+    def _validated_transform(self, text: str) -> str:
+        """Transform, falling back when the result fails the quality check."""
         result = self.transform(text)
         
         # Validate transformation quality
@@ -189,11 +487,6 @@ class AdvancedTransformer:
             # Return basic transformation or original
             result = self._fallback_transform(text)
         
-        # Keep cache size manageable
-        if len(self.cache) > 100:
-            self.cache.clear()
-        
-        self.cache[text] = result
         return result
     
     def _fallback_transform(self, text: str) -> str:
@@ -201,105 +494,128 @@ class AdvancedTransformer:
         # Override in subclasses for effect-specific fallback
         return text
 
+# Greatly expanded grammatical transformations
+_SHAKESPEARE_VERBS = MappingProxyType({
+    # Existing verbs
+    'are': 'art', 'is': 'ist', 'have': 'hast', 'do': 'dost',
+    'will': 'wilt', 'shall': 'shalt', 'can': 'canst', 'may': 'mayst',
+    # Additional verbs
+    'know': 'knowest', 'go': 'goest', 'come': 'comest', 'see': 'seest',
+    'hear': 'hearest', 'speak': 'speakest', 'say': 'sayest', 'tell': 'tellest',
+    'give': 'givest', 'take': 'takest', 'make': 'makest', 'get': 'gettest',
+    'want': 'wantest', 'need': 'needest', 'love': 'lovest', 'hate': 'hatest',
+    'help': 'helpest', 'find': 'findest', 'think': 'thinkest', 'feel': 'feelest',
+    'believe': 'believest', 'understand': 'understandest', 'remember': 'rememberest'
+})
+
+_SHAKESPEARE_PRONOUNS = MappingProxyType({
+    'you': 'thou', 'your': 'thy', 'yours': 'thine',
+    'yourself': 'thyself', 'you\'re': 'thou art', 'you\'ve': 'thou hast',
+    'you\'ll': 'thou wilt', 'you\'d': 'thou wouldst'
+})
+
+# Massively expanded vocabulary - hundreds of words
+_SHAKESPEARE_VOCAB = MappingProxyType({
+    # Time and frequency
+    'because': 'for', 'before': 'ere', 'often': 'oft', 'always': 'ever',
+    'never': 'ne\'er', 'forever': 'for aye', 'again': 'once more',
+    'when': 'whence', 'while': 'whilst', 'until': 'till', 'since': 'sith',
+    'now': 'anon', 'soon': 'anon', 'today': 'this day', 'tonight': 'this eve',
+    'yesterday': 'yesternight', 'tomorrow': 'on the morrow',
+
+    # Places and directions
+    'between': 'betwixt', 'nothing': 'naught', 'here': 'hither',
+    'there': 'thither', 'where': 'whither', 'everywhere': 'everywither',
+    'somewhere': 'somewhither', 'anywhere': 'anywhither', 'home': 'hearth',
+    'inside': 'within', 'outside': 'without', 'above': 'aloft',
+    'below': 'beneath', 'near': 'nigh', 'far': 'afar',
+
+    # Actions and states
+    'think': 'methinks', 'said': 'quoth', 'look': 'behold', 'see': 'espy',
+    'listen': 'hearken', 'hear': 'hark', 'call': 'cry', 'shout': 'proclaim',
+    'whisper': 'murmur', 'speak': 'discourse', 'talk': 'converse',
+    'walk': 'stroll', 'run': 'hasten', 'hurry': 'make haste', 'stop': 'cease',
+    'begin': 'commence', 'end': 'conclude', 'finish': 'complete',
+    'start': 'embark', 'continue': 'proceed', 'return': 'retreat',
+
+    # Emotions and feelings
+    'happy': 'merry', 'sad': 'melancholy', 'angry': 'wrathful', 'mad': 'wrathful',
+    'excited': 'elated', 'scared': 'afrighted', 'worried': 'troubled',
+    'surprised': 'amazed', 'confused': 'perplexed', 'tired': 'weary',
+    'brave': 'valiant', 'coward': 'craven', 'beautiful': 'fair',
+    'ugly': 'foul', 'smart': 'wise', 'stupid': 'foolish',
+
+    # Common objects and concepts
+    'clothes': 'garments', 'dress': 'gown', 'hat': 'cap', 'shoes': 'slippers',
+    'house': 'dwelling', 'room': 'chamber', 'bed': 'couch', 'door': 'portal',
+    'window': 'casement', 'food': 'victuals', 'drink': 'beverage',
+    'money': 'coin', 'work': 'labour', 'job': 'occupation', 'business': 'affairs',
+
+    # People and relationships
+    'person': 'soul', 'people': 'folk', 'man': 'gentleman', 'woman': 'lady',
+    'girl': 'maiden', 'boy': 'lad', 'child': 'youngling', 'baby': 'babe',
+    'friend': 'companion', 'enemy': 'foe', 'stranger': 'unknown',
+    'family': 'kin', 'mother': 'dame', 'father': 'sire', 'sister': 'sibling',
+
+    # Intensifiers and qualifiers
+    'very': 'most', 'really': 'verily', 'truly': 'forsooth', 'certainly': 'certes',
+    'maybe': 'mayhap', 'perhaps': 'perchance', 'probably': 'belike',
+    'definitely': 'assuredly', 'absolutely': 'verily', 'quite': 'rather',
+    'completely': 'wholly', 'totally': 'entirely', 'almost': 'nigh',
+
+    # Questions and responses
+    'what': 'what ho', 'why': 'wherefore', 'how': 'by what means',
+    'yes': 'aye', 'no': 'nay', 'okay': 'very well', 'alright': 'well then',
+    'thanks': 'grammercy', 'please': 'prithee', 'excuse me': 'pardon',
+    'sorry': 'forgive me', 'hello': 'well met', 'goodbye': 'fare thee well',
+
+    # Misc common words
+    'thing': 'matter', 'stuff': 'things', 'great': 'grand', 'good': 'fair',
+    'bad': 'ill', 'wrong': 'amiss', 'right': 'just', 'weird': 'strange',
+    'cool': 'fair', 'awesome': 'wondrous', 'terrible': 'dreadful',
+    'amazing': 'marvellous', 'interesting': 'curious', 'boring': 'tedious'
+})
+
+_SHAKESPEARE_ENDINGS = (
+    ' prithee!', ' good sir!', ' fair maiden!', ' marry!', 
+    ' forsooth!', ' hark!', ' verily!', ' marry, \'tis true!',
+    ' by my troth!', ' odds bodkins!', ' marry come up!',
+    ' i\' faith!', ' marry, \'tis so!', ' by\'r lady!', ' grammercy!'
+)
+
+def _build_shakespeare_lookup() -> Dict[str, Dict[str, Tuple[str, Tuple[str, str, str]]]]:
+    """Single lookup for _advanced_transform: lemma -> {pos: (category, case forms)}."""
+    lookup = {}
+    for category, table, tags in (('PRON', _SHAKESPEARE_PRONOUNS, ('PRON',)),
+                                  ('VERB', _SHAKESPEARE_VERBS, ('VERB',)),
+                                  ('VOCAB', _SHAKESPEARE_VOCAB, ('NOUN', 'ADJ', 'ADV'))):
+        for lemma, replacement in table.items():
+            for pos in tags:
+                lookup.setdefault(lemma, {})[pos] = (category, _case_forms(replacement))
+    return lookup
+
+_SHAKESPEARE_LOOKUP = _build_shakespeare_lookup()
+
+# Single-pass word replacer for _basic_transform, shared by every instance
+_SHAKESPEARE_REPLACER = _compile_word_replacer({**_SHAKESPEARE_PRONOUNS, **_SHAKESPEARE_VERBS, **_SHAKESPEARE_VOCAB})
+
 class AdvancedShakespeareTransformer(AdvancedTransformer):
     """Sophisticated Shakespearean/Early Modern English transformation."""
     
-    def __init__(self):
-        super().__init__()
-        # Greatly expanded grammatical transformations
-        self.verb_transforms = {
-            # Existing verbs
-            'are': 'art', 'is': 'ist', 'have': 'hast', 'do': 'dost',
-            'will': 'wilt', 'shall': 'shalt', 'can': 'canst', 'may': 'mayst',
-            # Additional verbs
-            'know': 'knowest', 'go': 'goest', 'come': 'comest', 'see': 'seest',
-            'hear': 'hearest', 'speak': 'speakest', 'say': 'sayest', 'tell': 'tellest',
-            'give': 'givest', 'take': 'takest', 'make': 'makest', 'get': 'gettest',
-            'want': 'wantest', 'need': 'needest', 'love': 'lovest', 'hate': 'hatest',
-            'help': 'helpest', 'find': 'findest', 'think': 'thinkest', 'feel': 'feelest',
-            'believe': 'believest', 'understand': 'understandest', 'remember': 'rememberest'
-        }
-        
-        self.pronoun_transforms = {
-            'you': 'thou', 'your': 'thy', 'yours': 'thine',
-            'yourself': 'thyself', 'you\'re': 'thou art', 'you\'ve': 'thou hast',
-            'you\'ll': 'thou wilt', 'you\'d': 'thou wouldst'
-        }
-        
-        # Massively expanded vocabulary - hundreds of words
-        self.vocab_replacements = {
-            # Time and frequency
-            'because': 'for', 'before': 'ere', 'often': 'oft', 'always': 'ever',
-            'never': 'ne\'er', 'forever': 'for aye', 'again': 'once more',
-            'when': 'whence', 'while': 'whilst', 'until': 'till', 'since': 'sith',
-            'now': 'anon', 'soon': 'anon', 'today': 'this day', 'tonight': 'this eve',
-            'yesterday': 'yesternight', 'tomorrow': 'on the morrow',
-            
-            # Places and directions
-            'between': 'betwixt', 'nothing': 'naught', 'here': 'hither',
-            'there': 'thither', 'where': 'whither', 'everywhere': 'everywither',
-            'somewhere': 'somewhither', 'anywhere': 'anywhither', 'home': 'hearth',
-            'inside': 'within', 'outside': 'without', 'above': 'aloft',
-            'below': 'beneath', 'near': 'nigh', 'far': 'afar',
-            
-            # Actions and states
-            'think': 'methinks', 'said': 'quoth', 'look': 'behold', 'see': 'espy',
-            'listen': 'hearken', 'hear': 'hark', 'call': 'cry', 'shout': 'proclaim',
-            'whisper': 'murmur', 'speak': 'discourse', 'talk': 'converse',
-            'walk': 'stroll', 'run': 'hasten', 'hurry': 'make haste', 'stop': 'cease',
-            'begin': 'commence', 'end': 'conclude', 'finish': 'complete',
-            'start': 'embark', 'continue': 'proceed', 'return': 'retreat',
-            
-            # Emotions and feelings
-            'happy': 'merry', 'sad': 'melancholy', 'angry': 'wrathful', 'mad': 'wrathful',
-            'excited': 'elated', 'scared': 'afrighted', 'worried': 'troubled',
-            'surprised': 'amazed', 'confused': 'perplexed', 'tired': 'weary',
-            'brave': 'valiant', 'coward': 'craven', 'beautiful': 'fair',
-            'ugly': 'foul', 'smart': 'wise', 'stupid': 'foolish',
-            
-            # Common objects and concepts
-            'clothes': 'garments', 'dress': 'gown', 'hat': 'cap', 'shoes': 'slippers',
-            'house': 'dwelling', 'room': 'chamber', 'bed': 'couch', 'door': 'portal',
-            'window': 'casement', 'food': 'victuals', 'drink': 'beverage',
-            'money': 'coin', 'work': 'labour', 'job': 'occupation', 'business': 'affairs',
-            
-            # People and relationships
-            'person': 'soul', 'people': 'folk', 'man': 'gentleman', 'woman': 'lady',
-            'girl': 'maiden', 'boy': 'lad', 'child': 'youngling', 'baby': 'babe',
-            'friend': 'companion', 'enemy': 'foe', 'stranger': 'unknown',
-            'family': 'kin', 'mother': 'dame', 'father': 'sire', 'sister': 'sibling',
-            
-            # Intensifiers and qualifiers
-            'very': 'most', 'really': 'verily', 'truly': 'forsooth', 'certainly': 'certes',
-            'maybe': 'mayhap', 'perhaps': 'perchance', 'probably': 'belike',
-            'definitely': 'assuredly', 'absolutely': 'verily', 'quite': 'rather',
-            'completely': 'wholly', 'totally': 'entirely', 'almost': 'nigh',
-            
-            # Questions and responses
-            'what': 'what ho', 'why': 'wherefore', 'how': 'by what means',
-            'yes': 'aye', 'no': 'nay', 'okay': 'very well', 'alright': 'well then',
-            'thanks': 'grammercy', 'please': 'prithee', 'excuse me': 'pardon',
-            'sorry': 'forgive me', 'hello': 'well met', 'goodbye': 'fare thee well',
-            
-            # Misc common words
-            'thing': 'matter', 'stuff': 'things', 'great': 'grand', 'good': 'fair',
-            'bad': 'ill', 'wrong': 'amiss', 'right': 'just', 'weird': 'strange',
-            'cool': 'fair', 'awesome': 'wondrous', 'terrible': 'dreadful',
-            'amazing': 'marvellous', 'interesting': 'curious', 'boring': 'tedious'
-        }
-        
-        self.endings = [
-            ' prithee!', ' good sir!', ' fair maiden!', ' marry!', 
-            ' forsooth!', ' hark!', ' verily!', ' marry, \'tis true!',
-            ' by my troth!', ' odds bodkins!', ' marry come up!',
-            ' i\' faith!', ' marry, \'tis so!', ' by\'r lady!', ' grammercy!'
-        ]
+    uses_entities = False
+    
+    verb_transforms = _SHAKESPEARE_VERBS
+    pronoun_transforms = _SHAKESPEARE_PRONOUNS
+    vocab_replacements = _SHAKESPEARE_VOCAB
+    endings = _SHAKESPEARE_ENDINGS
+    _lookup = _SHAKESPEARE_LOOKUP
+    _replace_basic_words = staticmethod(_SHAKESPEARE_REPLACER)
     
     def transform(self, text: str) -> str:
-        structure = analyze_text_structure(text)
+        doc = parse_text(text, entities=self.uses_entities, sentences=False)
         
-        if structure['has_spacy']:
-            return self._advanced_transform(structure)
+        if doc is not None:
+            return self._advanced_transform(doc)
         else:
             return self._basic_transform(text)
     
@@ -307,197 +623,190 @@ class AdvancedShakespeareTransformer(AdvancedTransformer):
         """Fallback to basic Shakespeare transformation."""
         return self._basic_transform(text)
     
-    def _advanced_transform(self, structure: Dict) -> str:
+    def _advanced_transform(self, doc) -> str:
         """Use spaCy analysis for grammatically aware transformation."""
-        doc = structure['doc']
         transformed_tokens = []
         
         for token in doc:
             word = token.text
-            lemma = token.lemma_.lower()
-            pos = token.pos_
             
-            # Handle different parts of speech appropriately
-            if pos == 'PRON' and lemma in self.pronoun_transforms:
-                # Pronoun transformation with case handling
-                if word.isupper():
-                    transformed_tokens.append(self.pronoun_transforms[lemma].upper())
-                elif word.istitle():
-                    transformed_tokens.append(self.pronoun_transforms[lemma].title())
-                else:
-                    transformed_tokens.append(self.pronoun_transforms[lemma])
-                    
-            elif pos == 'VERB' and lemma in self.verb_transforms:
+            # Misses (most tokens) cost one dict lookup; hits branch once on category
+            hit = self._lookup.get(_lower(token.lemma_))
+            if hit is not None:
+                hit = hit.get(token.pos_)
+            
+            if hit is None:
+                new_word = word
+                
+            elif hit[0] == 'VERB':
                 # Verb transformation (more complex - could analyze tense/person)
-                if token.tag_ in ['VBZ', 'VBP']:  # Present tense
-                    transformed_tokens.append(self.verb_transforms[lemma])
+                if token.tag_ in ('VBZ', 'VBP'):  # Present tense
+                    new_word = hit[1][0]
                 else:
-                    transformed_tokens.append(word)
-                    
-            elif pos in ['NOUN', 'ADJ', 'ADV'] and lemma in self.vocab_replacements:
-                # Vocabulary replacement with case preservation
-                replacement = self.vocab_replacements[lemma]
-                if word.isupper():
-                    transformed_tokens.append(replacement.upper())
-                elif word.istitle():
-                    transformed_tokens.append(replacement.title())
-                else:
-                    transformed_tokens.append(replacement)
+                    new_word = word
                     
             else:
-                transformed_tokens.append(word)
+                # Pronoun or vocabulary replacement with case preservation
+                new_word = hit[1][_case_code(word)]
             
-            # Add space after token unless it's punctuation
-            if not token.is_punct and token.i < len(doc) - 1:
-                transformed_tokens.append(' ')
+            # Keep the token's original trailing whitespace
+            transformed_tokens.append(new_word + token.whitespace_)
         
         result = ''.join(transformed_tokens)
         
         # Add appropriate ending
-        if not any(result.endswith(punct) for punct in '.!?'):
-            result += random.choice(self.endings)
+        if not result.endswith(_SENTENCE_END):
+            result += _pick(self.endings)
         
         return result
     
     def _basic_transform(self, text: str) -> str:
         """Fallback transformation without spaCy."""
-        # Apply basic word replacements
-        for old, new in {**self.pronoun_transforms, **self.verb_transforms, **self.vocab_replacements}.items():
-            # Case-sensitive replacement
-            text = re.sub(r'\b' + re.escape(old) + r'\b', new, text, flags=re.IGNORECASE)
-            text = re.sub(r'\b' + re.escape(old.title()) + r'\b', new.title(), text)
+        # Apply basic word replacements (case-preserving)
+        text = self._replace_basic_words(text)
         
-        if not any(text.endswith(punct) for punct in '.!?'):
-            text += random.choice(self.endings)
+        if not text.endswith(_SENTENCE_END):
+            text += _pick(self.endings)
         
         return text
 
+# Greatly expanded basic replacements
+_PIRATE_BASIC = MappingProxyType({
+    'you': 'ye', 'your': 'yer', 'my': 'me', 'over': "o'er",
+    'for': 'fer', 'of': "o'", 'between': 'betwixt', 'to': 'ter',
+    'the': 'th\'', 'them': 'em', 'they': 'they be', 'their': 'theirr',
+    'there': 'thar', 'here': 'har', 'where': 'whar', 'when': 'wen',
+    'what': 'wot', 'who': 'who be', 'how': 'har', 'why': 'why be',
+    'with': 'wit\'', 'from': 'fram', 'about': 'aboot', 'after': 'arter',
+    'before': 'afore', 'around': 'aroond', 'through': 'thru',
+    'because': 'cause', 'without': 'withooot', 'until': 'till'
+})
+
+# Massively expanded pirate vocabulary - hundreds of maritime and pirate terms
+_PIRATE_VOCAB = MappingProxyType({
+    # Basic replacements from before
+    'money': 'doubloons', 'gold': 'treasure', 'steal': 'plunder',
+    'fight': 'battle', 'ship': 'vessel', 'captain': 'cap\'n',
+    'friend': 'matey', 'enemy': 'scurvy dog', 'drink': 'grog',
+    'food': 'grub', 'bathroom': 'head', 'kitchen': 'galley',
+
+    # Maritime terms
+    'boat': 'vessel', 'sail': 'hoist the colors', 'ocean': 'briny deep',
+    'sea': 'seven seas', 'water': 'briny', 'wave': 'swell', 'storm': 'tempest',
+    'wind': 'gale', 'rope': 'line', 'flag': 'colors', 'anchor': 'hook',
+    'dock': 'pier', 'port': 'harbor', 'island': 'isle', 'map': 'chart',
+    'compass': 'navigation', 'telescope': 'spyglass', 'wheel': 'helm',
+
+    # Pirate life
+    'treasure': 'booty', 'chest': 'strongbox', 'sword': 'cutlass',
+    'gun': 'pistol', 'knife': 'dirk', 'hat': 'tricorn', 'coat': 'greatcoat',
+    'boots': 'sea boots', 'shirt': 'tunic', 'pants': 'breeches',
+    'belt': 'sash', 'jewelry': 'baubles', 'ring': 'band',
+
+    # Actions and verbs
+    'walk': 'swagger', 'run': 'scurry', 'climb': 'scale the rigging',
+    'jump': 'leap', 'fall': 'tumble', 'grab': 'snatch', 'hold': 'grip',
+    'throw': 'hurl', 'catch': 'snare', 'hide': 'stash', 'find': 'discover',
+    'search': 'hunt', 'look': 'spy', 'watch': 'keep watch', 'listen': 'hark',
+    'speak': 'parley', 'shout': 'bellow', 'whisper': 'mutter',
+    'laugh': 'chortle', 'cry': 'weep', 'sing': 'shanty', 'dance': 'jig',
+
+    # People and relationships
+    'person': 'soul', 'people': 'crew', 'group': 'crew', 'team': 'crew',
+    'leader': 'captain', 'boss': 'commodore', 'worker': 'deck hand',
+    'stranger': 'landlubber', 'coward': 'yellow belly', 'hero': 'brave soul',
+    'thief': 'scallywag', 'liar': 'bilge rat', 'fool': 'scurvy cur',
+    'woman': 'lass', 'man': 'lad', 'girl': 'young lass', 'boy': 'cabin boy',
+    'mother': 'dear mother', 'father': 'old salt', 'child': 'young one',
+
+    # Places and locations
+    'home': 'port', 'house': 'quarters', 'room': 'cabin', 'bed': 'hammock',
+    'floor': 'deck', 'ceiling': 'overhead', 'wall': 'bulkhead',
+    'door': 'hatch', 'window': 'porthole', 'stairs': 'ladder',
+    'basement': 'bilge', 'attic': 'crow\'s nest', 'garage': 'dry dock',
+    'yard': 'deck', 'street': 'waterfront', 'city': 'port town',
+    'country': 'waters', 'world': 'seven seas',
+
+    # Food and drink
+    'beer': 'ale', 'wine': 'rum', 'water': 'fresh water', 'coffee': 'grog',
+    'tea': 'brew', 'soup': 'stew', 'bread': 'hardtack', 'meat': 'salt pork',
+    'fish': 'catch of the day', 'fruit': 'provisions', 'vegetables': 'ship\'s stores',
+    'meal': 'mess', 'dinner': 'supper', 'breakfast': 'morning mess',
+
+    # Emotions and states
+    'happy': 'merry', 'sad': 'down in the doldrums', 'angry': 'steaming mad',
+    'excited': 'fired up', 'tired': 'dog tired', 'sick': 'under the weather',
+    'healthy': 'shipshape', 'strong': 'hearty', 'weak': 'scurvy',
+    'brave': 'bold', 'scared': 'yellow', 'worried': 'troubled',
+    'surprised': 'taken aback', 'confused': 'all at sea',
+
+    # Common objects
+    'car': 'land ship', 'truck': 'cargo wagon', 'bike': 'two-wheeler',
+    'computer': 'thinking box', 'phone': 'speaking device', 'book': 'tome',
+    'pen': 'quill', 'paper': 'parchment', 'bag': 'sea bag', 'box': 'crate',
+    'bottle': 'flask', 'cup': 'mug', 'plate': 'mess tin', 'spoon': 'ladle',
+
+    # Time
+    'day': 'sun', 'night': 'dark watch', 'morning': 'dawn watch',
+    'evening': 'dusk', 'hour': 'bell', 'minute': 'moment', 'second': 'tick',
+    'week': 'seven suns', 'month': 'moon cycle', 'year': 'voyage',
+    'time': 'chronometer', 'clock': 'timepiece', 'watch': 'pocket piece',
+
+    # Weather and nature
+    'sun': 'blazing orb', 'moon': 'night lantern', 'star': 'navigation point',
+    'cloud': 'sky sail', 'rain': 'squall', 'snow': 'white caps',
+    'fire': 'flame', 'ice': 'frozen bilge', 'rock': 'reef', 'sand': 'shore',
+    'tree': 'mast timber', 'flower': 'shore bloom', 'grass': 'land weed'
+})
+
+_PIRATE_VERB_ENDINGS = MappingProxyType({
+    'ing': "in'", 'ed': "ed"  # Transform -ing endings
+})
+
+# Expanded pirate interjections and exclamations
+_PIRATE_INTERJECTIONS = (
+    'Arrr!', 'Avast!', 'Shiver me timbers!', 'Yo ho ho!',
+    'Batten down the hatches!', 'All hands on deck!', 'Ahoy there!',
+    'Blimey!', 'Splice the mainbrace!', 'Dead men tell no tales!',
+    'Fifteen men on a dead man\'s chest!', 'Hoist the colors!',
+    'Weigh anchor!', 'Land ho!', 'By Blackbeard\'s ghost!',
+    'Scuttle me bones!', 'Blast ye!', 'Thunder and tarnation!',
+    'By the powers!', 'Sink me!', 'Heave ho!', 'Avast ye landlubbers!'
+)
+
+# Expanded pirate endings
+_PIRATE_ENDINGS = (
+    ' arrr!', ' ye scurvy dog!', ' shiver me timbers!', 
+    ' ahoy matey!', ' yo ho ho!', ' savvy?', ' me hearty!',
+    ' ye landlubber!', ' avast!', ' by thunder!', ' ye scallywag!',
+    ' or I\'ll make ye walk the plank!', ' ye bilge rat!',
+    ' me bucko!', ' ye sea dog!', ' or ye\'ll be feeding the fishes!',
+    ' blimey!', ' splice the mainbrace!', ' batten down the hatches!',
+    ' ye barnacle-bottom!', ' me fine buccaneer!', ' savvy me meaning?',
+    ' or face Davy Jones\' locker!', ' ye salty sea bass!'
+)
+
+# Titles given to people the NER tags as PERSON
+_PIRATE_TITLES = ('Captain', 'Admiral', 'Commodore', 'First Mate')
+
+# Single-pass word replacer for _basic_transform, shared by every instance
+_PIRATE_REPLACER = _compile_word_replacer({**_PIRATE_BASIC, **_PIRATE_VOCAB})
+
 class AdvancedPirateTransformer(AdvancedTransformer):
     """Context-aware pirate speak transformation."""
     
-    def __init__(self):
-        super().__init__()
-        # Greatly expanded basic replacements
-        self.basic_replacements = {
-            'you': 'ye', 'your': 'yer', 'my': 'me', 'over': "o'er",
-            'for': 'fer', 'of': "o'", 'between': 'betwixt', 'to': 'ter',
-            'the': 'th\'', 'them': 'em', 'they': 'they be', 'their': 'theirr',
-            'there': 'thar', 'here': 'har', 'where': 'whar', 'when': 'wen',
-            'what': 'wot', 'who': 'who be', 'how': 'har', 'why': 'why be',
-            'with': 'wit\'', 'from': 'fram', 'about': 'aboot', 'after': 'arter',
-            'before': 'afore', 'around': 'aroond', 'through': 'thru',
-            'because': 'cause', 'without': 'withooot', 'until': 'till'
-        }
-        
-        # Massively expanded pirate vocabulary - hundreds of maritime and pirate terms
-        self.pirate_vocab = {
-            # Basic replacements from before
-            'money': 'doubloons', 'gold': 'treasure', 'steal': 'plunder',
-            'fight': 'battle', 'ship': 'vessel', 'captain': 'cap\'n',
-            'friend': 'matey', 'enemy': 'scurvy dog', 'drink': 'grog',
-            'food': 'grub', 'bathroom': 'head', 'kitchen': 'galley',
-            
-            # Maritime terms
-            'boat': 'vessel', 'sail': 'hoist the colors', 'ocean': 'briny deep',
-            'sea': 'seven seas', 'water': 'briny', 'wave': 'swell', 'storm': 'tempest',
-            'wind': 'gale', 'rope': 'line', 'flag': 'colors', 'anchor': 'hook',
-            'dock': 'pier', 'port': 'harbor', 'island': 'isle', 'map': 'chart',
-            'compass': 'navigation', 'telescope': 'spyglass', 'wheel': 'helm',
-            
-            # Pirate life
-            'treasure': 'booty', 'chest': 'strongbox', 'sword': 'cutlass',
-            'gun': 'pistol', 'knife': 'dirk', 'hat': 'tricorn', 'coat': 'greatcoat',
-            'boots': 'sea boots', 'shirt': 'tunic', 'pants': 'breeches',
-            'belt': 'sash', 'jewelry': 'baubles', 'ring': 'band',
-            
-            # Actions and verbs
-            'walk': 'swagger', 'run': 'scurry', 'climb': 'scale the rigging',
-            'jump': 'leap', 'fall': 'tumble', 'grab': 'snatch', 'hold': 'grip',
-            'throw': 'hurl', 'catch': 'snare', 'hide': 'stash', 'find': 'discover',
-            'search': 'hunt', 'look': 'spy', 'watch': 'keep watch', 'listen': 'hark',
-            'speak': 'parley', 'shout': 'bellow', 'whisper': 'mutter',
-            'laugh': 'chortle', 'cry': 'weep', 'sing': 'shanty', 'dance': 'jig',
-            
-            # People and relationships
-            'person': 'soul', 'people': 'crew', 'group': 'crew', 'team': 'crew',
-            'leader': 'captain', 'boss': 'commodore', 'worker': 'deck hand',
-            'stranger': 'landlubber', 'coward': 'yellow belly', 'hero': 'brave soul',
-            'thief': 'scallywag', 'liar': 'bilge rat', 'fool': 'scurvy cur',
-            'woman': 'lass', 'man': 'lad', 'girl': 'young lass', 'boy': 'cabin boy',
-            'mother': 'dear mother', 'father': 'old salt', 'child': 'young one',
-            
-            # Places and locations
-            'home': 'port', 'house': 'quarters', 'room': 'cabin', 'bed': 'hammock',
-            'floor': 'deck', 'ceiling': 'overhead', 'wall': 'bulkhead',
-            'door': 'hatch', 'window': 'porthole', 'stairs': 'ladder',
-            'basement': 'bilge', 'attic': 'crow\'s nest', 'garage': 'dry dock',
-            'yard': 'deck', 'street': 'waterfront', 'city': 'port town',
-            'country': 'waters', 'world': 'seven seas',
-            
-            # Food and drink
-            'beer': 'ale', 'wine': 'rum', 'water': 'fresh water', 'coffee': 'grog',
-            'tea': 'brew', 'soup': 'stew', 'bread': 'hardtack', 'meat': 'salt pork',
-            'fish': 'catch of the day', 'fruit': 'provisions', 'vegetables': 'ship\'s stores',
-            'meal': 'mess', 'dinner': 'supper', 'breakfast': 'morning mess',
-            
-            # Emotions and states
-            'happy': 'merry', 'sad': 'down in the doldrums', 'angry': 'steaming mad',
-            'excited': 'fired up', 'tired': 'dog tired', 'sick': 'under the weather',
-            'healthy': 'shipshape', 'strong': 'hearty', 'weak': 'scurvy',
-            'brave': 'bold', 'scared': 'yellow', 'worried': 'troubled',
-            'surprised': 'taken aback', 'confused': 'all at sea',
-            
-            # Common objects
-            'car': 'land ship', 'truck': 'cargo wagon', 'bike': 'two-wheeler',
-            'computer': 'thinking box', 'phone': 'speaking device', 'book': 'tome',
-            'pen': 'quill', 'paper': 'parchment', 'bag': 'sea bag', 'box': 'crate',
-            'bottle': 'flask', 'cup': 'mug', 'plate': 'mess tin', 'spoon': 'ladle',
-            
-            # Time
-            'day': 'sun', 'night': 'dark watch', 'morning': 'dawn watch',
-            'evening': 'dusk', 'hour': 'bell', 'minute': 'moment', 'second': 'tick',
-            'week': 'seven suns', 'month': 'moon cycle', 'year': 'voyage',
-            'time': 'chronometer', 'clock': 'timepiece', 'watch': 'pocket piece',
-            
-            # Weather and nature
-            'sun': 'blazing orb', 'moon': 'night lantern', 'star': 'navigation point',
-            'cloud': 'sky sail', 'rain': 'squall', 'snow': 'white caps',
-            'fire': 'flame', 'ice': 'frozen bilge', 'rock': 'reef', 'sand': 'shore',
-            'tree': 'mast timber', 'flower': 'shore bloom', 'grass': 'land weed'
-        }
-        
-        self.verb_endings = {
-            'ing': "in'", 'ed': "ed"  # Transform -ing endings
-        }
-        
-        # Expanded pirate interjections and exclamations
-        self.pirate_interjections = [
-            'Arrr!', 'Avast!', 'Shiver me timbers!', 'Yo ho ho!',
-            'Batten down the hatches!', 'All hands on deck!', 'Ahoy there!',
-            'Blimey!', 'Splice the mainbrace!', 'Dead men tell no tales!',
-            'Fifteen men on a dead man\'s chest!', 'Hoist the colors!',
-            'Weigh anchor!', 'Land ho!', 'By Blackbeard\'s ghost!',
-            'Scuttle me bones!', 'Blast ye!', 'Thunder and tarnation!',
-            'By the powers!', 'Sink me!', 'Heave ho!', 'Avast ye landlubbers!'
-        ]
-        
-        # Expanded pirate endings
-        self.endings = [
-            ' arrr!', ' ye scurvy dog!', ' shiver me timbers!', 
-            ' ahoy matey!', ' yo ho ho!', ' savvy?', ' me hearty!',
-            ' ye landlubber!', ' avast!', ' by thunder!', ' ye scallywag!',
-            ' or I\'ll make ye walk the plank!', ' ye bilge rat!',
-            ' me bucko!', ' ye sea dog!', ' or ye\'ll be feeding the fishes!',
-            ' blimey!', ' splice the mainbrace!', ' batten down the hatches!',
-            ' ye barnacle-bottom!', ' me fine buccaneer!', ' savvy me meaning?',
-            ' or face Davy Jones\' locker!', ' ye salty sea bass!'
-        ]
+    basic_replacements = _PIRATE_BASIC
+    pirate_vocab = _PIRATE_VOCAB
+    verb_endings = _PIRATE_VERB_ENDINGS
+    pirate_interjections = _PIRATE_INTERJECTIONS
+    endings = _PIRATE_ENDINGS
+    _replace_basic_words = staticmethod(_PIRATE_REPLACER)
     
     def transform(self, text: str) -> str:
-        structure = analyze_text_structure(text)
+        doc = parse_text(text, entities=self.uses_entities, sentences=False)
         
-        if structure['has_spacy']:
-            return self._advanced_transform(structure)
+        if doc is not None:
+            return self._advanced_transform(doc)
         else:
             return self._basic_transform(text)
     
@@ -505,245 +814,249 @@ class AdvancedPirateTransformer(AdvancedTransformer):
         """Fallback to basic pirate transformation."""
         return self._basic_transform(text)
     
-    def _advanced_transform(self, structure: Dict) -> str:
+    def _advanced_transform(self, doc) -> str:
         """Use linguistic analysis for context-aware pirate transformation."""
-        doc = structure['doc']
         transformed_tokens = []
         
         for token in doc:
             word = token.text
-            lemma = token.lemma_.lower()
+            lemma = _lower(token.lemma_)
             pos = token.pos_
             
+            # One table probe per token: pronouns use the basic table, nouns and verbs the vocab
+            if pos == 'PRON':
+                replacement = self.basic_replacements.get(lemma)
+            elif pos == 'NOUN' or pos == 'VERB':
+                replacement = self.pirate_vocab.get(lemma)
+            else:
+                replacement = None
+            
             # Transform based on part of speech and context
-            if pos == 'PRON' and lemma in self.basic_replacements:
-                transformed_tokens.append(self._apply_case(self.basic_replacements[lemma], word))
-                
-            elif pos in ['NOUN', 'VERB'] and lemma in self.pirate_vocab:
-                transformed_tokens.append(self._apply_case(self.pirate_vocab[lemma], word))
+            if replacement is not None:
+                new_word = self._apply_case(replacement, word)
                 
             elif pos == 'VERB' and word.endswith('ing'):
                 # Transform -ing verbs to -in'
-                transformed_tokens.append(word[:-3] + "in'")
+                new_word = word[:-3] + "in'"
                 
             elif token.ent_type_ == 'PERSON':
                 # Add pirate titles to people
                 if random.random() < 0.3:
-                    titles = ['Captain', 'Admiral', 'Commodore', 'First Mate']
-                    transformed_tokens.append(f"{random.choice(titles)} {word}")
+                    new_word = f"{_pick(_PIRATE_TITLES)} {word}"
                 else:
-                    transformed_tokens.append(word)
+                    new_word = word
                     
             else:
-                transformed_tokens.append(word)
+                new_word = word
             
-            # Add space after token unless it's punctuation
-            if not token.is_punct and token.i < len(doc) - 1:
-                transformed_tokens.append(' ')
+            # Keep the token's original trailing whitespace
+            transformed_tokens.append(new_word + token.whitespace_)
         
         result = ''.join(transformed_tokens)
         
         # Occasionally add pirate interjections
         if random.random() < 0.2:
-            result = f"{random.choice(self.pirate_interjections)} {result}"
+            result = f"{_pick(self.pirate_interjections)} {result}"
         
-        if not any(result.endswith(punct) for punct in '.!?'):
-            result += random.choice(self.endings)
+        if not result.endswith(_SENTENCE_END):
+            result += _pick(self.endings)
         
         return result
     
     def _basic_transform(self, text: str) -> str:
         """Fallback transformation without spaCy."""
-        # Basic word replacements
-        for old, new in {**self.basic_replacements, **self.pirate_vocab}.items():
-            text = re.sub(r'\b' + re.escape(old) + r'\b', new, text, flags=re.IGNORECASE)
+        # Basic word replacements (case-preserving)
+        text = self._replace_basic_words(text)
         
         # Transform -ing endings
         text = re.sub(r'\b(\w+)ing\b', r"\1in'", text)
         
-        if not any(text.endswith(punct) for punct in '.!?'):
-            text += random.choice(self.endings)
+        if not text.endswith(_SENTENCE_END):
+            text += _pick(self.endings)
         
         return text
-    
-    def _apply_case(self, replacement: str, original: str) -> str:
-        """Apply the case pattern of original word to replacement."""
-        if original.isupper():
-            return replacement.upper()
-        elif original.istitle():
-            return replacement.title()
-        else:
-            return replacement
+
+# Massively expanded corporate vocabulary
+_CORPORATE_PHRASES = MappingProxyType({
+    # Original verbs
+    'think': 'ideate', 'use': 'leverage', 'help': 'facilitate',
+    'do': 'execute', 'make': 'generate', 'work': 'collaborate',
+    'talk': 'interface', 'meet': 'sync up', 'plan': 'strategize',
+    'fix': 'optimize', 'change': 'pivot', 'start': 'kick off',
+
+    # Expanded action verbs
+    'improve': 'enhance', 'increase': 'scale up', 'decrease': 'right-size',
+    'finish': 'deliver', 'begin': 'initiate', 'end': 'sunset',
+    'create': 'architect', 'build': 'operationalize', 'design': 'blueprint',
+    'test': 'validate', 'check': 'audit', 'review': 'assess',
+    'update': 'refresh', 'upgrade': 'modernize', 'replace': 'migrate',
+    'remove': 'deprecate', 'add': 'onboard', 'include': 'incorporate',
+    'exclude': 'decouple', 'combine': 'consolidate', 'separate': 'decouple',
+    'organize': 'streamline', 'manage': 'orchestrate', 'control': 'govern',
+    'lead': 'champion', 'follow': 'align with', 'support': 'enable',
+    'decide': 'determine', 'choose': 'prioritize', 'agree': 'align',
+    'disagree': 'pushback on', 'refuse': 'decline to proceed',
+    'accept': 'green-light', 'reject': 'table', 'delay': 'defer',
+
+    # Communication verbs
+    'say': 'communicate', 'tell': 'inform', 'ask': 'inquire',
+    'explain': 'clarify', 'describe': 'outline', 'show': 'demonstrate',
+    'prove': 'validate', 'argue': 'advocate for', 'discuss': 'workshop',
+    'debate': 'socialize', 'negotiate': 'align on terms',
+    'present': 'share out', 'report': 'provide visibility',
+    'announce': 'cascade', 'warn': 'flag', 'complain': 'escalate concerns',
+
+    # Mental/cognitive verbs
+    'understand': 'internalize', 'learn': 'upskill', 'remember': 'retain',
+    'forget': 'lose context', 'know': 'have visibility into',
+    'believe': 'buy into', 'doubt': 'have concerns around',
+    'hope': 'anticipate', 'expect': 'forecast', 'predict': 'model',
+    'worry': 'identify risks', 'fear': 'see challenges with',
+
+    # Simple adjectives to corporate speak
+    'good': 'optimal', 'bad': 'suboptimal', 'big': 'enterprise-scale',
+    'small': 'granular', 'fast': 'agile', 'slow': 'deliberate',
+    'easy': 'turnkey', 'hard': 'complex', 'simple': 'streamlined',
+    'difficult': 'challenging', 'important': 'mission-critical',
+    'urgent': 'high-priority', 'new': 'innovative', 'old': 'legacy',
+    'broken': 'degraded', 'working': 'operational', 'ready': 'production-ready',
+
+    # Common nouns
+    'problem': 'pain point', 'solution': 'deliverable', 'idea': 'initiative',
+    'goal': 'objective', 'result': 'outcome', 'effect': 'impact',
+    'reason': 'driver', 'way': 'approach', 'method': 'methodology',
+    'process': 'workflow', 'step': 'milestone', 'part': 'component',
+    'piece': 'element', 'thing': 'deliverable', 'stuff': 'assets',
+    'issue': 'blocker', 'mistake': 'learnings', 'error': 'gap',
+    'failure': 'learning opportunity', 'success': 'win',
+    'opportunity': 'value proposition', 'challenge': 'headwind',
+    'risk': 'exposure', 'benefit': 'value-add', 'cost': 'investment',
+    'price': 'cost structure', 'value': 'ROI', 'profit': 'margin'
+})
+
+# Massively expanded buzzwords and phrases
+_CORPORATE_BUZZWORDS = (
+    # Classic buzzwords
+    'synergy', 'paradigm shift', 'low-hanging fruit', 'circle back',
+    'deep dive', 'touch base', 'move the needle', 'scalable solution',
+    'disruptive innovation', 'actionable insights', 'best practices',
+
+    # Strategic buzzwords
+    'value proposition', 'competitive advantage', 'market penetration',
+    'customer-centric', 'data-driven', 'results-oriented', 'goal-oriented',
+    'performance-driven', 'innovation-focused', 'agile methodology',
+    'digital transformation', 'omnichannel approach', 'holistic view',
+    'end-to-end solution', 'turnkey implementation', 'seamless integration',
+
+    # Process buzzwords
+    'streamlined workflow', 'optimized pipeline', 'efficient throughput',
+    'lean operations', 'continuous improvement', 'iterative process',
+    'scalable framework', 'robust architecture', 'flexible infrastructure',
+    'sustainable growth', 'organic development', 'strategic alignment',
+
+    # Team/people buzzwords
+    'cross-functional collaboration', 'stakeholder engagement', 'team synergy',
+    'cultural transformation', 'change management', 'talent acquisition',
+    'skill development', 'capacity building', 'resource optimization',
+    'human capital', 'intellectual property', 'knowledge transfer',
+
+    # Technology buzzwords
+    'cloud-first strategy', 'AI-powered solution', 'machine learning insights',
+    'predictive analytics', 'real-time monitoring', 'automated workflows',
+    'intelligent automation', 'digital ecosystem', 'platform integration',
+    'API-driven architecture', 'microservices approach', 'DevOps culture',
+
+    # Business buzzwords
+    'revenue optimization', 'cost efficiency', 'profit maximization',
+    'market leadership', 'customer satisfaction', 'brand loyalty',
+    'stakeholder value', 'shareholder returns', 'sustainable practices',
+    'corporate responsibility', 'ethical framework', 'compliance adherence'
+)
+
+# Expanded corporate prefixes and conversation starters
+_CORPORATE_PREFIXES = (
+    'As per our previous discussion,',
+    'Moving forward,',
+    'To circle back on this,',
+    'From a strategic perspective,',
+    'In terms of deliverables,',
+    'At the end of the day,',
+    'From a high-level view,',
+    'To be completely transparent,',
+    'In the spirit of continuous improvement,',
+    'Leveraging our core competencies,',
+    'To optimize our value proposition,',
+    'With respect to our key stakeholders,',
+    'Aligning with our strategic objectives,',
+    'To ensure seamless integration,',
+    'From an operational standpoint,',
+    'In pursuit of operational excellence,',
+    'To maximize stakeholder value,',
+    'Considering our competitive landscape,',
+    'To enhance our market position,',
+    'With a customer-centric approach,',
+    'To drive meaningful results,',
+    'In terms of scalable solutions,',
+    'To leverage synergistic opportunities,',
+    'From a data-driven perspective,'
+)
+
+# Expanded corporate endings and conversation closers
+_CORPORATE_ENDINGS = (
+    ' Let\'s take this offline.',
+    ' I\'ll ping you with an update.',
+    ' Let\'s schedule a follow-up.',
+    ' This aligns with our core values.',
+    ' Let\'s put a pin in this.',
+    ' We should circle back on this.',
+    ' I\'ll loop you in on next steps.',
+    ' Let\'s touch base early next week.',
+    ' This should move the needle.',
+    ' We can optimize this going forward.',
+    ' Let\'s leverage this opportunity.',
+    ' This is a real game-changer.',
+    ' We need to think outside the box.',
+    ' Let\'s drill down on the details.',
+    ' This requires a paradigm shift.',
+    ' We should streamline this process.',
+    ' Let\'s ideate some solutions.',
+    ' This will scale our impact.',
+    ' We need to pivot our approach.',
+    ' Let\'s operationalize this strategy.',
+    ' This delivers real value-add.',
+    ' We should socialize this concept.',
+    ' Let\'s align on the deliverables.',
+    ' This enhances our competitive advantage.',
+    ' We need to right-size our expectations.',
+    ' Let\'s table this for now.',
+    ' This requires stakeholder buy-in.',
+    ' We should green-light this initiative.',
+    ' Let\'s workshop this further.',
+    ' This needs executive visibility.'
+)
+
+# Lemmas softened to 'should ideally' in _advanced_transform
+_CORPORATE_HEDGED_LEMMAS = frozenset(['will', 'must', 'need'])
+
+# Single-pass word replacer for _basic_transform, shared by every instance
+_CORPORATE_REPLACER = _compile_word_replacer(_CORPORATE_PHRASES)
 
 class AdvancedCorporateTransformer(AdvancedTransformer):
     """Sophisticated corporate speak transformation."""
     
-    def __init__(self):
-        super().__init__()
-        # Massively expanded corporate vocabulary
-        self.corporate_phrases = {
-            # Original verbs
-            'think': 'ideate', 'use': 'leverage', 'help': 'facilitate',
-            'do': 'execute', 'make': 'generate', 'work': 'collaborate',
-            'talk': 'interface', 'meet': 'sync up', 'plan': 'strategize',
-            'fix': 'optimize', 'change': 'pivot', 'start': 'kick off',
-            
-            # Expanded action verbs
-            'improve': 'enhance', 'increase': 'scale up', 'decrease': 'right-size',
-            'finish': 'deliver', 'begin': 'initiate', 'end': 'sunset',
-            'create': 'architect', 'build': 'operationalize', 'design': 'blueprint',
-            'test': 'validate', 'check': 'audit', 'review': 'assess',
-            'update': 'refresh', 'upgrade': 'modernize', 'replace': 'migrate',
-            'remove': 'deprecate', 'add': 'onboard', 'include': 'incorporate',
-            'exclude': 'decouple', 'combine': 'consolidate', 'separate': 'decouple',
-            'organize': 'streamline', 'manage': 'orchestrate', 'control': 'govern',
-            'lead': 'champion', 'follow': 'align with', 'support': 'enable',
-            'decide': 'determine', 'choose': 'prioritize', 'agree': 'align',
-            'disagree': 'pushback on', 'refuse': 'decline to proceed',
-            'accept': 'green-light', 'reject': 'table', 'delay': 'defer',
-            
-            # Communication verbs
-            'say': 'communicate', 'tell': 'inform', 'ask': 'inquire',
-            'explain': 'clarify', 'describe': 'outline', 'show': 'demonstrate',
-            'prove': 'validate', 'argue': 'advocate for', 'discuss': 'workshop',
-            'debate': 'socialize', 'negotiate': 'align on terms',
-            'present': 'share out', 'report': 'provide visibility',
-            'announce': 'cascade', 'warn': 'flag', 'complain': 'escalate concerns',
-            
-            # Mental/cognitive verbs
-            'understand': 'internalize', 'learn': 'upskill', 'remember': 'retain',
-            'forget': 'lose context', 'know': 'have visibility into',
-            'believe': 'buy into', 'doubt': 'have concerns around',
-            'hope': 'anticipate', 'expect': 'forecast', 'predict': 'model',
-            'worry': 'identify risks', 'fear': 'see challenges with',
-            
-            # Simple adjectives to corporate speak
-            'good': 'optimal', 'bad': 'suboptimal', 'big': 'enterprise-scale',
-            'small': 'granular', 'fast': 'agile', 'slow': 'deliberate',
-            'easy': 'turnkey', 'hard': 'complex', 'simple': 'streamlined',
-            'difficult': 'challenging', 'important': 'mission-critical',
-            'urgent': 'high-priority', 'new': 'innovative', 'old': 'legacy',
-            'broken': 'degraded', 'working': 'operational', 'ready': 'production-ready',
-            
-            # Common nouns
-            'problem': 'pain point', 'solution': 'deliverable', 'idea': 'initiative',
-            'goal': 'objective', 'result': 'outcome', 'effect': 'impact',
-            'reason': 'driver', 'way': 'approach', 'method': 'methodology',
-            'process': 'workflow', 'step': 'milestone', 'part': 'component',
-            'piece': 'element', 'thing': 'deliverable', 'stuff': 'assets',
-            'issue': 'blocker', 'mistake': 'learnings', 'error': 'gap',
-            'failure': 'learning opportunity', 'success': 'win',
-            'opportunity': 'value proposition', 'challenge': 'headwind',
-            'risk': 'exposure', 'benefit': 'value-add', 'cost': 'investment',
-            'price': 'cost structure', 'value': 'ROI', 'profit': 'margin'
-        }
-        
-        # Massively expanded buzzwords and phrases
-        self.buzzwords = [
-            # Classic buzzwords
-            'synergy', 'paradigm shift', 'low-hanging fruit', 'circle back',
-            'deep dive', 'touch base', 'move the needle', 'scalable solution',
-            'disruptive innovation', 'actionable insights', 'best practices',
-            
-            # Strategic buzzwords
-            'value proposition', 'competitive advantage', 'market penetration',
-            'customer-centric', 'data-driven', 'results-oriented', 'goal-oriented',
-            'performance-driven', 'innovation-focused', 'agile methodology',
-            'digital transformation', 'omnichannel approach', 'holistic view',
-            'end-to-end solution', 'turnkey implementation', 'seamless integration',
-            
-            # Process buzzwords
-            'streamlined workflow', 'optimized pipeline', 'efficient throughput',
-            'lean operations', 'continuous improvement', 'iterative process',
-            'scalable framework', 'robust architecture', 'flexible infrastructure',
-            'sustainable growth', 'organic development', 'strategic alignment',
-            
-            # Team/people buzzwords
-            'cross-functional collaboration', 'stakeholder engagement', 'team synergy',
-            'cultural transformation', 'change management', 'talent acquisition',
-            'skill development', 'capacity building', 'resource optimization',
-            'human capital', 'intellectual property', 'knowledge transfer',
-            
-            # Technology buzzwords
-            'cloud-first strategy', 'AI-powered solution', 'machine learning insights',
-            'predictive analytics', 'real-time monitoring', 'automated workflows',
-            'intelligent automation', 'digital ecosystem', 'platform integration',
-            'API-driven architecture', 'microservices approach', 'DevOps culture',
-            
-            # Business buzzwords
-            'revenue optimization', 'cost efficiency', 'profit maximization',
-            'market leadership', 'customer satisfaction', 'brand loyalty',
-            'stakeholder value', 'shareholder returns', 'sustainable practices',
-            'corporate responsibility', 'ethical framework', 'compliance adherence'
-        ]
-        
-        # Expanded corporate prefixes and conversation starters
-        self.prefixes = [
-            'As per our previous discussion,',
-            'Moving forward,',
-            'To circle back on this,',
-            'From a strategic perspective,',
-            'In terms of deliverables,',
-            'At the end of the day,',
-            'From a high-level view,',
-            'To be completely transparent,',
-            'In the spirit of continuous improvement,',
-            'Leveraging our core competencies,',
-            'To optimize our value proposition,',
-            'With respect to our key stakeholders,',
-            'Aligning with our strategic objectives,',
-            'To ensure seamless integration,',
-            'From an operational standpoint,',
-            'In pursuit of operational excellence,',
-            'To maximize stakeholder value,',
-            'Considering our competitive landscape,',
-            'To enhance our market position,',
-            'With a customer-centric approach,',
-            'To drive meaningful results,',
-            'In terms of scalable solutions,',
-            'To leverage synergistic opportunities,',
-            'From a data-driven perspective,'
-        ]
-        
-        # Expanded corporate endings and conversation closers
-        self.endings = [
-            ' Let\'s take this offline.',
-            ' I\'ll ping you with an update.',
-            ' Let\'s schedule a follow-up.',
-            ' This aligns with our core values.',
-            ' Let\'s put a pin in this.',
-            ' We should circle back on this.',
-            ' I\'ll loop you in on next steps.',
-            ' Let\'s touch base early next week.',
-            ' This should move the needle.',
-            ' We can optimize this going forward.',
-            ' Let\'s leverage this opportunity.',
-            ' This is a real game-changer.',
-            ' We need to think outside the box.',
-            ' Let\'s drill down on the details.',
-            ' This requires a paradigm shift.',
-            ' We should streamline this process.',
-            ' Let\'s ideate some solutions.',
-            ' This will scale our impact.',
-            ' We need to pivot our approach.',
-            ' Let\'s operationalize this strategy.',
-            ' This delivers real value-add.',
-            ' We should socialize this concept.',
-            ' Let\'s align on the deliverables.',
-            ' This enhances our competitive advantage.',
-            ' We need to right-size our expectations.',
-            ' Let\'s table this for now.',
-            ' This requires stakeholder buy-in.',
-            ' We should green-light this initiative.',
-            ' Let\'s workshop this further.',
-            ' This needs executive visibility.'
-        ]
+    uses_entities = False
+    
+    corporate_phrases = _CORPORATE_PHRASES
+    buzzwords = _CORPORATE_BUZZWORDS
+    prefixes = _CORPORATE_PREFIXES
+    endings = _CORPORATE_ENDINGS
+    _replace_basic_words = staticmethod(_CORPORATE_REPLACER)
     
     def transform(self, text: str) -> str:
-        structure = analyze_text_structure(text)
+        doc = parse_text(text, entities=self.uses_entities, sentences=False)
         
-        if structure['has_spacy']:
-            return self._advanced_transform(structure)
+        if doc is not None:
+            return self._advanced_transform(doc)
         else:
             return self._basic_transform(text)
     
@@ -751,46 +1064,61 @@ class AdvancedCorporateTransformer(AdvancedTransformer):
         """Fallback to basic corporate transformation."""
         return self._basic_transform(text)
     
-    def _advanced_transform(self, structure: Dict) -> str:
-        """Use NLP analysis for sophisticated corporate transformation."""
-        doc = structure['doc']
+    def _advanced_transform(self, doc) -> str:
+        """Use NLP analysis for sophisticated corporate transformation.
+        
+        Reads only token text, whitespace, POS and lemma: doc is parsed without NER or
+        sentence boundaries, so ent_type_, dep_ and doc.sents must not be relied on here.
+        """
         transformed_tokens = []
+        # Bind per-token lookups to locals once rather than on every iteration
+        append = transformed_tokens.append
+        corporate_phrases = self.corporate_phrases
+        buzzwords = self.buzzwords
+        apply_case = self._apply_case
         
         # Add corporate prefix occasionally
         if random.random() < 0.4:
-            result_prefix = f"{random.choice(self.prefixes)} "
+            result_prefix = f"{_pick(self.prefixes)} "
         else:
             result_prefix = ""
         
-        for token in doc:
+        # Read every token's POS and lemma in one bulk call rather than per-token attribute access
+        POS, LEMMA, NOUN, VERB = _spacy_symbols()
+        strings = doc.vocab.strings
+        
+        # One batched draw gives every token its buzzword roll
+        rolls = _rng.random(len(doc)).tolist()
+        
+        for token, (pos, lemma_id), roll in zip(doc, doc.to_array([POS, LEMMA]).tolist(), rolls):
             word = token.text
-            lemma = token.lemma_.lower()
-            pos = token.pos_
+            lemma = _lower(strings[lemma_id])
+            
+            replacement = corporate_phrases.get(lemma) if pos == VERB else None
             
             # Transform verbs to corporate speak
-            if pos == 'VERB' and lemma in self.corporate_phrases:
-                transformed_tokens.append(self._apply_case(self.corporate_phrases[lemma], word))
+            if replacement is not None:
+                new_word = apply_case(replacement, word)
                 
             # Inject buzzwords occasionally for nouns
-            elif pos == 'NOUN' and random.random() < 0.15:
-                buzzword = random.choice(self.buzzwords)
-                transformed_tokens.append(f"{buzzword}-driven {word}")
+            elif pos == NOUN and roll < 0.15:
+                buzzword = _pick(buzzwords)
+                new_word = f"{buzzword}-driven {word}"
                 
             # Make statements more passive/indirect
-            elif lemma in ['will', 'must', 'need']:
-                transformed_tokens.append('should ideally')
+            elif lemma in _CORPORATE_HEDGED_LEMMAS:
+                new_word = 'should ideally'
                 
             else:
-                transformed_tokens.append(word)
+                new_word = word
             
-            # Add space after token unless it's punctuation
-            if not token.is_punct and token.i < len(doc) - 1:
-                transformed_tokens.append(' ')
+            # Keep the token's original trailing whitespace
+            append(new_word + token.whitespace_)
         
         result = result_prefix + ''.join(transformed_tokens)
         
-        if not any(result.endswith(punct) for punct in '.!?'):
-            result += random.choice(self.endings)
+        if not result.endswith(_SENTENCE_END):
+            result += _pick(self.endings)
         
         return result
     
@@ -798,61 +1126,73 @@ class AdvancedCorporateTransformer(AdvancedTransformer):
         """Fallback transformation without spaCy."""
         # Add prefix
         if random.random() < 0.4:
-            text = f"{random.choice(self.prefixes)} {text.lower()}"
+            text = f"{_pick(self.prefixes)} {text.lower()}"
         
-        # Basic replacements
-        for old, new in self.corporate_phrases.items():
-            text = re.sub(r'\b' + re.escape(old) + r'\b', new, text, flags=re.IGNORECASE)
+        # Basic replacements (case-preserving)
+        text = self._replace_basic_words(text)
         
-        if not any(text.endswith(punct) for punct in '.!?'):
-            text += random.choice(self.endings)
+        if not text.endswith(_SENTENCE_END):
+            text += _pick(self.endings)
         
         return text
+
+@functools.lru_cache(maxsize=None)
+def _shared_transformer(transformer_class: type) -> AdvancedTransformer:
+    """One instance per transformer class, used to fill the shared cache."""
+    return transformer_class()
+
+@functools.lru_cache(maxsize=4096)
+def _cached_transform(transformer_class: type, text: str) -> str:
+    """Process-wide LRU cache behind AdvancedTransformer.cached_transform.
     
-    def _apply_case(self, replacement: str, original: str) -> str:
-        """Apply the case pattern of original word to replacement."""
-        if original.isupper():
-            return replacement.upper()
-        elif original.istitle():
-            return replacement.title()
-        else:
-            return replacement
+    Keyed by class rather than instance, since get_advanced_transformer hands out
+    a new instance per message and a per-instance cache never got a second hit.
+    """
+    return _shared_transformer(transformer_class)._validated_transform(text)
+
+# Effects served by advanced_cone_effects rather than the transformers in this module
+_CONE_EFFECT_NAMES = frozenset(['slayspeak', 'valley', 'brainrot', 'genz', 'scrum', 'linkedin', 'emoji', 
+                                'crisis', 'existential', 'canadian', 'polite', 'vsauce', 'conspiracy', 
+                                'bri', 'british', 'oni', 'censor'])
+
+# Existing transformers
+_TRANSFORMERS = {
+    'shakespeare': AdvancedShakespeareTransformer,
+    'bardify': AdvancedShakespeareTransformer,
+    'pirate': AdvancedPirateTransformer,
+    'corporate': AdvancedCorporateTransformer,
+}
+
+@functools.lru_cache(maxsize=None)
+def _cone_effect_transformer(effect_name: str):
+    """Wrapper mimicking the AdvancedTransformer interface for an advanced cone effect, built once per effect."""
+    try:
+        # Import and use the new advanced cone effects
+        from advanced_cone_effects import apply_cone_effect
+        
+        # Create a wrapper class that mimics the AdvancedTransformer interface
+        class NewAdvancedTransformer:
+            def transform(self, text: str) -> str:
+                return apply_cone_effect(text, effect_name)
+        
+        return NewAdvancedTransformer()
+    except ImportError as e:
+        print(f"Could not import advanced cone effects: {e}")
+        return None
+    except Exception as e:
+        print(f"Error creating advanced cone effect transformer: {e}")
+        return None
 
 # Factory function to get transformers
 def get_advanced_transformer(effect_name: str) -> Optional[AdvancedTransformer]:
-    """Get an advanced transformer by name."""
-    # Check if it's one of the new advanced cone effects
-    new_advanced_effects = ['slayspeak', 'valley', 'brainrot', 'genz', 'scrum', 'linkedin', 'emoji', 
-                           'crisis', 'existential', 'canadian', 'polite', 'vsauce', 'conspiracy', 
-                           'bri', 'british', 'oni', 'censor']
+    """Get an advanced transformer by name (one shared, stateless instance per effect)."""
+    effect_name = effect_name.lower()
     
-    if effect_name.lower() in new_advanced_effects:
-        try:
-            # Import and use the new advanced cone effects
-            from advanced_cone_effects import apply_cone_effect
-            
-            # Create a wrapper class that mimics the AdvancedTransformer interface
-            class NewAdvancedTransformer:
-                def transform(self, text: str) -> str:
-                    return apply_cone_effect(text, effect_name)
-            
-            return NewAdvancedTransformer()
-        except ImportError as e:
-            print(f"Could not import advanced cone effects: {e}")
-            return None
-        except Exception as e:
-            print(f"Error creating advanced cone effect transformer: {e}")
-            return None
-    
-    # Existing transformers
-    transformers = {
-        'shakespeare': AdvancedShakespeareTransformer,
-        'bardify': AdvancedShakespeareTransformer,
-        'pirate': AdvancedPirateTransformer,
-        'corporate': AdvancedCorporateTransformer,
-    }
+    # Check if it's one of the new advanced cone effects
+    if effect_name in _CONE_EFFECT_NAMES:
+        return _cone_effect_transformer(effect_name)
     
-    transformer_class = transformers.get(effect_name.lower())
+    transformer_class = _TRANSFORMERS.get(effect_name)
     if transformer_class:
-        return transformer_class()
-    return None 
\ No newline at end of file
+        return _shared_transformer(transformer_class)
+    return None 
@@ -60,7 +60,7 @@ class CustomBot(commands.Bot):
         if message.attachments:
             for attachment in message.attachments:
                 # Check if attachment is an image
-                if any(attachment.filename.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp']):
+                if attachment.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp')):
                     image_urls.append(attachment.url)
                     print(f"Found image attachment: {attachment.filename} -> {attachment.url}")
         
@@ -52,12 +52,34 @@ def install_nltk_data():
         logger.warning(f"Error installing NLTK data: {e}")
         return False
 
+def build_synonym_table():
+    """Precompute the WordNet synonym table so get_synonyms needn't load NLTK at runtime."""
+    try:
+        logger.info("Building synonym table...")
+        import gzip
+        import pickle
+        from nltk.corpus import wordnet as wn
+        from advanced_transformations import SYNONYM_TABLE_PATH, build_synonym_table as build
+        
+        table = build(wn)
+        with gzip.open(SYNONYM_TABLE_PATH, 'wb') as f:
+            pickle.dump(table, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        logger.info(f"✅ Synonym table built ({len(table)} words)")
+        return True
+        
+    except Exception as e:
+        logger.warning(f"Error building synonym table: {e}")
+        return False
+
 def main():
     """Install all required models and data."""
     logger.info("🚀 Installing NLP models for advanced cone transformations...")
     
     spacy_success = install_spacy_model()
     nltk_success = install_nltk_data()
+    if nltk_success:
+        build_synonym_table()
     
     if spacy_success and nltk_success:
         logger.info("🎉 All models installed successfully!")
@@ -0,0 +1,34 @@
+"""
+Whole-word span selection for literal keys found with pyahocorasick
+Shared by the cone effect replacement tables and the advanced transformers' word replacers
+"""
+
+from typing import Any, List, Tuple
+
+def pad(text: str) -> str:
+    """Surround text with non-word characters so is_whole_word never needs a bounds test"""
+    return f' {text} '
+
+def is_whole_word(padded: str, start: int, end: int) -> bool:
+    """Whether text[start:end] has a \\b on both sides, given padded = pad(text)
+
+    An automaton finds substrings, so its hits need the boundary a regex \\b would give.
+    """
+    before = padded[start]
+    after = padded[end + 1]
+    return not (before.isalnum() or before == '_' or after.isalnum() or after == '_')
+
+def leftmost_spans(candidates: List[Tuple[int, Any, int, Any]]) -> List[Tuple[int, int, Any]]:
+    """Non-overlapping (start, end, payload) spans from (start, priority, end, payload) candidates
+
+    As in a regex alternation scan, the leftmost candidate wins and the lowest
+    priority breaks ties at the same start. Sorts candidates in place.
+    """
+    candidates.sort()
+    spans = []
+    last = 0
+    for start, _, end, payload in candidates:
+        if start >= last:
+            spans.append((start, end, payload))
+            last = end
+    return spans
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The bot's modules import each other as top-level modules, as when run from bot/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bot'))
@@ -0,0 +1,30 @@
+import pytest
+
+from advanced_cone_effects import _ONI_GATES, _ONI_REDACTIONS, _ONI_SHARED_WORDS, _ReplacementTable, _censor_match
+
+
+@pytest.fixture(params=['automaton', 'regex'])
+def yes_table(request):
+    table = _ReplacementTable({r'\b(?:yes|yeah)\b': ('absolutely',)})
+    if request.param == 'regex':
+        # Same path as when pyahocorasick isn't installed
+        table.automaton = None
+    return table
+
+
+def test_replaces_whole_words(yes_table):
+    assert yes_table.apply('Yes, yeah!') == 'absolutely, absolutely!'
+
+
+@pytest.mark.parametrize('text', ['éyes', 'yesé', 'naïveyes', 'Ωyeah'])
+def test_non_ascii_neighbour_is_not_a_word_boundary(yes_table, text):
+    assert yes_table.apply(text) == text
+
+
+@pytest.mark.parametrize('word', ['money', 'Money'])
+def test_oni_word_under_two_targets_gets_both_gates(word):
+    first, second = _ONI_SHARED_WORDS['money']
+    active = [False] * len(_ONI_GATES)
+    assert _censor_match(active, word, first, 0.0) == word
+    active[second] = True
+    assert _censor_match(active, word, first, 0.0) == _ONI_REDACTIONS[0]
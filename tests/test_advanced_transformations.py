@@ -0,0 +1,75 @@
+import gzip
+import os
+import pickle
+
+import pytest
+
+import advanced_transformations
+from advanced_transformations import (
+    _PIRATE_BASIC, _PIRATE_VOCAB, _SHAKESPEARE_PRONOUNS, _SHAKESPEARE_VERBS, _SHAKESPEARE_VOCAB,
+    AdvancedShakespeareTransformer, _compile_word_replacer)
+
+
+@pytest.fixture
+def transformed(monkeypatch):
+    calls = []
+    
+    def fake_cached_transform(cls, text):
+        calls.append(text)
+        return f'<{text}>'
+    
+    monkeypatch.setattr(advanced_transformations, '_cached_transform', fake_cached_transform)
+    return calls
+
+
+@pytest.mark.parametrize('text', ['Привет, как дела?', 'Γειά σου κόσμε', 'こんにちは', 'Ça va'])
+def test_non_latin_text_is_transformed(transformed, text):
+    assert AdvancedShakespeareTransformer().cached_transform(text) == f'<{text}>'
+    assert transformed == [text]
+
+
+@pytest.mark.parametrize('text', ['', '  ', '123 456', '<@1234> <#5678>', '<:wave:1234>', 'https://example.com', '___'])
+def test_text_without_letters_is_returned_unchanged(transformed, text):
+    assert AdvancedShakespeareTransformer().cached_transform(text) == text
+    assert transformed == []
+
+
+@pytest.fixture(params=['automaton', 'regex'])
+def compile_replacer(request, monkeypatch):
+    if request.param == 'regex':
+        # Same path as when pyahocorasick isn't installed
+        monkeypatch.setattr(advanced_transformations, 'ahocorasick', None)
+    return _compile_word_replacer
+
+
+@pytest.mark.parametrize('text, expected', [
+    # 'you' comes before "you're" in the table, so it wins as it did key by key
+    ("you're late", "thou're late"),
+    ("You're sure YOU'VE seen it", "Thou're sure THOU'VE seen it"),
+    ('your gold is yours', 'thy gold ist thine'),
+])
+def test_shakespeare_words_follow_table_order(compile_replacer, text, expected):
+    replace = compile_replacer({**_SHAKESPEARE_PRONOUNS, **_SHAKESPEARE_VERBS, **_SHAKESPEARE_VOCAB})
+    assert replace(text) == expected
+
+
+def test_pirate_replacement_chains_are_resolved(compile_replacer):
+    replace = compile_replacer({**_PIRATE_BASIC, **_PIRATE_VOCAB})
+    assert replace('the gold') == "th' booty"
+
+
+def test_synonym_table_built_after_a_failed_load_is_picked_up(tmp_path, monkeypatch):
+    path = tmp_path / 'synonyms.pkl.gz'
+    monkeypatch.setattr(advanced_transformations, 'SYNONYM_TABLE_PATH', str(path))
+    monkeypatch.setattr(advanced_transformations, 'synonym_table', None)
+    monkeypatch.setattr(advanced_transformations, '_synonym_table_failed_mtime', -1)
+    assert advanced_transformations.get_synonym_table() is None
+    
+    path.write_bytes(b'not a table')
+    assert advanced_transformations.get_synonym_table() is None
+    
+    with gzip.open(path, 'wb') as f:
+        pickle.dump({'dog': ('hound',)}, f)
+    # Make sure the rewrite is seen even on filesystems with coarse timestamps
+    os.utime(path, ns=(0, 0))
+    assert advanced_transformations.get_synonym_table() == {'dog': ('hound',)}